@@ -0,0 +1,109 @@
+"""
+Buffered LoginAttempt logging.
+
+Login attempts are appended to a cache-backed log (a sequence counter
+plus one key per entry) and written to the database in batches by the
+flush_login_attempts task, so logins never wait on an INSERT. Without a
+shared cache the task would never see the log, so rows are inserted
+directly instead.
+"""
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.core.utils import has_shared_cache
+
+SEQ_KEY = 'login_attempts:seq'
+FLUSHED_KEY = 'login_attempts:flushed'
+MARK_KEY = 'login_attempts:mark'
+LOCK_KEY = 'login_attempts:flush_lock'
+ENTRY_TTL = 24 * 60 * 60
+
+
+def _entry_key(seq):
+    return f'login_attempts:entry:{seq}'
+
+
+def record_login_attempt(email, ip_address, user_agent='', success=False):
+    """Queue a login attempt for the next batch insert."""
+    if not has_shared_cache():
+        from .models import LoginAttempt
+        LoginAttempt.objects.create(
+            email=email[:254],
+            ip_address=ip_address,
+            user_agent=user_agent[:1000],
+            success=success,
+        )
+        return
+
+    if not cache.add(SEQ_KEY, 1, timeout=None):
+        try:
+            seq = cache.incr(SEQ_KEY)
+        except ValueError:
+            cache.add(SEQ_KEY, 1, timeout=None)
+            seq = cache.incr(SEQ_KEY)
+    else:
+        seq = 1
+
+    cache.set(_entry_key(seq), {
+        'email': email[:254],
+        'ip_address': ip_address,
+        'user_agent': user_agent[:1000],
+        'success': success,
+        'created_at': timezone.now(),
+    }, timeout=ENTRY_TTL)
+
+
+def flush_login_attempts(batch_size=500):
+    """
+    Write buffered login attempts to the database.
+
+    Each run flushes up to the sequence number seen by the previous run,
+    so every entry has had a full interval to be stored after its number
+    was taken. Rows keep the time of the attempt as created_at.
+
+    Returns:
+        int: Number of LoginAttempt rows created
+    """
+    from .models import LoginAttempt
+
+    if not cache.add(LOCK_KEY, 1, timeout=5 * 60):
+        return 0
+
+    try:
+        current = cache.get(SEQ_KEY) or 0
+        target = min(cache.get(MARK_KEY) or 0, current)
+        flushed = cache.get(FLUSHED_KEY) or 0
+        if flushed > current:
+            # The sequence was reset (cache cleared); start over
+            flushed = 0
+
+        created = 0
+        while flushed < target:
+            upto = min(flushed + batch_size, target)
+            keys = [_entry_key(seq) for seq in range(flushed + 1, upto + 1)]
+            entries = cache.get_many(keys)
+
+            batch = [entries[key] for key in keys if key in entries]
+            attempts = LoginAttempt.objects.bulk_create([
+                LoginAttempt(
+                    email=entry['email'],
+                    ip_address=entry['ip_address'],
+                    user_agent=entry['user_agent'],
+                    success=entry['success'],
+                )
+                for entry in batch
+            ])
+            # created_at is auto_now_add, so bulk_create stamps the flush time
+            for attempt, entry in zip(attempts, batch):
+                attempt.created_at = entry.get('created_at', attempt.created_at)
+            LoginAttempt.objects.bulk_update(attempts, ['created_at'])
+            created += len(attempts)
+
+            cache.delete_many(keys)
+            cache.set(FLUSHED_KEY, upto, timeout=None)
+            flushed = upto
+
+        cache.set(MARK_KEY, current, timeout=None)
+        return created
+    finally:
+        cache.delete(LOCK_KEY)
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from django.db import migrations
+from django.utils import timezone
+
+
+def purge_stale_unverified(apps, schema_editor):
+    # verify_phone_view used to create a row on every GET; clear that
+    # backlog once, with the same 24-hour rule as cleanup_expired_otp.
+    # Newer rows may be OTPs still being entered, so they are kept.
+    PhoneVerification = apps.get_model('accounts', 'PhoneVerification')
+    PhoneVerification.objects.filter(
+        created_at__lt=timezone.now() - timedelta(hours=24)
+    ).exclude(status='verified').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(purge_stale_unverified, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_purge_pending_phone_verifications'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='phoneverification',
+            name='otp_code',
+            field=models.CharField(max_length=64, verbose_name='ລະຫັດ OTP'),
+        ),
+    ]
@@ -104,7 +104,8 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
 
 class PhoneVerification(TimeStampedModel):
     """
-    Model for phone number OTP verification.
+    Phone number OTP verification (see apps.accounts.otp).
+    otp_code holds a keyed hash of the code, not the code itself.
     """
 
     class Status(models.TextChoices):
@@ -133,7 +134,7 @@ class PhoneVerification(TimeStampedModel):
         verbose_name='ເບີໂທ (normalized)'
     )
     otp_code = models.CharField(
-        max_length=6,
+        max_length=64,
         verbose_name='ລະຫັດ OTP'
     )
     otp_expires_at = models.DateTimeField(
@@ -167,44 +168,6 @@ class PhoneVerification(TimeStampedModel):
     def is_expired(self):
         return timezone.now() > self.otp_expires_at
 
-    def verify(self, otp_code):
-        """
-        Verify the OTP code.
-        Returns: (success, error_message)
-        """
-        from django.conf import settings
-
-        max_attempts = settings.LAO_JOBS.get('OTP_MAX_ATTEMPTS', 3)
-
-        # Check if expired
-        if self.is_expired:
-            self.status = self.Status.EXPIRED
-            self.save(update_fields=['status', 'updated_at'])
-            return False, 'ລະຫັດ OTP ໝົດອາຍຸ'
-
-        # Check attempts
-        if self.attempts >= max_attempts:
-            return False, 'ເກີນຈຳນວນຄັ້ງທີ່ອະນຸຍາດ'
-
-        # Increment attempts
-        self.attempts += 1
-        self.save(update_fields=['attempts', 'updated_at'])
-
-        # Verify code
-        if self.otp_code != otp_code:
-            return False, 'ລະຫັດ OTP ບໍ່ຖືກຕ້ອງ'
-
-        # Mark as verified
-        self.status = self.Status.VERIFIED
-        self.verified_at = timezone.now()
-        self.save(update_fields=['status', 'verified_at', 'updated_at'])
-
-        # Update user
-        self.user.is_phone_verified = True
-        self.user.save(update_fields=['is_phone_verified', 'updated_at'])
-
-        return True, None
-
 
 class LoginAttempt(TimeStampedModel):
     """
@@ -0,0 +1,271 @@
+"""
+Phone verification OTPs.
+
+With a shared cache (e.g. Redis) a pending OTP lives only in the cache:
+a keyed hash of the code plus expiry, stored with the OTP's TTL, and an
+attempt counter raised with atomic incr. Only the verified outcome is
+written to the database, as a VERIFIED PhoneVerification row.
+
+Without one (LocMemCache is per process) the cache can't be the source
+of truth, so a pending OTP is a PENDING PhoneVerification row instead,
+with attempts counted by a conditional UPDATE. The cache then only
+fronts `get_pending`, and cleanup_expired_otp purges unverified rows.
+
+Either way concurrent guesses can't exceed OTP_MAX_ATTEMPTS.
+"""
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+from apps.core.utils import generate_otp, has_shared_cache
+
+RESEND_COOLDOWN_SECONDS = 60
+
+EXPIRED_MESSAGE = 'ລະຫັດ OTP ໝົດອາຍຸ'
+TOO_MANY_ATTEMPTS_MESSAGE = 'ເກີນຈຳນວນຄັ້ງທີ່ອະນຸຍາດ'
+INVALID_MESSAGE = 'ລະຫັດ OTP ບໍ່ຖືກຕ້ອງ'
+
+
+def _otp_key(user_id):
+    return f'otp:{user_id}'
+
+
+def _cooldown_key(user_id):
+    return f'otp:{user_id}:cooldown'
+
+
+def _attempts_key(otp_id):
+    return f'otp:{otp_id}:attempts'
+
+
+def _used_key(otp_id):
+    return f'otp:{otp_id}:used'
+
+
+def _hash_code(user_id, code):
+    return salted_hmac('apps.accounts.otp', f'{user_id}:{code}').hexdigest()
+
+
+def _ttl_seconds(expires_at):
+    return (expires_at - timezone.now()).total_seconds()
+
+
+def _public(pending):
+    return {key: value for key, value in pending.items() if key != 'code_hash'}
+
+
+def _pending(verification):
+    return {
+        'id': str(verification.id),
+        'phone_number': verification.phone_number,
+        'phone_normalized': verification.phone_normalized,
+        'expires_at': verification.otp_expires_at,
+    }
+
+
+def _cache_pending(user_id, pending):
+    ttl = _ttl_seconds(pending['expires_at'])
+    if ttl > 0:
+        cache.set(_otp_key(user_id), pending, timeout=ttl)
+
+
+def _pending_verification(user):
+    from .models import PhoneVerification
+
+    return PhoneVerification.objects.filter(
+        user=user,
+        status=PhoneVerification.Status.PENDING,
+    ).order_by('-created_at').first()
+
+
+def get_pending(user):
+    """
+    Return the user's pending OTP or None.
+
+    Returns:
+        dict: id, phone_number, phone_normalized, expires_at (datetime)
+    """
+    pending = cache.get(_otp_key(user.pk))
+    if pending is None:
+        if has_shared_cache():
+            return None
+        verification = _pending_verification(user)
+        if not verification or verification.is_expired:
+            return None
+        pending = _pending(verification)
+        _cache_pending(user.pk, pending)
+
+    if pending['expires_at'] <= timezone.now():
+        return None
+    return _public(pending)
+
+
+def issue(user, phone_number, phone_normalized=None):
+    """
+    Create a new OTP for the user, replacing any pending one.
+
+    Returns:
+        tuple: (otp_code, pending) - pending as returned by get_pending
+    """
+    ttl = settings.LAO_JOBS.get('OTP_EXPIRY_MINUTES', 5) * 60
+    code = generate_otp()
+    expires_at = timezone.now() + timedelta(seconds=ttl)
+
+    if has_shared_cache():
+        pending = {
+            'id': uuid.uuid4().hex,
+            'phone_number': phone_number,
+            'phone_normalized': phone_normalized or phone_number,
+            'expires_at': expires_at,
+            'code_hash': _hash_code(user.pk, code),
+        }
+        cache.set(_attempts_key(pending['id']), 0, timeout=ttl)
+    else:
+        pending = _pending(_create_verification(
+            user, phone_number, phone_normalized, _hash_code(user.pk, code), expires_at
+        ))
+
+    _cache_pending(user.pk, pending)
+    cache.add(_cooldown_key(user.pk), 1, timeout=RESEND_COOLDOWN_SECONDS)
+
+    return code, _public(pending)
+
+
+def _create_verification(user, phone_number, phone_normalized, code_hash, expires_at):
+    from .models import PhoneVerification
+
+    with transaction.atomic():
+        PhoneVerification.objects.filter(
+            user=user,
+            status=PhoneVerification.Status.PENDING,
+        ).update(status=PhoneVerification.Status.EXPIRED, updated_at=timezone.now())
+
+        return PhoneVerification.objects.create(
+            user=user,
+            phone_number=phone_number,
+            phone_normalized=phone_normalized or phone_number,
+            otp_code=code_hash,
+            otp_expires_at=expires_at,
+        )
+
+
+def can_resend(user):
+    """False while the one-per-minute resend cooldown runs."""
+    from .models import PhoneVerification
+
+    if not cache.add(_cooldown_key(user.pk), 1, timeout=RESEND_COOLDOWN_SECONDS):
+        return False
+    if has_shared_cache():
+        return True
+    # Per-process cache: another worker may have issued the last OTP
+    return not PhoneVerification.objects.filter(
+        user=user,
+        created_at__gte=timezone.now() - timedelta(seconds=RESEND_COOLDOWN_SECONDS)
+    ).exists()
+
+
+def verify(user, otp_code):
+    """
+    Verify an OTP code.
+    Returns: (success, error_message)
+    """
+    if has_shared_cache():
+        success, error = _verify_cached(user, otp_code)
+    else:
+        success, error = _verify_row(user, otp_code)
+
+    if not success:
+        return False, error
+
+    cache.delete(_otp_key(user.pk))
+
+    user.is_phone_verified = True
+    user.save(update_fields=['is_phone_verified', 'updated_at'])
+
+    return True, None
+
+
+def _count_attempt(otp_id, ttl):
+    key = _attempts_key(otp_id)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Counter evicted before the OTP; start over rather than lock out
+        cache.add(key, 0, timeout=ttl)
+        return cache.incr(key)
+
+
+def _verify_cached(user, otp_code):
+    from .models import PhoneVerification
+
+    max_attempts = settings.LAO_JOBS.get('OTP_MAX_ATTEMPTS', 3)
+
+    pending = cache.get(_otp_key(user.pk))
+    ttl = _ttl_seconds(pending['expires_at']) if pending else 0
+    if ttl <= 0:
+        return False, EXPIRED_MESSAGE
+
+    attempts = _count_attempt(pending['id'], ttl)
+    if attempts > max_attempts:
+        return False, TOO_MANY_ATTEMPTS_MESSAGE
+
+    if not constant_time_compare(pending['code_hash'], _hash_code(user.pk, otp_code)):
+        return False, INVALID_MESSAGE
+
+    if not cache.add(_used_key(pending['id']), 1, timeout=ttl):
+        # Verified by a concurrent request
+        return False, EXPIRED_MESSAGE
+
+    now = timezone.now()
+    PhoneVerification.objects.create(
+        user=user,
+        phone_number=pending['phone_number'],
+        phone_normalized=pending['phone_normalized'],
+        otp_code=pending['code_hash'],
+        otp_expires_at=pending['expires_at'],
+        attempts=attempts,
+        status=PhoneVerification.Status.VERIFIED,
+        verified_at=now,
+    )
+    return True, None
+
+
+def _verify_row(user, otp_code):
+    from .models import PhoneVerification
+
+    max_attempts = settings.LAO_JOBS.get('OTP_MAX_ATTEMPTS', 3)
+    Status = PhoneVerification.Status
+
+    verification = _pending_verification(user)
+    if not verification or verification.is_expired:
+        return False, EXPIRED_MESSAGE
+
+    counted = PhoneVerification.objects.filter(
+        pk=verification.pk,
+        status=Status.PENDING,
+        attempts__lt=max_attempts,
+    ).update(attempts=F('attempts') + 1, updated_at=timezone.now())
+
+    if not counted:
+        return False, TOO_MANY_ATTEMPTS_MESSAGE
+
+    if not constant_time_compare(verification.otp_code, _hash_code(user.pk, otp_code)):
+        return False, INVALID_MESSAGE
+
+    now = timezone.now()
+    verified = PhoneVerification.objects.filter(
+        pk=verification.pk,
+        status=Status.PENDING,
+    ).update(status=Status.VERIFIED, verified_at=now, updated_at=now)
+
+    if not verified:
+        # Replaced by a resend in the meantime
+        return False, EXPIRED_MESSAGE
+
+    return True, None
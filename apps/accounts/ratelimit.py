@@ -0,0 +1,180 @@
+"""
+Login rate limiting in the cache backend.
+
+Failures are counted per IP and per email in sliding windows (the
+weighted sum of the current and previous fixed windows). Crossing a
+limit locks that IP or email out, and each repeat lockout within a day
+doubles the lockout time up to LOCKOUT_MAX_SECONDS.
+
+`check()` reads everything it needs with one get_many, so an allowed
+login costs a single cache round trip.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+IP = 'ip'
+EMAIL = 'email'
+
+DEFAULTS = {
+    'WINDOW_SECONDS': 15 * 60,
+    'IP_LIMIT': 20,
+    'EMAIL_LIMIT': 5,
+    'LOCKOUT_BASE_SECONDS': 60,
+    'LOCKOUT_MAX_SECONDS': 60 * 60,
+    'LOCKOUT_LEVEL_TTL_SECONDS': 24 * 60 * 60,
+}
+
+
+def get_config():
+    """Return login rate limit settings merged over the defaults."""
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'LOGIN_RATE_LIMIT', {}))
+    return config
+
+
+def _identities(ip, email):
+    identities = []
+    if ip:
+        identities.append((IP, ip))
+    if email:
+        identities.append((EMAIL, email.strip().lower()))
+    return identities
+
+
+def _window_key(scope, identity, window):
+    return f'login:fail:{scope}:{identity}:{window}'
+
+
+def _lock_key(scope, identity):
+    return f'login:lock:{scope}:{identity}'
+
+
+def _level_key(scope, identity):
+    return f'login:level:{scope}:{identity}'
+
+
+def _sliding_count(values, scope, identity, now, window_seconds):
+    window = int(now // window_seconds)
+    elapsed = (now % window_seconds) / window_seconds
+    current = values.get(_window_key(scope, identity, window), 0)
+    previous = values.get(_window_key(scope, identity, window - 1), 0)
+    return current + previous * (1 - elapsed)
+
+
+def check(ip, email):
+    """
+    Check whether a login attempt may proceed.
+
+    Returns:
+        int: Seconds until retry is allowed (0 if the attempt may proceed)
+    """
+    config = get_config()
+    window_seconds = config['WINDOW_SECONDS']
+    now = time.time()
+    window = int(now // window_seconds)
+
+    identities = _identities(ip, email)
+    keys = []
+    for scope, identity in identities:
+        keys += [
+            _lock_key(scope, identity),
+            _window_key(scope, identity, window),
+            _window_key(scope, identity, window - 1),
+        ]
+    values = cache.get_many(keys)
+
+    retry_after = 0
+    for scope, identity in identities:
+        locked_until = values.get(_lock_key(scope, identity))
+        if locked_until and locked_until > now:
+            retry_after = max(retry_after, int(locked_until - now) + 1)
+            continue
+
+        limit = config['IP_LIMIT'] if scope == IP else config['EMAIL_LIMIT']
+        if _sliding_count(values, scope, identity, now, window_seconds) >= limit:
+            retry_after = max(retry_after, int(window_seconds - now % window_seconds) + 1)
+
+    return retry_after
+
+
+def register_failure(ip, email):
+    """
+    Count a failed login and lock out any IP/email over its limit.
+
+    Returns:
+        int: Lockout seconds started by this failure (0 if none)
+    """
+    config = get_config()
+    window_seconds = config['WINDOW_SECONDS']
+    now = time.time()
+    window = int(now // window_seconds)
+
+    identities = _identities(ip, email)
+    for scope, identity in identities:
+        key = _window_key(scope, identity, window)
+        if not cache.add(key, 1, timeout=window_seconds * 2):
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.add(key, 1, timeout=window_seconds * 2)
+
+    values = cache.get_many([
+        _window_key(scope, identity, w)
+        for scope, identity in identities
+        for w in (window, window - 1)
+    ])
+
+    lockout = 0
+    for scope, identity in identities:
+        limit = config['IP_LIMIT'] if scope == IP else config['EMAIL_LIMIT']
+        if _sliding_count(values, scope, identity, now, window_seconds) >= limit:
+            lockout = max(lockout, _lock(scope, identity, now, config))
+    return lockout
+
+
+def _lock(scope, identity, now, config):
+    """Start a progressive lockout; returns its length in seconds."""
+    level_key = _level_key(scope, identity)
+    if not cache.add(level_key, 1, timeout=config['LOCKOUT_LEVEL_TTL_SECONDS']):
+        try:
+            level = cache.incr(level_key)
+        except ValueError:
+            level = 1
+            cache.add(level_key, 1, timeout=config['LOCKOUT_LEVEL_TTL_SECONDS'])
+    else:
+        level = 1
+
+    seconds = min(
+        config['LOCKOUT_BASE_SECONDS'] * 2 ** (level - 1),
+        config['LOCKOUT_MAX_SECONDS']
+    )
+    cache.set(_lock_key(scope, identity), now + seconds, timeout=int(seconds) + 1)
+
+    # Start the next window clean so the lockout, not the counter, governs
+    window_seconds = config['WINDOW_SECONDS']
+    window = int(now // window_seconds)
+    cache.delete_many([
+        _window_key(scope, identity, window),
+        _window_key(scope, identity, window - 1),
+    ])
+    return seconds
+
+
+def reset(email):
+    """Clear failure counters and lockout level for an email after a successful login."""
+    config = get_config()
+    window_seconds = config['WINDOW_SECONDS']
+    window = int(time.time() // window_seconds)
+
+    identities = _identities(None, email)
+    cache.delete_many([
+        key
+        for scope, identity in identities
+        for key in (
+            _window_key(scope, identity, window),
+            _window_key(scope, identity, window - 1),
+            _level_key(scope, identity),
+        )
+    ])
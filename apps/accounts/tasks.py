@@ -7,32 +7,50 @@ from datetime import timedelta
 
 
 @shared_task
-def cleanup_expired_otp():
+def cleanup_expired_otp(batch_size=1000, time_budget=300):
     """
-    Clean up expired OTP records older than 24 hours.
+    Clean up unverified OTP records older than 24 hours.
     """
+    from apps.core.batching import delete_in_batches
     from .models import PhoneVerification
 
     cutoff = timezone.now() - timedelta(hours=24)
 
-    deleted, _ = PhoneVerification.objects.filter(
-        created_at__lt=cutoff
-    ).delete()
+    result = delete_in_batches(
+        PhoneVerification.objects.filter(created_at__lt=cutoff).exclude(
+            status=PhoneVerification.Status.VERIFIED
+        ),
+        batch_size=batch_size,
+        time_budget=time_budget,
+    )
 
-    return {'deleted': deleted}
+    return {'deleted': result['deleted'], 'complete': result['complete']}
 
 
 @shared_task
-def cleanup_login_attempts():
+def flush_login_attempts(batch_size=500):
+    """
+    Write login attempts buffered in the cache to the database.
+    """
+    from .attempts import flush_login_attempts as flush
+
+    return {'created': flush(batch_size=batch_size)}
+
+
+@shared_task
+def cleanup_login_attempts(batch_size=1000, time_budget=300):
     """
     Clean up login attempts older than 30 days.
     """
+    from apps.core.batching import delete_in_batches
     from .models import LoginAttempt
 
     cutoff = timezone.now() - timedelta(days=30)
 
-    deleted, _ = LoginAttempt.objects.filter(
-        created_at__lt=cutoff
-    ).delete()
+    result = delete_in_batches(
+        LoginAttempt.objects.filter(created_at__lt=cutoff),
+        batch_size=batch_size,
+        time_budget=time_budget,
+    )
 
-    return {'deleted': deleted}
+    return {'deleted': result['deleted'], 'complete': result['complete']}
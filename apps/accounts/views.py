@@ -6,22 +6,23 @@ from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.decorators.http import require_http_methods
-from django.utils import timezone
-from datetime import timedelta
 
 from .forms import LoginForm, EmployerRegistrationForm, OTPVerificationForm, ChangePasswordForm
-from .models import User, PhoneVerification, LoginAttempt
-from apps.core.utils import generate_otp
-
-
-def get_client_ip(request):
-    """Get client IP address from request."""
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
-    else:
-        ip = request.META.get('REMOTE_ADDR')
-    return ip
+from . import otp, ratelimit
+from .attempts import record_login_attempt
+from .models import User
+from apps.core import notifications
+from apps.core.utils import get_client_ip
+
+
+def send_otp(otp_code, pending):
+    """Queue the OTP code to the user's phone via WhatsApp."""
+    notifications.send(
+        notifications.WHATSAPP,
+        pending['phone_normalized'],
+        f'ລະຫັດ OTP ຂອງທ່ານແມ່ນ {otp_code}',
+        dedup_key=f'otp:{pending["id"]}',
+    )
 
 
 @require_http_methods(['GET', 'POST'])
@@ -35,8 +36,18 @@ def login_view(request):
     if request.method == 'POST':
         form = LoginForm(request, data=request.POST)
 
-        # Record login attempt
         ip = get_client_ip(request)
+        email = request.POST.get('email', '')
+        user_agent = request.META.get('HTTP_USER_AGENT', '')
+
+        # Throttle before touching the password hasher or the database
+        retry_after = ratelimit.check(ip, email)
+        if retry_after:
+            minutes = (retry_after + 59) // 60
+            messages.error(request, f'ພະຍາຍາມເຂົ້າສູ່ລະບົບຫຼາຍເກີນໄປ. ກະລຸນາລອງໃໝ່ໃນ {minutes} ນາທີ')
+            response = render(request, 'accounts/login.html', {'form': LoginForm(request)}, status=429)
+            response['Retry-After'] = str(retry_after)
+            return response
 
         if form.is_valid():
             user = form.get_user()
@@ -50,12 +61,8 @@ def login_view(request):
             user.save(update_fields=['last_login_ip'])
 
             # Log successful attempt
-            LoginAttempt.objects.create(
-                email=user.email,
-                ip_address=ip,
-                user_agent=request.META.get('HTTP_USER_AGENT', ''),
-                success=True
-            )
+            ratelimit.reset(email)
+            record_login_attempt(user.email, ip, user_agent, success=True)
 
             login(request, user)
 
@@ -69,12 +76,8 @@ def login_view(request):
             return redirect('employer:dashboard')
         else:
             # Log failed attempt
-            LoginAttempt.objects.create(
-                email=request.POST.get('email', ''),
-                ip_address=ip,
-                user_agent=request.META.get('HTTP_USER_AGENT', ''),
-                success=False
-            )
+            ratelimit.register_failure(ip, email)
+            record_login_attempt(email, ip, user_agent, success=False)
     else:
         form = LoginForm(request)
 
@@ -152,33 +155,19 @@ def verify_phone_view(request):
 
     phone_number = company.phone_number
 
-    # Get or create verification
-    verification = PhoneVerification.objects.filter(
-        user=user,
-        status=PhoneVerification.Status.PENDING
-    ).first()
-
-    # Create new verification if needed
-    if not verification or verification.is_expired:
-        otp_expiry_minutes = settings.LAO_JOBS.get('OTP_EXPIRY_MINUTES', 5)
-
-        verification = PhoneVerification.objects.create(
-            user=user,
-            phone_number=phone_number,
-            phone_normalized=phone_number,
-            otp_code=generate_otp(),
-            otp_expires_at=timezone.now() + timedelta(minutes=otp_expiry_minutes)
-        )
-
-        # TODO: Send OTP via SMS/WhatsApp
-        # For now, display in development
+    # Issue a new OTP only when none is pending (kept in the cache)
+    pending = otp.get_pending(user)
+    if not pending:
+        otp_code, pending = otp.issue(user, phone_number)
+        send_otp(otp_code, pending)
+
         if settings.DEBUG:
-            messages.info(request, f'[DEV] OTP Code: {verification.otp_code}')
+            messages.info(request, f'[DEV] OTP Code: {otp_code}')
 
     if request.method == 'POST':
         form = OTPVerificationForm(request.POST)
         if form.is_valid():
-            success, error = verification.verify(form.cleaned_data['otp_code'])
+            success, error = otp.verify(user, form.cleaned_data['otp_code'])
             if success:
                 messages.success(request, 'ຢືນຢັນເບີໂທສຳເລັດ!')
                 return redirect('billing:choose_plan')
@@ -190,7 +179,7 @@ def verify_phone_view(request):
     return render(request, 'accounts/verify_phone.html', {
         'form': form,
         'phone_number': phone_number,
-        'expires_at': verification.otp_expires_at,
+        'expires_at': pending['expires_at'],
     })
 
 
@@ -200,7 +189,6 @@ def resend_otp_view(request):
     """
     Resend OTP code.
     """
-    from django.conf import settings
     from django.http import JsonResponse
 
     user = request.user
@@ -210,31 +198,17 @@ def resend_otp_view(request):
         return JsonResponse({'error': 'ບໍ່ພົບຂໍ້ມູນບໍລິສັດ'}, status=400)
 
     # Check rate limit (1 per minute)
-    recent = PhoneVerification.objects.filter(
-        user=user,
-        created_at__gte=timezone.now() - timedelta(minutes=1)
-    ).exists()
-
-    if recent:
+    if not otp.can_resend(user):
         return JsonResponse({'error': 'ກະລຸນາລໍຖ້າ 1 ນາທີ'}, status=429)
 
-    # Create new verification
-    otp_expiry_minutes = settings.LAO_JOBS.get('OTP_EXPIRY_MINUTES', 5)
-
-    verification = PhoneVerification.objects.create(
-        user=user,
-        phone_number=company.phone_number,
-        phone_normalized=company.phone_number,
-        otp_code=generate_otp(),
-        otp_expires_at=timezone.now() + timedelta(minutes=otp_expiry_minutes)
-    )
-
-    # TODO: Send OTP via SMS/WhatsApp
+    # Replace the pending OTP
+    otp_code, pending = otp.issue(user, company.phone_number)
+    send_otp(otp_code, pending)
 
     return JsonResponse({
         'success': True,
         'message': 'ສົ່ງລະຫັດ OTP ໃໝ່ແລ້ວ',
-        'expires_at': verification.otp_expires_at.isoformat(),
+        'expires_at': pending['expires_at'].isoformat(),
     })
 
 
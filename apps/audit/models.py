@@ -114,17 +114,7 @@ def log_action(
     Returns:
         AuditLog: The created audit log entry
     """
-    ip_address = None
-    user_agent = ''
-
-    if request:
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip_address = x_forwarded_for.split(',')[0]
-        else:
-            ip_address = request.META.get('REMOTE_ADDR')
-
-        user_agent = request.META.get('HTTP_USER_AGENT', '')
+    ip_address, user_agent = _request_meta(request)
 
     return AuditLog.objects.create(
         actor_type=actor_type,
@@ -136,3 +126,46 @@ def log_action(
         ip_address=ip_address,
         user_agent=user_agent,
     )
+
+
+def log_actions(
+    action,
+    target_type,
+    target_ids,
+    actor_type='system',
+    actor_id='',
+    details=None,
+    request=None
+):
+    """
+    Create one audit log entry per target in a single bulk insert.
+    Same arguments as log_action, with a list of target IDs.
+
+    Returns:
+        list: The created audit log entries
+    """
+    ip_address, user_agent = _request_meta(request)
+
+    return AuditLog.objects.bulk_create([
+        AuditLog(
+            actor_type=actor_type,
+            actor_id=str(actor_id) if actor_id else '',
+            action=action,
+            target_type=target_type,
+            target_id=str(target_id),
+            details=details or {},
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
+        for target_id in target_ids
+    ], batch_size=500)
+
+
+def _request_meta(request):
+    """Get (ip_address, user_agent) from a request, if any."""
+    if not request:
+        return None, ''
+
+    from apps.core.utils import get_client_ip
+
+    return get_client_ip(request), request.META.get('HTTP_USER_AGENT', '')
@@ -2,7 +2,7 @@
 Billing admin configuration.
 """
 from django.contrib import admin
-from .models import SubscriptionPlan, Subscription, Invoice, Payment
+from .models import SubscriptionPlan, Subscription, Invoice, Payment, WebhookEvent
 
 
 @admin.register(SubscriptionPlan)
@@ -24,6 +24,15 @@ class SubscriptionAdmin(admin.ModelAdmin):
         return obj.days_remaining
     days_remaining.short_description = 'ມື້ທີ່ເຫຼືອ'
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        obj.company.refresh_entitlement()
+
+    def delete_model(self, request, obj):
+        company = obj.company
+        super().delete_model(request, obj)
+        company.refresh_entitlement()
+
 
 @admin.register(Invoice)
 class InvoiceAdmin(admin.ModelAdmin):
@@ -54,3 +63,11 @@ class PaymentAdmin(admin.ModelAdmin):
     search_fields = ['invoice__invoice_number', 'gateway_transaction_id']
     readonly_fields = ['idempotency_key', 'created_at', 'updated_at']
     raw_id_fields = ['invoice']
+
+
+@admin.register(WebhookEvent)
+class WebhookEventAdmin(admin.ModelAdmin):
+    list_display = ['event_id', 'gateway', 'event_type', 'status', 'attempts', 'created_at', 'processed_at']
+    list_filter = ['status', 'gateway', 'event_type']
+    search_fields = ['event_id']
+    readonly_fields = ['created_at', 'updated_at', 'processed_at']
@@ -0,0 +1,78 @@
+"""
+Replay stored payment webhook events.
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = 'Re-queue failed (or stuck) payment webhook events for processing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--id',
+            action='append',
+            dest='ids',
+            help='Replay a specific event (may be repeated)',
+        )
+        parser.add_argument(
+            '--status',
+            default='failed',
+            choices=['failed', 'received'],
+            help='Replay events with this status (default: failed)',
+        )
+        parser.add_argument(
+            '--older-than',
+            type=int,
+            default=0,
+            help='Only replay events received more than N minutes ago',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=500,
+            help='Maximum number of events to replay',
+        )
+        parser.add_argument(
+            '--sync',
+            action='store_true',
+            help='Process events in this process instead of queueing them',
+        )
+
+    def handle(self, *args, **options):
+        from apps.billing.models import WebhookEvent
+        from apps.billing.services import apply_webhook_event
+        from apps.core.utils import enqueue
+
+        events = WebhookEvent.objects.all()
+
+        if options['ids']:
+            events = events.filter(id__in=options['ids'])
+        else:
+            events = events.filter(status=options['status'])
+
+        if options['older_than']:
+            cutoff = timezone.now() - timedelta(minutes=options['older_than'])
+            events = events.filter(created_at__lt=cutoff)
+
+        event_ids = list(
+            events.order_by('created_at').values_list('id', flat=True)[:options['limit']]
+        )
+
+        # Allow explicitly selected processed/ignored events to run again
+        WebhookEvent.objects.filter(id__in=event_ids).update(
+            status=WebhookEvent.Status.RECEIVED,
+            updated_at=timezone.now(),
+        )
+
+        for event_id in event_ids:
+            if options['sync']:
+                result = apply_webhook_event(str(event_id))
+                self.stdout.write(f'  {event_id}: {result}')
+            else:
+                enqueue('apps.billing.tasks.process_webhook_event', str(event_id),
+                        fallback=apply_webhook_event)
+
+        self.stdout.write(self.style.SUCCESS(f'Replayed {len(event_ids)} webhook events'))
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:36
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billing', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubscriptionReminder',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('days_before', models.PositiveSmallIntegerField(verbose_name='ມື້ກ່ອນໝົດອາຍຸ')),
+                ('sent_on', models.DateField(db_index=True, verbose_name='ວັນທີສົ່ງ')),
+                ('subscription', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='billing.subscription', verbose_name='ສະມາຊິກ')),
+            ],
+            options={
+                'verbose_name': 'ການແຈ້ງເຕືອນໝົດອາຍຸ',
+                'verbose_name_plural': 'ການແຈ້ງເຕືອນໝົດອາຍຸ',
+                'ordering': ['-sent_on'],
+                'unique_together': {('subscription', 'days_before', 'sent_on')},
+            },
+        ),
+    ]
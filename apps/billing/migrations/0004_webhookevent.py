@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:37
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billing', '0003_subscriptionreminder'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookEvent',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='ວັນທີສ້າງ')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='ວັນທີອັບເດດ')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('gateway', models.CharField(choices=[('bcel', 'BCEL One'), ('onepay', 'OnePay'), ('manual', 'Manual')], max_length=50, verbose_name='ຊ່ອງທາງຊຳລະ')),
+                ('event_id', models.CharField(max_length=200, verbose_name='Event ID')),
+                ('event_type', models.CharField(blank=True, max_length=100, verbose_name='Event Type')),
+                ('payload', models.JSONField(default=dict, verbose_name='Payload')),
+                ('status', models.CharField(choices=[('received', 'ໄດ້ຮັບແລ້ວ'), ('processed', 'ດຳເນີນການແລ້ວ'), ('ignored', 'ບໍ່ສົນໃຈ'), ('failed', 'ລົ້ມເຫຼວ')], default='received', max_length=20, verbose_name='ສະຖານະ')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='ຈຳນວນຄັ້ງທີ່ລອງ')),
+                ('last_error', models.TextField(blank=True, verbose_name='ຂໍ້ຜິດພາດລ່າສຸດ')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='ວັນທີດຳເນີນການ')),
+            ],
+            options={
+                'verbose_name': 'Webhook Event',
+                'verbose_name_plural': 'Webhook Events',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='billing_web_status_f0153d_idx')],
+                'unique_together': {('gateway', 'event_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billing', '0004_webhookevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NumberSequence',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='ຊື່')),
+                ('last_value', models.PositiveBigIntegerField(default=0, verbose_name='ຄ່າລ່າສຸດ')),
+            ],
+            options={
+                'verbose_name': 'ລຳດັບເລກ',
+                'verbose_name_plural': 'ລຳດັບເລກ',
+            },
+        ),
+    ]
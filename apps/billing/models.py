@@ -6,7 +6,29 @@ from datetime import timedelta
 from django.db import models
 from django.utils import timezone
 from apps.core.models import TimeStampedModel
-from apps.core.utils import generate_invoice_number, generate_payment_reference
+
+
+class NumberSequence(models.Model):
+    """
+    Counter backing human-readable reference numbers.
+    Workers reserve blocks of values from it (see billing.numbering).
+    """
+    name = models.CharField(
+        max_length=50,
+        primary_key=True,
+        verbose_name='ຊື່'
+    )
+    last_value = models.PositiveBigIntegerField(
+        default=0,
+        verbose_name='ຄ່າລ່າສຸດ'
+    )
+
+    class Meta:
+        verbose_name = 'ລຳດັບເລກ'
+        verbose_name_plural = 'ລຳດັບເລກ'
+
+    def __str__(self):
+        return f'{self.name} - {self.last_value}'
 
 
 class SubscriptionPlan(TimeStampedModel):
@@ -118,6 +140,39 @@ class Subscription(TimeStampedModel):
         return max(0, delta.days)
 
 
+class SubscriptionReminder(models.Model):
+    """
+    Expiry reminder sent for a subscription (one row per reminder window per day).
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+    subscription = models.ForeignKey(
+        Subscription,
+        on_delete=models.CASCADE,
+        related_name='reminders',
+        verbose_name='ສະມາຊິກ'
+    )
+    days_before = models.PositiveSmallIntegerField(
+        verbose_name='ມື້ກ່ອນໝົດອາຍຸ'
+    )
+    sent_on = models.DateField(
+        db_index=True,
+        verbose_name='ວັນທີສົ່ງ'
+    )
+
+    class Meta:
+        verbose_name = 'ການແຈ້ງເຕືອນໝົດອາຍຸ'
+        verbose_name_plural = 'ການແຈ້ງເຕືອນໝົດອາຍຸ'
+        ordering = ['-sent_on']
+        unique_together = ['subscription', 'days_before', 'sent_on']
+
+    def __str__(self):
+        return f'{self.subscription_id} - {self.days_before} - {self.sent_on}'
+
+
 class Invoice(TimeStampedModel):
     """
     Invoice model for payments.
@@ -205,6 +260,8 @@ class Invoice(TimeStampedModel):
         return f'{self.invoice_number} - {self.status}'
 
     def save(self, *args, **kwargs):
+        from .numbering import generate_invoice_number, generate_payment_reference
+
         if not self.invoice_number:
             self.invoice_number = generate_invoice_number()
         if not self.payment_reference:
@@ -284,3 +341,70 @@ class Payment(TimeStampedModel):
 
     def __str__(self):
         return f'{self.invoice.invoice_number} - {self.status}'
+
+
+class WebhookEvent(TimeStampedModel):
+    """
+    Raw payment gateway webhook, stored before processing (inbox pattern).
+    """
+
+    class Status(models.TextChoices):
+        RECEIVED = 'received', 'ໄດ້ຮັບແລ້ວ'
+        PROCESSED = 'processed', 'ດຳເນີນການແລ້ວ'
+        IGNORED = 'ignored', 'ບໍ່ສົນໃຈ'
+        FAILED = 'failed', 'ລົ້ມເຫຼວ'
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+    gateway = models.CharField(
+        max_length=50,
+        choices=Payment.Gateway.choices,
+        verbose_name='ຊ່ອງທາງຊຳລະ'
+    )
+    event_id = models.CharField(
+        max_length=200,
+        verbose_name='Event ID'
+    )
+    event_type = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name='Event Type'
+    )
+    payload = models.JSONField(
+        default=dict,
+        verbose_name='Payload'
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.RECEIVED,
+        verbose_name='ສະຖານະ'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='ຈຳນວນຄັ້ງທີ່ລອງ'
+    )
+    last_error = models.TextField(
+        blank=True,
+        verbose_name='ຂໍ້ຜິດພາດລ່າສຸດ'
+    )
+    processed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='ວັນທີດຳເນີນການ'
+    )
+
+    class Meta:
+        verbose_name = 'Webhook Event'
+        verbose_name_plural = 'Webhook Events'
+        ordering = ['-created_at']
+        unique_together = ['gateway', 'event_id']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f'{self.gateway}:{self.event_id} - {self.status}'
@@ -0,0 +1,150 @@
+"""
+Collision-free reference numbers for invoices and payments.
+
+Each process reserves a block of values from a NumberSequence row with one
+UPDATE and hands them out from memory, so most numbers cost no database
+round trip. Blocks never overlap, so numbers are unique across workers and
+increase monotonically within each worker. Values left in a block when a
+process exits are skipped, which leaves harmless gaps.
+
+Blocks must be committed independently of the transaction numbers are
+generated in (e.g. Invoice.save): if the caller rolled back a block this
+process still hands out values from, another process could reserve the
+same values. So:
+
+- outside a transaction, the block is reserved on the request's own
+  connection, which commits it right away;
+- inside one, it is reserved on a separate per-thread autocommit
+  connection (closed when the request finishes), which also keeps the
+  sequence row from being locked until the caller commits;
+- on SQLite, a second connection could not write while the request's
+  transaction holds the database lock, so a single value is taken on
+  the request's connection instead and never kept for later.
+"""
+import os
+import threading
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils import timezone
+
+from .models import NumberSequence
+
+DEFAULT_BLOCK_SIZE = 20
+
+
+_local = threading.local()
+
+
+def _sequence_connection():
+    """A per-thread connection, separate from the request's, in autocommit."""
+    connection = getattr(_local, 'connection', None)
+    if connection is None:
+        connection = _local.connection = connections.create_connection(DEFAULT_DB_ALIAS)
+    connection.close_if_unusable_or_obsolete()
+    return connection
+
+
+def _close_sequence_connection(**kwargs):
+    connection = getattr(_local, 'connection', None)
+    if connection is not None:
+        _local.connection = None
+        connection.close()
+
+
+request_finished.connect(_close_sequence_connection)
+
+
+def reserve_block(name, size, connection):
+    """
+    Reserve `size` consecutive values of sequence `name` on `connection`.
+
+    Returns:
+        tuple: (first, end) — values first..end-1 belong to the caller
+    """
+    table = connection.ops.quote_name(NumberSequence._meta.db_table)
+    update = (
+        f'UPDATE {table} SET last_value = last_value + %s '
+        f'WHERE name = %s RETURNING last_value'
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(update, [size, name])
+        row = cursor.fetchone()
+        if row is None:
+            cursor.execute(
+                f'INSERT INTO {table} (name, last_value) VALUES (%s, 0) '
+                f'ON CONFLICT (name) DO NOTHING',
+                [name]
+            )
+            cursor.execute(update, [size, name])
+            row = cursor.fetchone()
+
+    last_value = row[0]
+    return last_value - size + 1, last_value + 1
+
+
+class BlockAllocator:
+    """
+    Thread-safe, fork-aware allocator of values from a NumberSequence.
+    """
+
+    def __init__(self, name, block_size=None):
+        self.name = name
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._next = 0
+        self._end = 0
+
+    def next_value(self):
+        with self._lock:
+            # A forked worker must not reuse its parent's block
+            if self._pid != os.getpid():
+                self._reset()
+
+            if self._next >= self._end:
+                block_size = self.block_size or settings.LAO_JOBS.get(
+                    'REFERENCE_BLOCK_SIZE', DEFAULT_BLOCK_SIZE
+                )
+                connection = connections[DEFAULT_DB_ALIAS]
+                if not connection.in_atomic_block:
+                    self._next, self._end = reserve_block(self.name, block_size, connection)
+                elif connection.vendor == 'sqlite':
+                    # Rolled back with the caller, so it must not outlive it
+                    value, _ = reserve_block(self.name, 1, connection)
+                    return value
+                else:
+                    self._next, self._end = reserve_block(
+                        self.name, block_size, _sequence_connection()
+                    )
+
+            value = self._next
+            self._next += 1
+            return value
+
+
+invoice_numbers = BlockAllocator('invoice_number')
+payment_references = BlockAllocator('payment_reference')
+
+
+def generate_invoice_number() -> str:
+    """
+    Generate a unique invoice number.
+    Format: INV-YYYYMM-NNNNNN
+    """
+    date_part = timezone.localtime().strftime('%Y%m')
+    return f'INV-{date_part}-{invoice_numbers.next_value():06d}'
+
+
+def generate_payment_reference() -> str:
+    """
+    Generate a unique payment reference.
+    Format: PAY-YYYYMMDD-NNNNNNNN
+    """
+    date_part = timezone.localtime().strftime('%Y%m%d')
+    return f'PAY-{date_part}-{payment_references.next_value():08d}'
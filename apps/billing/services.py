@@ -1,15 +1,58 @@
 """
 Billing services for payment processing.
 """
+import hashlib
+import hmac
+import time
+
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 
-from .models import Invoice, Payment, Subscription
+from .models import Invoice, Payment, Subscription, WebhookEvent
+
+INVOICE_STATUS_TTL = 60 * 60
+
+
+def invoice_status_cache_key(invoice_id):
+    return f'billing:invoice-status:{invoice_id}'
+
+
+def publish_invoice_status(invoice_id, status):
+    """Announce an invoice status change to `wait_for_invoice_status`."""
+    cache.set(invoice_status_cache_key(invoice_id), status, timeout=INVOICE_STATUS_TTL)
+
+
+def wait_for_invoice_status(invoice_id, status, timeout):
+    """
+    Wait up to `timeout` seconds for an invoice to leave `status`.
+
+    Checks once a second: the published status key when the cache is
+    shared, otherwise the invoice's status column (the payment may be
+    applied by another process).
+
+    Returns:
+        str: The new status, or `status` if it did not change in time
+    """
+    from apps.core.utils import has_shared_cache
+
+    shared = has_shared_cache()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(1)
+        if shared:
+            current = cache.get(invoice_status_cache_key(invoice_id))
+        else:
+            current = Invoice.objects.filter(pk=invoice_id).values_list('status', flat=True).first()
+        if current and current != status:
+            return current
+    return status
 
 
 @transaction.atomic
-def process_payment(payment_reference, gateway_transaction_id, gateway_response):
+def process_payment(payment_reference, gateway_transaction_id, gateway_response, gateway='bcel'):
     """
     Process a payment (idempotent).
 
@@ -17,6 +60,7 @@ def process_payment(payment_reference, gateway_transaction_id, gateway_response)
         payment_reference: The invoice payment reference
         gateway_transaction_id: Transaction ID from payment gateway
         gateway_response: Full response from gateway
+        gateway: Payment gateway code (Payment.Gateway)
 
     Returns:
         dict: Result with status and subscription if successful
@@ -46,7 +90,7 @@ def process_payment(payment_reference, gateway_transaction_id, gateway_response)
             'invoice': invoice,
             'amount': invoice.amount,
             'status': 'completed',
-            'gateway': 'bcel',  # Determine from gateway_response
+            'gateway': gateway,
             'gateway_transaction_id': gateway_transaction_id,
             'gateway_response': gateway_response,
         }
@@ -62,6 +106,9 @@ def process_payment(payment_reference, gateway_transaction_id, gateway_response)
     invoice.transaction_id = gateway_transaction_id
     invoice.save()
 
+    # Wake up payment pages waiting in payment_status_view
+    transaction.on_commit(lambda: publish_invoice_status(invoice.id, invoice.status))
+
     # Activate subscription
     subscription = activate_subscription(invoice)
 
@@ -118,7 +165,7 @@ def activate_subscription(invoice):
         # Extend existing subscription
         existing.expires_at = existing.expires_at + timedelta(days=duration_days)
         existing.save(update_fields=['expires_at', 'updated_at'])
-        return existing
+        subscription = existing
     else:
         # Create new subscription
         now = timezone.now()
@@ -129,7 +176,9 @@ def activate_subscription(invoice):
             starts_at=now,
             expires_at=now + timedelta(days=duration_days)
         )
-        return subscription
+
+    company.refresh_entitlement()
+    return subscription
 
 
 def create_invoice(company, plan):
@@ -178,7 +227,8 @@ def verify_payment_manual(invoice, verified_by):
     result = process_payment(
         invoice.payment_reference,
         f'MANUAL-{timezone.now().strftime("%Y%m%d%H%M%S")}',
-        {'verified_by': str(verified_by.id), 'method': 'manual'}
+        {'verified_by': str(verified_by.id), 'method': 'manual'},
+        gateway=Payment.Gateway.MANUAL,
     )
 
     if result['status'] == 'success':
@@ -193,3 +243,131 @@ def verify_payment_manual(invoice, verified_by):
         )
 
     return result
+
+
+def webhook_secret(gateway):
+    """Return the WEBHOOK_SECRET configured for a gateway ('' if none)."""
+    gateway_settings = getattr(settings, 'PAYMENT_GATEWAY', {}).get(gateway.upper(), {})
+    return gateway_settings.get('WEBHOOK_SECRET', '')
+
+
+def accepts_webhooks(gateway):
+    """
+    Whether webhooks are accepted for a gateway: it must be a payment
+    gateway (not manual verification) with a WEBHOOK_SECRET configured.
+    Unsigned webhooks are only accepted with DEBUG on.
+    """
+    if gateway not in Payment.Gateway.values or gateway == Payment.Gateway.MANUAL:
+        return False
+    return bool(webhook_secret(gateway)) or settings.DEBUG
+
+
+def verify_webhook_signature(gateway, body, signature):
+    """
+    Verify the HMAC-SHA256 signature of a webhook body.
+
+    Gateways without a WEBHOOK_SECRET are rejected unless DEBUG is on.
+
+    Returns:
+        bool: True if the signature is valid
+    """
+    secret = webhook_secret(gateway)
+    if not secret:
+        return settings.DEBUG
+
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature or '')
+
+
+def record_webhook_event(gateway, data):
+    """
+    Store a webhook in the inbox with a single INSERT.
+    Duplicate deliveries of the same event are silently ignored.
+
+    Args:
+        gateway: Payment gateway code
+        data: Parsed webhook payload
+
+    Returns:
+        WebhookEvent: The (unsaved-if-duplicate) event instance
+    """
+    event_type = data.get('event', '')
+    event_id = data.get('event_id') or (
+        f'{event_type}:{data.get("payment_reference", "")}:{data.get("transaction_id", "")}'
+    )
+
+    event = WebhookEvent(
+        gateway=gateway,
+        event_id=event_id[:200],
+        event_type=event_type[:100],
+        payload=data,
+    )
+    WebhookEvent.objects.bulk_create([event], ignore_conflicts=True)
+    return event
+
+
+def apply_webhook_event(event_id):
+    """
+    Apply a stored webhook event once, recording the outcome on the event.
+    Runs in `process_webhook_event`, or inline when Celery is unavailable.
+
+    Args:
+        event_id: The WebhookEvent id
+
+    Returns:
+        dict: {'status': new event status, or 'skipped'}
+    """
+    with transaction.atomic():
+        event = WebhookEvent.objects.select_for_update(skip_locked=True).filter(
+            id=event_id,
+            status__in=[WebhookEvent.Status.RECEIVED, WebhookEvent.Status.FAILED]
+        ).first()
+
+        if not event:
+            # Duplicate delivery, already processed, or locked by another worker
+            return {'status': 'skipped'}
+
+        event.attempts += 1
+
+        try:
+            result = handle_webhook_event(event)
+        except Exception as exc:
+            result = {'status': 'error', 'message': str(exc)}
+
+        if result['status'] == 'error':
+            event.status = WebhookEvent.Status.FAILED
+            event.last_error = result.get('message', '')
+        else:
+            event.status = (
+                WebhookEvent.Status.IGNORED if result['status'] == 'ignored'
+                else WebhookEvent.Status.PROCESSED
+            )
+            event.last_error = ''
+            event.processed_at = timezone.now()
+
+        event.save(update_fields=['status', 'attempts', 'last_error', 'processed_at', 'updated_at'])
+
+    return {'status': str(event.status)}
+
+
+def handle_webhook_event(event):
+    """
+    Apply a stored webhook event.
+
+    Args:
+        event: The WebhookEvent
+
+    Returns:
+        dict: Result with status
+    """
+    data = event.payload
+
+    if event.event_type != 'payment.completed' or not data.get('payment_reference'):
+        return {'status': 'ignored'}
+
+    return process_payment(
+        data['payment_reference'],
+        data.get('transaction_id', ''),
+        data,
+        gateway=event.gateway,
+    )
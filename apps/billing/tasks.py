@@ -23,9 +23,11 @@ def expire_subscriptions():
         ).select_for_update()
 
         count = 0
+        company_ids = set()
         for sub in expired:
             sub.status = 'expired'
             sub.save(update_fields=['status', 'updated_at'])
+            company_ids.add(sub.company_id)
             count += 1
 
             # Create audit log
@@ -37,24 +39,38 @@ def expire_subscriptions():
                 target_id=str(sub.id),
             )
 
+        # Refresh denormalized entitlement for affected companies
+        from apps.companies.models import Company
+        for company in Company.objects.filter(id__in=company_ids):
+            company.refresh_entitlement()
+
     return {'expired': count}
 
 
 @shared_task
-def purge_expired_invoices():
+def purge_expired_invoices(batch_size=500, time_budget=600):
     """
     Purge expired invoices older than 90 days.
     """
+    from apps.core.batching import delete_in_batches
     from .models import Invoice
 
     cutoff = timezone.now() - timedelta(days=90)
 
-    deleted, _ = Invoice.objects.filter(
-        status='expired',
-        created_at__lt=cutoff
-    ).delete()
+    result = delete_in_batches(
+        Invoice.objects.filter(
+            status='expired',
+            created_at__lt=cutoff
+        ),
+        batch_size=batch_size,
+        time_budget=time_budget,
+    )
+
+    return {'purged': result['deleted'], 'complete': result['complete']}
 
-    return {'purged': deleted}
+
+REMINDER_DAYS = [30, 7, 1]
+REMINDER_CHUNK_SIZE = 500
 
 
 @shared_task
@@ -62,29 +78,77 @@ def send_expiry_reminders():
     """
     Send subscription expiry reminders.
     Sends reminders at 30, 7, and 1 day before expiry.
-    """
-    from .models import Subscription
 
-    now = timezone.now()
-    reminder_days = [30, 7, 1]
+    One query covers all reminder windows; recipients are processed in
+    chunks, queued to the notification channel in bulk and recorded with
+    one bulk insert per chunk, so reruns on the same day send nothing.
+    """
+    from datetime import datetime, time
+    from django.db.models import Exists, OuterRef, Q
+    from apps.core import notifications
+    from .models import Subscription, SubscriptionReminder
+
+    today = timezone.localdate()
+
+    def day_start(day):
+        return timezone.make_aware(datetime.combine(day, time.min))
+
+    windows = Q()
+    for days in REMINDER_DAYS:
+        target = today + timedelta(days=days)
+        windows |= Q(
+            expires_at__gte=day_start(target),
+            expires_at__lt=day_start(target + timedelta(days=1))
+        )
+
+    already_sent = SubscriptionReminder.objects.filter(
+        subscription=OuterRef('pk'),
+        sent_on=today
+    )
+
+    subscriptions = Subscription.objects.filter(
+        windows,
+        status='active'
+    ).exclude(
+        Exists(already_sent)
+    ).values_list('id', 'expires_at', 'company__phone_normalized').iterator(
+        chunk_size=REMINDER_CHUNK_SIZE
+    )
+
+    def flush(chunk):
+        messages = []
+        reminders = []
+        for subscription_id, expires_at, phone, days in chunk:
+            messages.append(notifications.build_message(
+                notifications.WHATSAPP,
+                phone,
+                f'ສະມາຊິກ ຫາວຽກລາວ ຂອງທ່ານຈະໝົດອາຍຸໃນອີກ {days} ມື້ '
+                f'({timezone.localtime(expires_at):%d/%m/%Y}). ກະລຸນາຕໍ່ອາຍຸ.',
+                dedup_key=f'expiry-reminder:{subscription_id}:{days}:{today}',
+            ))
+            reminders.append(SubscriptionReminder(
+                subscription_id=subscription_id,
+                days_before=days,
+                sent_on=today,
+            ))
+
+        notifications.send_bulk(messages)
+        SubscriptionReminder.objects.bulk_create(reminders, ignore_conflicts=True)
+        return len(reminders)
 
     total_sent = 0
+    chunk = []
 
-    for days in reminder_days:
-        target_date = now + timedelta(days=days)
-        start = target_date.replace(hour=0, minute=0, second=0)
-        end = target_date.replace(hour=23, minute=59, second=59)
+    for subscription_id, expires_at, phone in subscriptions:
+        days = (timezone.localtime(expires_at).date() - today).days
+        chunk.append((subscription_id, expires_at, phone, days))
 
-        subscriptions = Subscription.objects.filter(
-            status='active',
-            expires_at__gte=start,
-            expires_at__lte=end
-        ).select_related('company', 'company__user')
+        if len(chunk) >= REMINDER_CHUNK_SIZE:
+            total_sent += flush(chunk)
+            chunk = []
 
-        for sub in subscriptions:
-            # TODO: Send reminder via email/WhatsApp
-            # send_expiry_reminder_email.delay(sub.company.user.email, days)
-            total_sent += 1
+    if chunk:
+        total_sent += flush(chunk)
 
     return {'reminders_sent': total_sent}
 
@@ -105,3 +169,20 @@ def expire_pending_invoices():
     ).update(status='expired')
 
     return {'expired': expired}
+
+
+@shared_task(bind=True, max_retries=5)
+def process_webhook_event(self, event_id):
+    """
+    Apply a stored payment webhook event.
+    Failed events are retried with backoff, then left for `replay_webhooks`.
+    """
+    from .models import WebhookEvent
+    from .services import apply_webhook_event
+
+    result = apply_webhook_event(event_id)
+
+    if result['status'] == WebhookEvent.Status.FAILED and self.request.retries < self.max_retries:
+        raise self.retry(countdown=30 * (2 ** self.request.retries))
+
+    return result
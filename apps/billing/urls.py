@@ -1,8 +1,14 @@
 """
 Billing URL configuration.
 """
-from django.urls import path
+from django.urls import path, re_path
 from . import views
+from .models import Payment
+
+# Gateways that post webhooks (manual payments are verified by staff)
+WEBHOOK_GATEWAYS = '|'.join(
+    gateway for gateway in Payment.Gateway.values if gateway != Payment.Gateway.MANUAL
+)
 
 app_name = 'billing'
 
@@ -14,9 +20,11 @@ urlpatterns = [
     # Payment
     path('payment/<uuid:invoice_id>/', views.payment_view, name='payment'),
     path('payment/<uuid:invoice_id>/verify/', views.verify_payment_view, name='verify_payment'),
+    path('payment/<uuid:invoice_id>/status/', views.payment_status_view, name='payment_status'),
 
     # Webhook
     path('webhook/', views.webhook_view, name='webhook'),
+    re_path(rf'^webhook/(?P<gateway>{WEBHOOK_GATEWAYS})/$', views.webhook_view, name='gateway_webhook'),
 
     # Subscription management
     path('subscription/', views.subscription_view, name='subscription'),
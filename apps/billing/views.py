@@ -5,12 +5,18 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.decorators.http import require_http_methods
+from django.views.decorators.csrf import csrf_exempt
+from django.conf import settings
 from django.http import JsonResponse
 import json
 
-from .models import SubscriptionPlan, Invoice, Subscription
-from .services import create_invoice, process_payment
+from .models import SubscriptionPlan, Invoice, Subscription, Payment
+from .services import (
+    create_invoice, accepts_webhooks, verify_webhook_signature, record_webhook_event,
+    apply_webhook_event, wait_for_invoice_status,
+)
 from apps.companies.views import employer_required
+from apps.core.utils import enqueue
 
 
 @employer_required
@@ -90,30 +96,57 @@ def verify_payment_view(request, invoice_id):
     })
 
 
+@employer_required
+@require_http_methods(['GET'])
+def payment_status_view(request, invoice_id):
+    """
+    Long-poll for the payment page: answers as soon as the invoice is no
+    longer in the `status` the page last saw, or with the unchanged status
+    after PAYMENT_STATUS_WAIT seconds, so the page can ask again.
+    """
+    company = request.user.company
+    invoice = get_object_or_404(
+        Invoice.objects.only('id', 'status'), id=invoice_id, company=company
+    )
+
+    status = invoice.status
+    if status == 'pending' and request.GET.get('status', 'pending') == status:
+        wait = settings.LAO_JOBS.get('PAYMENT_STATUS_WAIT', 20)
+        status = wait_for_invoice_status(invoice.id, status, wait)
+
+    return JsonResponse({'status': status})
+
+
+@csrf_exempt
 @require_http_methods(['POST'])
-def webhook_view(request):
+def webhook_view(request, gateway=Payment.Gateway.BCEL):
     """
     Payment gateway webhook handler.
+
+    Verifies the signature, stores the raw event in the inbox and
+    acknowledges immediately; `process_webhook_event` applies it (inline
+    when Celery is unavailable).
     """
-    # Verify webhook signature (implement based on gateway)
-    # signature = request.headers.get('X-Signature')
-    # if not verify_signature(request.body, signature):
-    #     return JsonResponse({'error': 'Invalid signature'}, status=403)
+    if not accepts_webhooks(gateway):
+        return JsonResponse({'error': 'Unknown gateway'}, status=404)
+
+    if not verify_webhook_signature(gateway, request.body, request.headers.get('X-Signature')):
+        return JsonResponse({'error': 'Invalid signature'}, status=403)
 
     try:
         data = json.loads(request.body)
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
-    event = data.get('event')
-    payment_reference = data.get('payment_reference')
-    transaction_id = data.get('transaction_id')
+    if not isinstance(data, dict):
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+
+    event = record_webhook_event(gateway, data)
 
-    if event == 'payment.completed' and payment_reference:
-        result = process_payment(payment_reference, transaction_id, data)
-        return JsonResponse(result)
+    enqueue('apps.billing.tasks.process_webhook_event', str(event.id),
+            fallback=apply_webhook_event)
 
-    return JsonResponse({'status': 'ignored'})
+    return JsonResponse({'status': 'received'})
 
 
 @employer_required
@@ -10,7 +10,7 @@ class CompanyAdmin(admin.ModelAdmin):
     list_display = ['company_name', 'email', 'phone_number', 'status', 'created_at']
     list_filter = ['status', 'province']
     search_fields = ['company_name', 'email', 'phone_number']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['logo_variants', 'created_at', 'updated_at']
     raw_id_fields = ['user', 'province']
 
     fieldsets = (
@@ -18,7 +18,7 @@ class CompanyAdmin(admin.ModelAdmin):
             'fields': ('user', 'company_name', 'email', 'phone_number', 'phone_normalized')
         }),
         ('ຂໍ້ມູນເພີ່ມເຕີມ', {
-            'fields': ('description', 'address', 'province', 'website', 'logo')
+            'fields': ('description', 'address', 'province', 'website', 'logo', 'logo_variants')
         }),
         ('ສະຖານະ', {
             'fields': ('status', 'is_deleted', 'deleted_at')
@@ -29,6 +29,11 @@ class CompanyAdmin(admin.ModelAdmin):
         }),
     )
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if 'logo' in form.changed_data:
+            obj.logo_uploaded()
+
 
 @admin.register(CompanyContact)
 class CompanyContactAdmin(admin.ModelAdmin):
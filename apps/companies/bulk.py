@@ -0,0 +1,164 @@
+"""
+Bulk job operations for the employer portal.
+
+Each operation selects the company's eligible jobs once, applies a single
+set-based UPDATE (or bulk INSERT for duplicates) inside one transaction,
+and writes the audit trail with one bulk insert.
+"""
+import uuid
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.audit.models import log_actions
+from apps.core import pagecache
+from apps.jobs.models import JobPost
+from .stats import invalidate_dashboard_stats
+
+PUBLISH = 'publish'
+CLOSE = 'close'
+DELETE = 'delete'
+DUPLICATE = 'duplicate'
+EXTEND = 'extend'
+ACTIONS = (PUBLISH, CLOSE, DELETE, DUPLICATE, EXTEND)
+
+# Actions that put or keep jobs live and so require an entitlement
+ENTITLED_ACTIONS = (PUBLISH, EXTEND)
+
+# Fields copied when duplicating a job post
+COPY_FIELDS = [
+    'company_id', 'category_id', 'province_id', 'description',
+    'requirements', 'benefits', 'salary_min', 'salary_max',
+    'salary_negotiable', 'job_type', 'positions_count', 'contact_email',
+    'contact_phone', 'contact_whatsapp', 'contact_messenger',
+]
+
+
+class BulkActionError(Exception):
+    """Raised when a bulk action cannot be performed."""
+    pass
+
+
+def copy_job(original):
+    """Build an unsaved draft copy of a job post."""
+    job = JobPost(
+        title=f'{original.title} (ສຳເນົາ)',
+        status=JobPost.Status.DRAFT,
+    )
+    for field in COPY_FIELDS:
+        setattr(job, field, getattr(original, field))
+    return job
+
+
+def bulk_job_action(company, action, job_ids, days=None, user=None, request=None):
+    """
+    Apply one action to many of a company's job posts.
+
+    Args:
+        company: The company owning the jobs
+        action: One of ACTIONS
+        job_ids: Iterable of job post IDs
+        days: Extension in days for EXTEND (defaults to JOB_POST_EXPIRY_DAYS)
+        user: Acting user, for the audit log
+        request: Django request, for the audit log
+
+    Returns:
+        dict: action, affected (list of job IDs), skipped (count)
+            and for DUPLICATE created (list of new job IDs)
+
+    Raises:
+        BulkActionError: unknown action, too many jobs or no entitlement
+    """
+    lao_jobs = getattr(settings, 'LAO_JOBS', {})
+    expiry_days = lao_jobs.get('JOB_POST_EXPIRY_DAYS', 15)
+    limit = lao_jobs.get('BULK_JOB_LIMIT', 500)
+
+    if action not in ACTIONS:
+        raise BulkActionError('ການກະທຳບໍ່ຖືກຕ້ອງ')
+
+    try:
+        job_ids = list(dict.fromkeys(uuid.UUID(str(job_id)) for job_id in job_ids))
+    except ValueError:
+        raise BulkActionError('ລະຫັດໂພສວຽກບໍ່ຖືກຕ້ອງ')
+    if not job_ids:
+        raise BulkActionError('ກະລຸນາເລືອກໂພສວຽກ')
+    if len(job_ids) > limit:
+        raise BulkActionError(f'ເລືອກໄດ້ສູງສຸດ {limit} ໂພສຕໍ່ຄັ້ງ')
+
+    if action in ENTITLED_ACTIONS:
+        can_create, error = company.can_create_job()
+        if not can_create:
+            raise BulkActionError(error)
+
+    if action == EXTEND:
+        days = int(days or expiry_days)
+        if not 1 <= days <= 90:
+            raise BulkActionError('ຈຳນວນມື້ບໍ່ຖືກຕ້ອງ')
+
+    jobs = JobPost.objects.filter(company=company, id__in=job_ids)
+    eligible = {
+        PUBLISH: jobs.filter(status=JobPost.Status.DRAFT),
+        CLOSE: jobs.filter(status=JobPost.Status.PUBLISHED),
+        DELETE: jobs,
+        DUPLICATE: jobs,
+        EXTEND: jobs.filter(status=JobPost.Status.PUBLISHED),
+    }[action]
+
+    now = timezone.now()
+    created = []
+
+    with transaction.atomic():
+        if action == DUPLICATE:
+            originals = list(eligible)
+            affected = [job.id for job in originals]
+            copies = JobPost.objects.bulk_create([copy_job(job) for job in originals])
+            created = [job.id for job in copies]
+        else:
+            affected = list(eligible.select_for_update().values_list('id', flat=True))
+            targets = JobPost.objects.filter(id__in=affected)
+
+            if action == PUBLISH:
+                targets.update(
+                    status=JobPost.Status.PUBLISHED,
+                    published_at=now,
+                    expires_at=now + timedelta(days=expiry_days),
+                    updated_at=now,
+                )
+            elif action == CLOSE:
+                targets.update(status=JobPost.Status.CLOSED, updated_at=now)
+            elif action == DELETE:
+                targets.update(is_deleted=True, deleted_at=now, updated_at=now)
+            elif action == EXTEND:
+                targets.update(expires_at=F('expires_at') + timedelta(days=days), updated_at=now)
+
+        details = {'bulk': True}
+        if action == EXTEND:
+            details['days'] = days
+        log_actions(
+            action,
+            'JobPost',
+            affected,
+            actor_type='user',
+            actor_id=user.pk if user else '',
+            details=details,
+            request=request,
+        )
+
+    invalidate_dashboard_stats(company.pk)
+    categories = JobPost.all_objects.filter(id__in=affected).values_list('category_id', flat=True)
+    pagecache.purge(
+        'jobs',
+        *(f'job:{job_id}' for job_id in affected),
+        *(f'category:{category_id}' for category_id in set(categories)),
+    )
+
+    result = {
+        'action': action,
+        'affected': [str(job_id) for job_id in affected],
+        'skipped': len(job_ids) - len(affected),
+    }
+    if action == DUPLICATE:
+        result['created'] = [str(job_id) for job_id in created]
+    return result
@@ -77,4 +77,6 @@ class CompanyProfileForm(forms.ModelForm):
         company.phone_normalized = company.phone_number
         if commit:
             company.save()
+            if 'logo' in self.changed_data:
+                company.logo_uploaded()
         return company
@@ -0,0 +1,222 @@
+"""
+Company logo variants.
+
+Uploaded logos (up to 2 MB) are resized in a Celery task to a few fixed
+sizes, each saved as WebP plus a PNG fallback next to the original.
+The file names carry a hash of the original, so a new logo gets new
+URLs and can be cached for a long time.
+"""
+import hashlib
+import os
+import re
+import time
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from .models import company_logo_path
+
+# Bounding box in pixels, 2x the largest CSS size the logo is shown at
+LOGO_SIZES = {
+    'sm': 100,  # job cards (50px)
+    'md': 160,  # job detail header (80px)
+    'lg': 320,  # company pages
+}
+
+VARIANT_NAME = re.compile(
+    r'^logo_(%s)_[0-9a-f]{8}\.(webp|png)$' % '|'.join(LOGO_SIZES)
+)
+
+
+def logo_cache_key(company):
+    return f'company:{company.pk}:logo_urls:{company.logo_version}'
+
+
+def _logo_url_ttl():
+    # Stay below the lifetime of signed storage URLs (S3 default: 1 hour)
+    return getattr(settings, 'LAO_JOBS', {}).get('LOGO_URL_CACHE_TTL', 50 * 60)
+
+
+def build_logo_urls(company):
+    """
+    Variant URLs per size, falling back to the original logo.
+
+    Returns:
+        dict: {size: {'png': url, 'webp': url or None}}, empty without a logo
+    """
+    if not company.logo:
+        return {}
+
+    original = company.logo.url
+    urls = {}
+    for size in LOGO_SIZES:
+        variant = company.logo_variants.get(size) or {}
+        urls[size] = {
+            'png': default_storage.url(variant['png']) if 'png' in variant else original,
+            'webp': default_storage.url(variant['webp']) if 'webp' in variant else None,
+        }
+    return urls
+
+
+def _cache_entry(urls):
+    # built_at lets callers bound how long they reuse the URLs
+    return {'urls': urls, 'built_at': time.time()}
+
+
+def _set_urls(company, entry):
+    company.__dict__['logo_urls'] = entry['urls']
+    company.__dict__['logo_urls_built_at'] = entry['built_at']
+
+
+def logo_urls(company):
+    """Logo URLs for one company, from the cache keyed by logo version."""
+    if not company.logo:
+        return {}
+
+    key = logo_cache_key(company)
+    entry = cache.get(key)
+    if entry is None:
+        entry = _cache_entry(build_logo_urls(company))
+        cache.set(key, entry, timeout=_logo_url_ttl())
+    company.__dict__['logo_urls_built_at'] = entry['built_at']
+    return entry['urls']
+
+
+def prefetch_logo_urls(companies):
+    """
+    Resolve logo URLs for many companies with one cache get_many, so a
+    listing page does not resolve (or sign) storage URLs row by row.
+    Results are stored on each instance's `logo_urls`.
+    """
+    pending = {}
+    for company in companies:
+        if 'logo_urls' in company.__dict__:
+            continue
+        if not company.logo:
+            company.__dict__['logo_urls'] = {}
+            continue
+        pending.setdefault(logo_cache_key(company), []).append(company)
+
+    if not pending:
+        return
+
+    found = cache.get_many(list(pending))
+    missing = {}
+    for key, instances in pending.items():
+        entry = found.get(key)
+        if entry is None:
+            entry = missing[key] = _cache_entry(build_logo_urls(instances[0]))
+        for company in instances:
+            _set_urls(company, entry)
+
+    if missing:
+        cache.set_many(missing, timeout=_logo_url_ttl())
+
+
+def logo_urls_valid_for(companies):
+    """
+    Seconds the resolved logo URLs of `companies` may still be reused
+    (e.g. in cached HTML) before the oldest reaches the logo URL TTL,
+    which stays below the lifetime of signed storage URLs.
+    """
+    ttl = _logo_url_ttl()
+    built = [
+        company.__dict__['logo_urls_built_at']
+        for company in companies
+        if 'logo_urls_built_at' in company.__dict__
+    ]
+    if not built:
+        return ttl
+    return max(0, int(ttl - (time.time() - min(built))))
+
+
+def _encode(image, fmt):
+    buffer = BytesIO()
+    if fmt == 'webp':
+        image.save(buffer, 'WEBP', quality=80, method=6)
+    else:
+        image.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def build_logo_variants(company):
+    """
+    Resize the company's logo into LOGO_SIZES and store the files.
+
+    Returns:
+        dict: The new logo_variants value ({} when there is no logo)
+    """
+    from PIL import Image, ImageOps
+
+    variants = {}
+    if company.logo:
+        with company.logo.open('rb') as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()[:8]
+
+        image = Image.open(BytesIO(content))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert('RGBA')
+
+        for size, pixels in LOGO_SIZES.items():
+            resized = image.copy()
+            resized.thumbnail((pixels, pixels), Image.LANCZOS)
+            variants[size] = {}
+            for fmt in ('webp', 'png'):
+                path = company_logo_path(company, f'logo.{fmt}', variant=f'{size}_{digest}')
+                if default_storage.exists(path):
+                    default_storage.delete(path)
+                variants[size][fmt] = default_storage.save(path, ContentFile(_encode(resized, fmt)))
+
+    return variants
+
+
+def process_logo(company_id):
+    """
+    Build and store the variants of a company's current logo.
+    Runs in `process_company_logo`, or inline when Celery is unavailable.
+
+    Returns:
+        dict: Result with status
+    """
+    from apps.core import pagecache
+    from .models import Company
+
+    try:
+        company = Company.all_objects.get(id=company_id)
+    except Company.DoesNotExist:
+        return {'status': 'skipped'}
+
+    variants = build_logo_variants(company)
+
+    # Skip the write if the logo was replaced while we were resizing; the
+    # build for the newer logo stores (and cleans up after) its own files
+    companies = Company.all_objects.filter(pk=company.pk)
+    if company.logo:
+        companies = companies.filter(logo=company.logo.name)
+    if not companies.update(logo_variants=variants):
+        return {'status': 'skipped'}
+
+    _delete_stale_variants(company, variants)
+    pagecache.purge('jobs', f'company:{company.pk}')
+    return {'status': 'success', 'sizes': len(variants)}
+
+
+def _delete_stale_variants(company, variants):
+    """Remove variant files of earlier logos."""
+    directory = os.path.dirname(company_logo_path(company, 'logo.png'))
+    keep = {
+        os.path.basename(path)
+        for formats in variants.values()
+        for path in formats.values()
+    }
+    try:
+        _, files = default_storage.listdir(directory)
+    except (FileNotFoundError, NotImplementedError):
+        return
+    for filename in files:
+        if VARIANT_NAME.match(filename) and filename not in keep:
+            default_storage.delete(f'{directory}/{filename}')
@@ -0,0 +1,41 @@
+"""
+Build resized logo variants for existing companies.
+"""
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Queue logo variant builds for companies whose logo has none'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Rebuild every logo, not only those without variants',
+        )
+        parser.add_argument(
+            '--sync',
+            action='store_true',
+            help='Process logos in this process instead of queueing them',
+        )
+
+    def handle(self, *args, **options):
+        from apps.companies.logos import process_logo
+        from apps.companies.models import Company
+        from apps.core.utils import enqueue
+
+        companies = Company.objects.exclude(logo='').exclude(logo__isnull=True)
+        if not options['all']:
+            companies = companies.filter(logo_variants={})
+
+        company_ids = list(companies.values_list('id', flat=True))
+        for company_id in company_ids:
+            if options['sync']:
+                result = process_logo(str(company_id))
+                self.stdout.write(f'  {company_id}: {result}')
+            else:
+                enqueue('apps.companies.tasks.process_company_logo', str(company_id),
+                        fallback=process_logo)
+
+        action = 'Processed' if options['sync'] else 'Queued'
+        self.stdout.write(self.style.SUCCESS(f'{action} {len(company_ids)} company logos'))
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_entitlement(apps, schema_editor):
+    Company = apps.get_model('companies', 'Company')
+    Subscription = apps.get_model('billing', 'Subscription')
+
+    active = Subscription.objects.filter(
+        status='active',
+        expires_at__gt=timezone.now()
+    ).order_by('company_id', '-expires_at')
+
+    seen = set()
+    for sub in active.iterator():
+        if sub.company_id in seen:
+            continue
+        seen.add(sub.company_id)
+        Company.objects.filter(pk=sub.company_id).update(
+            subscription_expires_at=sub.expires_at,
+            subscription_plan_id=sub.plan_id,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billing', '0002_initial'),
+        ('companies', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='subscription_expires_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='ສະມາຊິກໝົດອາຍຸ'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='subscription_plan',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='billing.subscriptionplan', verbose_name='ແພັກເກດ'),
+        ),
+        migrations.RunPython(backfill_entitlement, migrations.RunPython.noop),
+    ]
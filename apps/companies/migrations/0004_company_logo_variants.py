@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0003_company_subscription_entitlement'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='logo_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='ຂະໜາດໂລໂກ້'),
+        ),
+    ]
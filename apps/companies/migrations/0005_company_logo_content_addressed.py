@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:59
+
+import apps.companies.models
+import apps.core.storage
+import apps.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0004_company_logo_variants'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='company',
+            name='logo',
+            field=models.ImageField(blank=True, null=True, storage=apps.core.storage.content_addressed_storage, upload_to=apps.companies.models.company_logo_path, validators=[apps.core.validators.validate_image_size, apps.core.validators.validate_image_extension], verbose_name='ໂລໂກ້'),
+        ),
+    ]
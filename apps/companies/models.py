@@ -1,16 +1,26 @@
 """
 Company models.
 """
+import hashlib
 import uuid
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
 from django.utils import timezone
+from django.utils.functional import cached_property
+from apps.core import pagecache
 from apps.core.models import TimeStampedModel, SoftDeleteModel
+from apps.core.storage import content_addressed_storage
 from apps.core.validators import validate_image_size, validate_image_extension
 
 
-def company_logo_path(instance, filename):
-    """Generate upload path for company logo."""
+def company_logo_path(instance, filename, variant=None):
+    """
+    Generate upload path for company logo (or one of its variants).
+    The logo's storage adds a content hash to the name.
+    """
     ext = filename.split('.')[-1]
+    if variant:
+        return f'companies/{instance.id}/logo_{variant}.{ext}'
     return f'companies/{instance.id}/logo.{ext}'
 
 
@@ -76,11 +86,19 @@ class Company(TimeStampedModel, SoftDeleteModel):
     )
     logo = models.ImageField(
         upload_to=company_logo_path,
+        storage=content_addressed_storage,
         blank=True,
         null=True,
         validators=[validate_image_size, validate_image_extension],
         verbose_name='ໂລໂກ້'
     )
+    # Resized WebP/PNG copies of the logo, see apps.companies.logos
+    logo_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='ຂະໜາດໂລໂກ້'
+    )
 
     # Status
     status = models.CharField(
@@ -91,6 +109,21 @@ class Company(TimeStampedModel, SoftDeleteModel):
         verbose_name='ສະຖານະ'
     )
 
+    # Subscription entitlement (denormalized, see refresh_entitlement)
+    subscription_expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='ສະມາຊິກໝົດອາຍຸ'
+    )
+    subscription_plan = models.ForeignKey(
+        'billing.SubscriptionPlan',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        verbose_name='ແພັກເກດ'
+    )
+
     class Meta:
         verbose_name = 'ບໍລິສັດ'
         verbose_name_plural = 'ບໍລິສັດ'
@@ -103,22 +136,105 @@ class Company(TimeStampedModel, SoftDeleteModel):
     def __str__(self):
         return self.company_name
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Job pages show the company's name and logo
+        pagecache.purge('jobs', f'company:{self.pk}')
+
     @property
     def is_active(self):
         return self.status == self.Status.ACTIVE
 
+    @property
+    def subscription_cache_key(self):
+        # Keyed by the denormalized entitlement, so a renewal or expiry
+        # misses in every process, not only the one that refreshed it
+        expires_at = self.subscription_expires_at.timestamp() if self.subscription_expires_at else ''
+        return f'company:{self.pk}:subscription:{expires_at}:{self.subscription_plan_id}'
+
+    @property
+    def has_active_subscription(self):
+        """Check if company has an active subscription (no query)."""
+        return (
+            self.subscription_expires_at is not None and
+            self.subscription_expires_at > timezone.now()
+        )
+
     @property
     def active_subscription(self):
-        """Get active subscription if exists."""
-        return self.subscriptions.filter(
+        """Get active subscription if exists (cached per company)."""
+        if not self.has_active_subscription:
+            return None
+
+        if '_active_subscription' not in self.__dict__:
+            subscription = cache.get(self.subscription_cache_key)
+            if subscription is None:
+                subscription = self.subscriptions.filter(
+                    status='active',
+                    expires_at__gt=timezone.now()
+                ).order_by('-expires_at').first()
+                if subscription:
+                    timeout = (self.subscription_expires_at - timezone.now()).total_seconds()
+                    cache.set(self.subscription_cache_key, subscription, timeout=min(timeout, 24 * 60 * 60))
+            self.__dict__['_active_subscription'] = subscription
+
+        return self.__dict__['_active_subscription']
+
+    def refresh_entitlement(self):
+        """
+        Recompute the denormalized subscription entitlement from the
+        company's subscriptions; the cached subscription is keyed by it.
+        Called whenever a subscription is activated, extended or expired.
+        """
+        subscription = self.subscriptions.filter(
             status='active',
             expires_at__gt=timezone.now()
-        ).first()
+        ).order_by('-expires_at').first()
+
+        self.subscription_expires_at = subscription.expires_at if subscription else None
+        self.subscription_plan_id = subscription.plan_id if subscription else None
+        Company.objects.filter(pk=self.pk).update(
+            subscription_expires_at=self.subscription_expires_at,
+            subscription_plan_id=self.subscription_plan_id,
+        )
+
+        self.__dict__.pop('_active_subscription', None)
 
     @property
-    def has_active_subscription(self):
-        """Check if company has an active subscription."""
-        return self.active_subscription is not None
+    def logo_version(self):
+        """Short hash of the logo file and its variants; changes with either."""
+        source = f'{self.logo.name if self.logo else ""}|{sorted(self.logo_variants.items())}'
+        return hashlib.md5(source.encode()).hexdigest()[:12]
+
+    @cached_property
+    def logo_urls(self):
+        """
+        Logo URLs per size for templates and APIs, cached by logo version.
+        Falls back to the original upload until the variants are built.
+
+        Returns:
+            dict: {'sm': {'png': url, 'webp': url or None}, 'md': ..., 'lg': ...}
+        """
+        from .logos import logo_urls
+        return logo_urls(self)
+
+    def logo_uploaded(self):
+        """
+        Drop the variants of the previous logo and build new ones once
+        the upload is committed. Call after saving a changed logo.
+        """
+        from apps.core.utils import enqueue
+        from .logos import logo_cache_key, process_logo
+
+        self.logo_variants = {}
+        self.__dict__.pop('logo_urls', None)
+        Company.objects.filter(pk=self.pk).update(logo_variants={})
+        # The new file may reuse an earlier name (and so an earlier version)
+        cache.delete(logo_cache_key(self))
+        company_id = str(self.pk)
+        transaction.on_commit(lambda: enqueue(
+            'apps.companies.tasks.process_company_logo', company_id, fallback=process_logo
+        ))
 
     def can_create_job(self):
         """
@@ -0,0 +1,60 @@
+"""
+Employer dashboard statistics.
+
+All counts are computed in a single conditional-aggregation query and
+cached per company. The cache is invalidated whenever a job post is
+saved, when buffered view counts are flushed and when the unread
+applications counters change.
+"""
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+
+def dashboard_stats_cache_key(company_id):
+    return f'company:{company_id}:dashboard_stats'
+
+
+def get_dashboard_stats(company):
+    """
+    Get job statistics for the employer dashboard.
+
+    Returns:
+        dict: published, draft, expired, closed, total_views,
+              unread_applications, expiring_soon
+    """
+    key = dashboard_stats_cache_key(company.pk)
+    stats = cache.get(key)
+    if stats is not None:
+        return stats
+
+    from apps.jobs.models import JobPost
+
+    now = timezone.now()
+    stats = JobPost.objects.filter(company=company, is_deleted=False).aggregate(
+        published=Count('id', filter=Q(status='published')),
+        draft=Count('id', filter=Q(status='draft')),
+        expired=Count('id', filter=Q(status='expired')),
+        closed=Count('id', filter=Q(status='closed')),
+        total_views=Sum('view_count'),
+        unread_applications=Sum('unread_applications_count'),
+        expiring_soon=Count('id', filter=Q(
+            status='published',
+            expires_at__gt=now,
+            expires_at__lte=now + timedelta(days=3)
+        )),
+    )
+    stats['total_views'] = stats['total_views'] or 0
+    stats['unread_applications'] = stats['unread_applications'] or 0
+
+    # Short TTL keeps the time-based "expiring soon" count honest
+    timeout = getattr(settings, 'LAO_JOBS', {}).get('DASHBOARD_STATS_TTL', 300)
+    cache.set(key, stats, timeout=timeout)
+    return stats
+
+
+def invalidate_dashboard_stats(*company_ids):
+    """Drop cached dashboard statistics for the given companies."""
+    cache.delete_many([dashboard_stats_cache_key(pk) for pk in company_ids])
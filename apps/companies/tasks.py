@@ -0,0 +1,14 @@
+"""
+Company Celery tasks.
+"""
+from celery import shared_task
+
+
+@shared_task
+def process_company_logo(company_id):
+    """
+    Build the resized WebP/PNG variants of a company's logo.
+    """
+    from .logos import process_logo
+
+    return process_logo(company_id)
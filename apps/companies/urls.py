@@ -9,6 +9,7 @@ app_name = 'employer'
 urlpatterns = [
     # Dashboard
     path('dashboard/', views.dashboard_view, name='dashboard'),
+    path('analytics/', views.analytics_view, name='analytics'),
 
     # Company Profile
     path('profile/', views.profile_view, name='profile'),
@@ -16,11 +17,19 @@ urlpatterns = [
     # Jobs Management
     path('jobs/', views.my_jobs_view, name='my_jobs'),
     path('jobs/create/', views.job_create_view, name='job_create'),
+    path('jobs/bulk/', views.job_bulk_view, name='job_bulk'),
+    path('jobs/import/', views.job_import_view, name='job_import'),
+    path('jobs/import/<uuid:import_id>/', views.job_import_detail_view, name='job_import_detail'),
     path('jobs/<uuid:job_id>/edit/', views.job_edit_view, name='job_edit'),
     path('jobs/<uuid:job_id>/publish/', views.job_publish_view, name='job_publish'),
     path('jobs/<uuid:job_id>/close/', views.job_close_view, name='job_close'),
     path('jobs/<uuid:job_id>/delete/', views.job_delete_view, name='job_delete'),
     path('jobs/<uuid:job_id>/duplicate/', views.job_duplicate_view, name='job_duplicate'),
+    path('jobs/<uuid:job_id>/analytics/', views.analytics_view, name='job_analytics'),
+
+    # Applications
+    path('applications/', views.applications_view, name='applications'),
+    path('applications/<uuid:application_id>/status/', views.application_status_view, name='application_status'),
 
     # Settings
     path('settings/', views.settings_view, name='settings'),
@@ -1,16 +1,27 @@
 """
 Company views (Employer Portal).
 """
+import json
+import uuid
+from django.conf import settings
+from django.http import JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.decorators.http import require_http_methods
 from django.core.paginator import Paginator
-from django.db.models import Sum
+from django.db.models import Q
 
 from .models import Company
+from .bulk import BulkActionError, bulk_job_action, copy_job
+from .stats import get_dashboard_stats
 from .forms import CompanyProfileForm
-from apps.jobs.models import JobPost
+from apps.jobs import analytics
+from apps.core.pagination import keyset_paginate
+from apps.core.utils import enqueue
+from apps.core.validators import normalize_phone_number
+from apps.jobs.importer import ImportFileError, get_file_format, import_jobs, run_import
+from apps.jobs.models import JobPost, JobApplication, JobImport
 from apps.jobs.forms import JobPostForm
 
 
@@ -33,39 +44,52 @@ def dashboard_view(request):
     company = request.user.company
     subscription = company.active_subscription
 
-    # Get job statistics
-    jobs = company.job_posts.filter(is_deleted=False)
-    published_count = jobs.filter(status='published').count()
-    draft_count = jobs.filter(status='draft').count()
-    expired_count = jobs.filter(status='expired').count()
-    total_views = jobs.aggregate(total=Sum('view_count'))['total'] or 0
-
-    # Get expiring soon jobs (within 3 days)
-    from django.utils import timezone
-    from datetime import timedelta
-    expiring_soon = jobs.filter(
-        status='published',
-        expires_at__lte=timezone.now() + timedelta(days=3),
-        expires_at__gt=timezone.now()
-    ).count()
+    # Get job statistics (single aggregate query, cached per company)
+    stats = get_dashboard_stats(company)
 
     # Recent jobs
-    recent_jobs = jobs.order_by('-created_at')[:5]
+    recent_jobs = company.job_posts.filter(is_deleted=False).order_by('-created_at')[:5]
 
     context = {
         'company': company,
         'subscription': subscription,
-        'published_count': published_count,
-        'draft_count': draft_count,
-        'expired_count': expired_count,
-        'total_views': total_views,
-        'expiring_soon': expiring_soon,
+        'published_count': stats['published'],
+        'draft_count': stats['draft'],
+        'expired_count': stats['expired'],
+        'total_views': stats['total_views'],
+        'expiring_soon': stats['expiring_soon'],
+        'unread_applications': stats['unread_applications'],
         'recent_jobs': recent_jobs,
     }
 
     return render(request, 'employer/dashboard.html', context)
 
 
+@employer_required
+@require_http_methods(['GET'])
+def analytics_view(request, job_id=None):
+    """
+    Daily analytics time series (JSON) for all of the company's jobs,
+    or for one job. Served from the daily rollups only.
+    """
+    company = request.user.company
+    jobs = company.job_posts.filter(is_deleted=False)
+    if job_id:
+        jobs = jobs.filter(id=job_id)
+        if not jobs.exists():
+            return JsonResponse({'error': 'ບໍ່ພົບໂພສວຽກ'}, status=404)
+
+    try:
+        days = min(max(int(request.GET.get('days', 30)), 1), 90)
+    except ValueError:
+        days = 30
+
+    return JsonResponse({
+        'job_id': str(job_id) if job_id else None,
+        'days': analytics.daily_series(jobs, days=days),
+    })
+
+
 @employer_required
 @require_http_methods(['GET', 'POST'])
 def profile_view(request):
@@ -125,6 +149,83 @@ def my_jobs_view(request):
     return render(request, 'employer/my_jobs.html', context)
 
 
+@employer_required
+def applications_view(request):
+    """
+    Applicant inbox across all of the company's jobs.
+    """
+    company = request.user.company
+
+    # Get filter parameters
+    status_filter = request.GET.get('status', '')
+    job_filter = request.GET.get('job', '')
+    search = request.GET.get('q', '').strip()
+
+    applications = JobApplication.objects.filter(company=company).select_related('job_post')
+
+    if status_filter in JobApplication.Status.values:
+        applications = applications.filter(status=status_filter)
+
+    if job_filter:
+        try:
+            applications = applications.filter(job_post_id=uuid.UUID(job_filter))
+        except ValueError:
+            job_filter = ''
+
+    if search:
+        query = Q(full_name__icontains=search) | Q(phone_number__contains=search)
+        if any(char.isdigit() for char in search):
+            query |= Q(phone_normalized=normalize_phone_number(search))
+        applications = applications.filter(query)
+
+    # Keyset pagination
+    try:
+        page, next_cursor = keyset_paginate(applications, request.GET.get('cursor'), page_size=20)
+    except ValueError:
+        page, next_cursor = keyset_paginate(applications, page_size=20)
+
+    # Unread counts from the per-job counters
+    jobs = company.job_posts.filter(is_deleted=False).only(
+        'id', 'title', 'unread_applications_count'
+    ).order_by('-unread_applications_count', '-created_at')
+
+    context = {
+        'applications': page,
+        'next_cursor': next_cursor,
+        'jobs': jobs,
+        'unread_total': sum(job.unread_applications_count for job in jobs),
+        'status_choices': JobApplication.Status.choices,
+        'status_filter': status_filter,
+        'job_filter': job_filter,
+        'search': search,
+        'company': company,
+    }
+
+    return render(request, 'employer/applications.html', context)
+
+
+@employer_required
+@require_http_methods(['POST'])
+def application_status_view(request, application_id):
+    """
+    Change an application's status.
+    """
+    company = request.user.company
+    application = get_object_or_404(JobApplication, id=application_id, company=company)
+
+    status = request.POST.get('status', '')
+    if status in JobApplication.Status.values:
+        application.set_status(status)
+        messages.success(request, 'ອັບເດດສະຖານະສຳເລັດ')
+    else:
+        messages.error(request, 'ສະຖານະບໍ່ຖືກຕ້ອງ')
+
+    next_url = request.POST.get('next', '')
+    if next_url.startswith('/employer/applications/'):
+        return redirect(next_url)
+    return redirect('employer:applications')
+
+
 @employer_required
 @require_http_methods(['GET', 'POST'])
 def job_create_view(request):
@@ -251,30 +352,127 @@ def job_duplicate_view(request, job_id):
     original = get_object_or_404(JobPost, id=job_id, company=company, is_deleted=False)
 
     # Create copy
-    job = JobPost.objects.create(
-        company=company,
-        category=original.category,
-        province=original.province,
-        title=f'{original.title} (ສຳເນົາ)',
-        description=original.description,
-        requirements=original.requirements,
-        benefits=original.benefits,
-        salary_min=original.salary_min,
-        salary_max=original.salary_max,
-        salary_negotiable=original.salary_negotiable,
-        job_type=original.job_type,
-        positions_count=original.positions_count,
-        contact_email=original.contact_email,
-        contact_phone=original.contact_phone,
-        contact_whatsapp=original.contact_whatsapp,
-        contact_messenger=original.contact_messenger,
-        status='draft',
-    )
+    job = copy_job(original)
+    job.save()
 
     messages.success(request, 'ສຳເນົາໂພສວຽກສຳເລັດ')
     return redirect('employer:job_edit', job_id=job.id)
 
 
+@employer_required
+@require_http_methods(['POST'])
+def job_bulk_view(request):
+    """
+    Apply one action (publish, close, delete, duplicate, extend) to many
+    job posts. Accepts a form post or a JSON body; JSON gets JSON back.
+    """
+    company = request.user.company
+    is_json = request.content_type == 'application/json'
+
+    if is_json:
+        try:
+            data = json.loads(request.body)
+        except json.JSONDecodeError:
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+        action = data.get('action', '')
+        job_ids = data.get('job_ids') or []
+        days = data.get('days')
+    else:
+        action = request.POST.get('action', '')
+        job_ids = request.POST.getlist('job_ids')
+        days = request.POST.get('days')
+
+    try:
+        result = bulk_job_action(
+            company, action, job_ids,
+            days=days, user=request.user, request=request
+        )
+    except (BulkActionError, ValueError, TypeError) as e:
+        error = str(e) if isinstance(e, BulkActionError) else 'ຂໍ້ມູນບໍ່ຖືກຕ້ອງ'
+        if is_json:
+            return JsonResponse({'error': error}, status=400)
+        messages.error(request, error)
+        return redirect('employer:my_jobs')
+
+    if is_json:
+        return JsonResponse({'success': True, **result})
+
+    messages.success(request, f'ດຳເນີນການສຳເລັດ {len(result["affected"])} ໂພສ')
+    if result['skipped']:
+        messages.warning(request, f'ຂ້າມ {result["skipped"]} ໂພສທີ່ບໍ່ສາມາດດຳເນີນການໄດ້')
+    return redirect('employer:my_jobs')
+
+
+@employer_required
+@require_http_methods(['GET', 'POST'])
+def job_import_view(request):
+    """
+    Upload a CSV/XLSX file of job posts. Small files are imported right
+    away; larger ones are handed to a background task.
+    """
+    company = request.user.company
+
+    can_create, error = company.can_create_job()
+    if not can_create:
+        messages.error(request, error)
+        return redirect('billing:choose_plan')
+
+    if request.method == 'POST':
+        upload = request.FILES.get('file')
+        if not upload:
+            messages.error(request, 'ກະລຸນາເລືອກໄຟລ໌')
+            return redirect('employer:job_import')
+
+        try:
+            get_file_format(upload.name)
+        except ImportFileError as e:
+            messages.error(request, str(e))
+            return redirect('employer:job_import')
+
+        job_import = JobImport(company=company)
+        job_import.file = upload
+        job_import.save()
+
+        sync_limit = settings.LAO_JOBS.get('JOB_IMPORT_SYNC_MAX_BYTES', 100 * 1024)
+        if upload.size <= sync_limit:
+            import_jobs(job_import)
+        else:
+            enqueue('apps.jobs.tasks.process_job_import', str(job_import.id),
+                    fallback=run_import)
+
+        return redirect('employer:job_import_detail', import_id=job_import.id)
+
+    return render(request, 'employer/job_import.html', {
+        'company': company,
+        'imports': company.job_imports.all()[:10],
+    })
+
+
+@employer_required
+def job_import_detail_view(request, import_id):
+    """
+    Import progress and per-row error report (HTML, or JSON for polling).
+    """
+    company = request.user.company
+    job_import = get_object_or_404(JobImport, id=import_id, company=company)
+
+    if request.GET.get('format') == 'json':
+        return JsonResponse({
+            'id': str(job_import.id),
+            'status': job_import.status,
+            'total_rows': job_import.total_rows,
+            'created_count': job_import.created_count,
+            'error_count': job_import.error_count,
+            'errors': job_import.errors,
+        })
+
+    return render(request, 'employer/job_import.html', {
+        'company': company,
+        'job_import': job_import,
+        'imports': company.job_imports.all()[:10],
+    })
+
+
 @employer_required
 def settings_view(request):
     """
@@ -0,0 +1,116 @@
+"""
+Batched deletion for maintenance tasks.
+
+A plain `QuerySet.delete()` collects every row (and its cascades) in one
+transaction, which holds locks on hot tables for the whole purge. These
+helpers delete in primary-key chunks, each in its own short transaction.
+"""
+import logging
+import time
+
+from django.db import router, transaction
+from django.db.models import CASCADE, signals
+
+logger = logging.getLogger(__name__)
+
+
+def _has_delete_listeners(model):
+    return (
+        signals.pre_delete.has_listeners(model) or
+        signals.post_delete.has_listeners(model)
+    )
+
+
+def raw_cascade_plan(model):
+    """
+    Return the child tables that can be deleted with raw DELETE statements
+    before `model` rows, as a list of (related_model, fk_field_name).
+
+    Returns None if raw deletion is not safe: a relation is not CASCADE,
+    a child has relations of its own, or delete signals are connected.
+    """
+    if _has_delete_listeners(model):
+        return None
+
+    plan = []
+    for relation in model._meta.related_objects:
+        related_model = relation.related_model
+        if relation.on_delete is not CASCADE or relation.many_to_many:
+            return None
+        if related_model._meta.related_objects or _has_delete_listeners(related_model):
+            return None
+        plan.append((related_model, relation.field.name))
+
+    return plan
+
+
+def delete_in_batches(queryset, batch_size=1000, pause=0.05, time_budget=None, progress=None):
+    """
+    Delete the rows matched by `queryset` in primary-key chunks.
+
+    Child rows are removed with raw DELETEs when `raw_cascade_plan()` says
+    it is safe; otherwise each chunk goes through Django's regular
+    delete() collector.
+
+    Args:
+        queryset: Rows to delete
+        batch_size: Rows per chunk (and per transaction)
+        pause: Seconds to sleep between chunks so other writers get the locks
+        time_budget: Stop after this many seconds (None for no limit)
+        progress: Optional callable receiving the running result dict
+
+    Returns:
+        dict: {'deleted': rows, 'cascaded': child rows, 'batches': n, 'complete': bool}
+    """
+    model = queryset.model
+    using = queryset.db
+    plan = raw_cascade_plan(model)
+    label = model._meta.label
+
+    result = {'deleted': 0, 'cascaded': 0, 'batches': 0, 'complete': False}
+    started = time.monotonic()
+
+    while True:
+        pks = list(
+            queryset.order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not pks:
+            result['complete'] = True
+            break
+
+        with transaction.atomic(using=using):
+            if plan is None:
+                deleted, per_model = model._base_manager.using(using).filter(pk__in=pks).delete()
+                own = per_model.get(label, 0)
+                result['deleted'] += own
+                result['cascaded'] += deleted - own
+            else:
+                for related_model, field_name in plan:
+                    child_db = router.db_for_write(related_model)
+                    result['cascaded'] += related_model._base_manager.using(child_db).filter(
+                        **{f'{field_name}__in': pks}
+                    )._raw_delete(child_db)
+                result['deleted'] += model._base_manager.using(using).filter(
+                    pk__in=pks
+                )._raw_delete(using)
+
+        result['batches'] += 1
+        logger.info(
+            'Purge %s: batch %d, %d rows deleted (%d cascaded)',
+            label, result['batches'], result['deleted'], result['cascaded']
+        )
+        if progress:
+            progress(dict(result))
+
+        if len(pks) < batch_size:
+            result['complete'] = True
+            break
+
+        if time_budget is not None and time.monotonic() - started >= time_budget:
+            logger.info('Purge %s: time budget exhausted, stopping early', label)
+            break
+
+        if pause:
+            time.sleep(pause)
+
+    return result
@@ -0,0 +1,67 @@
+"""
+Precompressed (.gz / .br) file variants.
+
+Files are compressed once, at build or generation time, and written next
+to the original as `<name>.gz` and `<name>.br`. nginx (gzip_static /
+brotli_static) and WhiteNoise then serve them without compressing on
+every request. Brotli output needs the optional `brotli` package.
+"""
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (
+    '.css', '.js', '.mjs', '.map', '.svg', '.json', '.xml', '.txt', '.html',
+)
+
+# Skip variants that save less than this fraction of the original size
+MIN_SAVING = 0.05
+
+
+def is_compressible(name):
+    return name.lower().endswith(COMPRESSIBLE_EXTENSIONS)
+
+
+def gzip_compress(content):
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def brotli_compress(content):
+    """Brotli-compress content; returns None when brotli is not installed."""
+    if brotli is None:
+        return None
+    return brotli.compress(content, quality=11)
+
+
+def _write_atomic(path, content):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def compress_file(path):
+    """
+    Write .gz (and .br) variants of a file.
+
+    Top-level function so it can run in a process pool.
+
+    Returns:
+        list: Paths of the variants written
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    written = []
+    for suffix, compress in (('.gz', gzip_compress), ('.br', brotli_compress)):
+        compressed = compress(content)
+        if compressed is None or len(compressed) > len(content) * (1 - MIN_SAVING):
+            continue
+        _write_atomic(path + suffix, compressed)
+        written.append(path + suffix)
+    return written
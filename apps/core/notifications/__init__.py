@@ -0,0 +1,184 @@
+"""
+WhatsApp/SMS notification dispatch.
+
+Messages are plain dicts so they can travel through Celery:
+    {'channel': 'whatsapp', 'to': '+8562055551234', 'body': '...', 'dedup_key': '...'}
+
+`send()` and `send_bulk()` drop duplicates per recipient, split the messages
+into batches and queue one `send_notification_batch` task per batch. The
+task delivers each batch over the channel backend's pooled connection,
+throttled by a shared token bucket and retried with backoff. Without
+Celery (or its broker) batches are delivered inline, without retries.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+from apps.core.utils import enqueue
+
+from .backends import NotificationError
+
+WHATSAPP = 'whatsapp'
+SMS = 'sms'
+
+DEFAULTS = {
+    'BACKENDS': {
+        WHATSAPP: 'apps.core.notifications.backends.WhatsAppBackend',
+        SMS: 'apps.core.notifications.backends.SMSBackend',
+    },
+    'RATE_LIMIT_PER_SECOND': 20,
+    'BATCH_SIZE': 50,
+    'MAX_RETRIES': 5,
+    'RETRY_BACKOFF_SECONDS': 30,
+    'DEDUP_TTL_SECONDS': 6 * 60 * 60,
+    'HTTP_POOL_SIZE': 10,
+    'HTTP_TIMEOUT_SECONDS': 10,
+}
+
+_backends = {}
+
+
+def get_config():
+    """Return notification settings merged over the defaults."""
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'NOTIFICATIONS', {}))
+    return config
+
+
+def get_backend(channel):
+    """
+    Return the (per-process) backend instance for a channel, so every task
+    in a worker reuses the same HTTP connection pool.
+    """
+    if channel not in _backends:
+        config = get_config()
+        try:
+            backend_path = config['BACKENDS'][channel]
+        except KeyError:
+            raise NotificationError(f'No backend configured for channel "{channel}"')
+        _backends[channel] = import_string(backend_path)(config)
+    return _backends[channel]
+
+
+def build_message(channel, to, body, dedup_key=None):
+    """Build a message dict."""
+    return {
+        'channel': channel,
+        'to': to,
+        'body': body,
+        'dedup_key': dedup_key or '',
+    }
+
+
+def _dedup_cache_key(message):
+    key = message.get('dedup_key') or message['body']
+    digest = hashlib.sha1(f'{message["to"]}|{key}'.encode()).hexdigest()
+    return f'notify:dedup:{message["channel"]}:{digest}'
+
+
+def release_dedup(messages):
+    """Allow messages to be sent again (used after permanent failures)."""
+    cache.delete_many([_dedup_cache_key(m) for m in messages])
+
+
+def send_bulk(messages):
+    """
+    Queue messages for delivery.
+
+    Messages already queued for the same recipient and dedup key within
+    DEDUP_TTL_SECONDS are skipped.
+
+    Returns:
+        int: Number of messages queued
+    """
+    config = get_config()
+    ttl = config['DEDUP_TTL_SECONDS']
+    batch_size = config['BATCH_SIZE']
+
+    queued = 0
+    batches = {}
+    for message in messages:
+        if not cache.add(_dedup_cache_key(message), 1, timeout=ttl):
+            continue
+
+        batch = batches.setdefault(message['channel'], [])
+        batch.append(message)
+        queued += 1
+
+        if len(batch) >= batch_size:
+            _queue_batch(batch)
+            batches[message['channel']] = []
+
+    for batch in batches.values():
+        if batch:
+            _queue_batch(batch)
+
+    return queued
+
+
+def _queue_batch(batch):
+    enqueue('apps.core.tasks.send_notification_batch', batch, fallback=deliver_now)
+
+
+def send(channel, to, body, dedup_key=None):
+    """
+    Queue a single message.
+
+    Returns:
+        bool: True if the message was queued, False if it was a duplicate
+    """
+    return send_bulk([build_message(channel, to, body, dedup_key)]) == 1
+
+
+def deliver_batch(messages):
+    """
+    Deliver a batch synchronously, honouring the provider rate limit.
+    All messages in a batch share one channel.
+
+    Returns: (sent_count, transient_failures, permanent_failures)
+    """
+    from .throttle import TokenBucket
+
+    if not messages:
+        return 0, [], []
+
+    config = get_config()
+    channel = messages[0]['channel']
+    backend = get_backend(channel)
+    bucket = TokenBucket(channel, config['RATE_LIMIT_PER_SECOND'])
+
+    sent = 0
+    transient = []
+    permanent = []
+    pending = list(messages)
+
+    while pending:
+        granted = bucket.acquire(len(pending))
+        if not granted:
+            # Provider budget exhausted for too long; retry the rest later.
+            transient.extend(pending)
+            break
+
+        chunk, pending = pending[:granted], pending[granted:]
+        chunk_sent, chunk_transient, chunk_permanent = backend.send_messages(chunk)
+        sent += chunk_sent
+        transient.extend(chunk_transient)
+        permanent.extend(chunk_permanent)
+
+    return sent, transient, permanent
+
+
+def deliver_now(messages):
+    """
+    Deliver a batch inline, without retries. Failed messages can be sent
+    again right away.
+
+    Returns:
+        int: Number of messages sent
+    """
+    sent, transient, permanent = deliver_batch(messages)
+    if transient or permanent:
+        release_dedup(transient + permanent)
+    return sent
@@ -0,0 +1,151 @@
+"""
+Notification delivery backends.
+
+A backend delivers a list of messages over a single provider connection
+pool and reports which messages failed, mirroring Django's email backends.
+"""
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationError(Exception):
+    """Permanent delivery failure; the message will not be retried."""
+
+
+class TransientNotificationError(NotificationError):
+    """Temporary delivery failure (timeout, throttling, 5xx); retry later."""
+
+
+class BaseBackend:
+    """
+    Base class for notification backends.
+    """
+
+    def __init__(self, options=None):
+        self.options = options or {}
+
+    def send_message(self, message):
+        """Deliver one message dict. Raise NotificationError on failure."""
+        raise NotImplementedError
+
+    def send_messages(self, messages):
+        """
+        Deliver a batch of messages.
+        Returns: (sent_count, transient_failures, permanent_failures)
+        """
+        sent = 0
+        transient = []
+        permanent = []
+
+        for message in messages:
+            try:
+                self.send_message(message)
+                sent += 1
+            except TransientNotificationError as exc:
+                logger.warning('Notification to %s deferred: %s', message['to'], exc)
+                transient.append(message)
+            except NotificationError as exc:
+                logger.error('Notification to %s failed: %s', message['to'], exc)
+                permanent.append(message)
+
+        return sent, transient, permanent
+
+
+class HTTPBackend(BaseBackend):
+    """
+    Backend that talks to an HTTP provider over a pooled keep-alive session.
+    """
+
+    def __init__(self, options=None):
+        super().__init__(options)
+        pool_size = self.options.get('HTTP_POOL_SIZE', 10)
+        self.timeout = self.options.get('HTTP_TIMEOUT_SECONDS', 10)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def post(self, url, **kwargs):
+        try:
+            response = self.session.post(url, timeout=self.timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout,
+                requests.exceptions.ChunkedEncodingError) as exc:
+            raise TransientNotificationError(str(exc)) from exc
+        except requests.RequestException as exc:
+            # e.g. a missing or invalid provider URL
+            raise NotificationError(str(exc)) from exc
+
+        if response.status_code == 429 or response.status_code >= 500:
+            raise TransientNotificationError(f'HTTP {response.status_code}')
+        if response.status_code >= 400:
+            raise NotificationError(f'HTTP {response.status_code}: {response.text[:200]}')
+
+        return response
+
+
+class WhatsAppBackend(HTTPBackend):
+    """
+    WhatsApp Business (Cloud API) text messages.
+    """
+
+    def __init__(self, options=None):
+        super().__init__(options)
+        config = getattr(settings, 'WHATSAPP', {})
+        api_url = config.get('API_URL', '').rstrip('/')
+        phone_number_id = config.get('PHONE_NUMBER_ID', '')
+
+        self.url = f'{api_url}/{phone_number_id}/messages'
+        self.session.headers.update({
+            'Authorization': f'Bearer {config.get("ACCESS_TOKEN", "")}',
+        })
+
+    def send_message(self, message):
+        self.post(self.url, json={
+            'messaging_product': 'whatsapp',
+            'to': message['to'].lstrip('+'),
+            'type': 'text',
+            'text': {'body': message['body']},
+        })
+
+
+class SMSBackend(HTTPBackend):
+    """
+    Generic JSON SMS gateway.
+    """
+
+    def __init__(self, options=None):
+        super().__init__(options)
+        config = getattr(settings, 'SMS', {})
+
+        self.url = config.get('API_URL', '')
+        self.sender_id = config.get('SENDER_ID', '')
+        self.session.headers.update({
+            'Authorization': f'Bearer {config.get("API_KEY", "")}',
+        })
+
+    def send_message(self, message):
+        self.post(self.url, json={
+            'from': self.sender_id,
+            'to': message['to'],
+            'text': message['body'],
+        })
+
+
+# Messages delivered through LocMemBackend, for tests and local development.
+outbox = []
+
+
+class LocMemBackend(BaseBackend):
+    """
+    Fake provider that stores messages in `outbox` instead of sending them.
+    """
+
+    def send_message(self, message):
+        outbox.append(dict(message))
+        logger.info('[%s] %s: %s', message['channel'], message['to'], message['body'])
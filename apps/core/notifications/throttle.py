@@ -0,0 +1,54 @@
+"""
+Shared provider rate limiting for outgoing notifications.
+"""
+import time
+
+from django.core.cache import cache
+
+
+class TokenBucket:
+    """
+    Token bucket shared by every worker through the cache.
+
+    The bucket holds `rate` tokens and is refilled once per second. Each
+    refill period is a separate cache counter, so concurrent workers draw
+    from the same budget with a single atomic increment.
+    """
+
+    def __init__(self, name, rate, cache_backend=None):
+        self.name = name
+        self.rate = max(1, int(rate))
+        self.cache = cache_backend or cache
+
+    def _key(self, period):
+        return f'notify:bucket:{self.name}:{period}'
+
+    def take(self, tokens=1):
+        """
+        Take up to `tokens` from the current period without blocking.
+        Returns the number of tokens granted (possibly 0).
+        """
+        key = self._key(int(time.time()))
+        self.cache.add(key, 0, timeout=5)
+        try:
+            used = self.cache.incr(key, tokens)
+        except ValueError:
+            # Key evicted between add() and incr(); start a fresh period.
+            self.cache.set(key, tokens, timeout=5)
+            used = tokens
+
+        available = self.rate - (used - tokens)
+        return max(0, min(tokens, available))
+
+    def acquire(self, tokens=1, max_wait=30):
+        """
+        Block until at least one token is available (or `max_wait` seconds
+        have passed). Returns the number of tokens granted.
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            granted = self.take(tokens)
+            if granted or time.monotonic() >= deadline:
+                return granted
+            # Sleep until the next refill.
+            time.sleep(1 - (time.time() % 1) + 0.01)
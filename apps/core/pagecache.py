@@ -0,0 +1,201 @@
+"""
+Anonymous full-page cache with surrogate-key purging.
+
+Views opt in with @cache_anonymous_page and tag their response with
+surrogate keys (`tag_page(request, 'job:<id>', ...)`). Every key has a
+version token in the cache; a cached page records the versions of its
+keys and is served only while they are unchanged. `purge(*keys)`
+replaces the tokens, which drops every page tagged with those keys in
+one cache write, without knowing which pages they are.
+
+Keys used by the public job pages:
+    jobs            any page that lists or counts jobs
+    job:<id>        a job's detail page
+    company:<id>    pages showing a company's name or logo
+    category:<id>   pages of (or showing jobs similar within) a category
+    province:<id>   a province's page
+
+Versions are read when a view tags the page, before it queries its data,
+so a purge that lands while the page renders leaves it stale (not
+cached as fresh). Keys that were never purged are given a token when
+first tagged, so a page never records a missing version (which would
+match again once a purged token is evicted).
+
+Purges only reach processes sharing the cache. With a per-process cache
+(LocMemCache) a purge in one worker, or in Celery, leaves other workers
+serving their copies, so pages are then kept for at most
+PAGE_CACHE_LOCAL_TTL seconds (0 disables page caching).
+"""
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+
+from apps.core.utils import has_shared_cache
+
+VERSION_PREFIX = 'pagecache:key:'
+PAGE_PREFIX = 'pagecache:page:'
+
+# Response headers that belong to one visitor and are never stored
+UNCACHED_HEADERS = {'set-cookie', 'vary'}
+
+
+def _ttl():
+    config = getattr(settings, 'LAO_JOBS', {})
+    ttl = config.get('PAGE_CACHE_TTL', 5 * 60)
+    if not has_shared_cache():
+        ttl = min(ttl, config.get('PAGE_CACHE_LOCAL_TTL', 30))
+    return ttl
+
+
+def purge(*keys):
+    """
+    Invalidate every cached page tagged with any of `keys`.
+    Inside a transaction this happens on commit, so a page rendered in
+    the meantime cannot be cached as fresh with the old data.
+    """
+    keys = {str(key) for key in keys if key}
+    if not keys:
+        return
+
+    def replace_versions():
+        token = uuid.uuid4().hex
+        cache.set_many({VERSION_PREFIX + key: token for key in keys}, timeout=None)
+
+    transaction.on_commit(replace_versions)
+
+
+def caching_page(request):
+    """True while the page being rendered may be stored in the page cache."""
+    return hasattr(request, '_page_cache_key')
+
+
+def tag_page(request, *keys):
+    """Tag the page being rendered with surrogate keys."""
+    if not caching_page(request):
+        return
+    keys = [VERSION_PREFIX + str(key) for key in keys if key]
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+        # Another request may have seeded (or purged) the key first
+        versions.update(cache.get_many(missing))
+    request._surrogate_keys.update({
+        key[len(VERSION_PREFIX):]: versions.get(key) for key in keys
+    })
+
+
+def cache_anonymous_page(view=None, *, on_hit=None):
+    """
+    Mark a view as cacheable for anonymous visitors (PageCacheMiddleware).
+    `on_hit(request, *args, **kwargs)` runs when a cached copy is served,
+    for side effects the view would have had (e.g. counting a view).
+    """
+    def decorate(view):
+        view.cache_anonymous_page = True
+        view.page_cache_on_hit = on_hit
+        return view
+    return decorate(view) if view is not None else decorate
+
+
+def _page_key(request):
+    url = request.build_absolute_uri()
+    return PAGE_PREFIX + hashlib.md5(url.encode()).hexdigest()
+
+
+def _is_anonymous_get(request):
+    if request.method != 'GET':
+        return False
+    # Pending flash messages are per visitor
+    if 'messages' in request.COOKIES:
+        return False
+    user = getattr(request, 'user', None)
+    return user is None or not user.is_authenticated
+
+
+class PageCacheMiddleware:
+    """
+    Serve and store anonymous GET responses of @cache_anonymous_page views.
+    Place after AuthenticationMiddleware and MessageMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        key = getattr(request, '_page_cache_key', None)
+        if key is None or getattr(response, '_page_cache_hit', False):
+            return response
+
+        if self._cacheable(request, response):
+            cache.set(key, {
+                'content': response.content,
+                'status': response.status_code,
+                'headers': [
+                    (name, value) for name, value in response.items()
+                    if name.lower() not in UNCACHED_HEADERS
+                ],
+                'keys': request._surrogate_keys,
+            }, timeout=_ttl())
+            response['X-Page-Cache'] = 'MISS'
+
+        if request._surrogate_keys:
+            response['Surrogate-Key'] = ' '.join(sorted(request._surrogate_keys))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not getattr(view_func, 'cache_anonymous_page', False):
+            return None
+        if not _is_anonymous_get(request):
+            return None
+        if _ttl() <= 0:
+            return None
+
+        key = _page_key(request)
+        entry = cache.get(key)
+        if entry is not None and self._fresh(entry):
+            response = HttpResponse(entry['content'], status=entry['status'])
+            for name, value in entry['headers']:
+                response[name] = value
+            response['X-Page-Cache'] = 'HIT'
+            if entry['keys']:
+                response['Surrogate-Key'] = ' '.join(sorted(entry['keys']))
+            response._page_cache_hit = True
+            request._page_cache_key = key
+            if view_func.page_cache_on_hit:
+                view_func.page_cache_on_hit(request, *view_args, **view_kwargs)
+            return response
+
+        request._page_cache_key = key
+        request._surrogate_keys = {}
+        return None
+
+    def _fresh(self, entry):
+        keys = entry['keys']
+        if not keys:
+            return True
+        versions = cache.get_many([VERSION_PREFIX + key for key in keys])
+        return all(
+            versions.get(VERSION_PREFIX + key) == version
+            for key, version in keys.items()
+        )
+
+    def _cacheable(self, request, response):
+        if response.status_code != 200 or response.streaming:
+            return False
+        # The page embeds a CSRF token (tied to this visitor's cookie)
+        if request.META.get('CSRF_COOKIE_NEEDS_UPDATE'):
+            return False
+        if response.cookies:
+            return False
+        cache_control = response.get('Cache-Control', '')
+        if 'private' in cache_control or 'no-store' in cache_control:
+            return False
+        return _is_anonymous_get(request)
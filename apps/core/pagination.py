@@ -0,0 +1,70 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Unlike OFFSET pagination, each page is a single index range scan no
+matter how deep the reader pages, and rows inserted meanwhile do not
+shift the page boundaries.
+"""
+import base64
+import json
+from django.db.models import Q
+
+
+def encode_cursor(values):
+    """Encode a tuple of ordering values into an opaque URL-safe cursor."""
+    raw = json.dumps([str(value) for value in values]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor produced by encode_cursor. Raises ValueError."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (TypeError, UnicodeDecodeError, json.JSONDecodeError, ValueError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list):
+        raise ValueError('Invalid cursor')
+    return values
+
+
+def keyset_filter(fields, values):
+    """
+    Build the "after this row" condition for an ordering such as
+    ('-created_at', '-id'): (a < x) OR (a = x AND b < y) ...
+    """
+    condition = Q()
+    equal = {}
+    for field, value in zip(fields, values):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        condition |= Q(**equal, **{f'{name}__{lookup}': value})
+        equal[name] = value
+    return condition
+
+
+def keyset_paginate(queryset, cursor=None, page_size=20, ordering=('-created_at', '-id')):
+    """
+    Return one page of `queryset` after `cursor`.
+
+    The ordering must end in a unique field so every row has a distinct
+    position.
+
+    Returns:
+        tuple: (items, next_cursor) - next_cursor is None on the last page
+    """
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(ordering):
+            raise ValueError('Invalid cursor')
+        queryset = queryset.filter(keyset_filter(ordering, values))
+
+    items = list(queryset[:page_size + 1])
+    if len(items) <= page_size:
+        return items, None
+
+    items = items[:page_size]
+    last = items[-1]
+    next_cursor = encode_cursor([getattr(last, field.lstrip('-')) for field in ordering])
+    return items, next_cursor
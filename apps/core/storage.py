@@ -0,0 +1,193 @@
+"""
+Storage backends.
+
+Static files: after collectstatic has hashed the static files, the service worker's
+precache manifest is generated from the hashed names and written into
+the collected `sw.js`. A deploy then changes only the URLs of assets
+whose content changed, and the service worker downloads just those.
+
+Text assets then get .gz and .br variants, compressed in a process pool,
+so nginx and WhiteNoise serve them without compressing per request.
+
+Media: content-addressed storage names uploads by a hash of their bytes,
+stores identical bytes only once and gives URLs that never change
+content, so they can be cached forever.
+"""
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, storages
+
+from .compression import compress_file, is_compressible
+
+PRECACHE_LINE = re.compile(r'^const PRECACHE_MANIFEST = .*;$', re.MULTILINE)
+
+
+class PrecompressedFilesMixin:
+    """
+    Write .gz/.br variants of compressible files after post-processing.
+    """
+    # Below this many files a process pool costs more than it saves
+    min_parallel_files = 20
+
+    def compress_files(self, names):
+        paths = [self.path(name) for name in sorted(names)]
+        if len(paths) < self.min_parallel_files:
+            results = map(compress_file, paths)
+            yield from zip(sorted(names), results)
+            return
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(compress_file, paths, chunksize=8)
+            yield from zip(sorted(names), results)
+
+    def post_process(self, paths, dry_run=False, **options):
+        names = set()
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            names.add(name)
+            if hashed_name and not isinstance(hashed_name, Exception):
+                names.add(hashed_name)
+            yield name, hashed_name, processed
+
+        if dry_run:
+            return
+
+        names = {name for name in names | set(paths) if is_compressible(name)}
+        for name, variants in self.compress_files(names):
+            for variant in variants:
+                yield name, name + os.path.splitext(variant)[1], True
+
+
+class PrecacheManifestStaticFilesStorage(PrecompressedFilesMixin, ManifestStaticFilesStorage):
+    """
+    Manifest (hashed) static files storage that also injects the
+    service worker precache manifest and precompresses text assets.
+    """
+    service_worker = 'sw.js'
+    precache_patterns = (
+        'css/*',
+        'js/*',
+        'images/*',
+        'fonts/*',
+        'manifest.json',
+    )
+
+    def precache_urls(self):
+        """Hashed URLs of the files the service worker should precache."""
+        return [
+            self.base_url + hashed_name.replace('\\', '/')
+            for name, hashed_name in sorted(self.hashed_files.items())
+            if any(fnmatch.fnmatch(name, pattern) for pattern in self.precache_patterns)
+        ]
+
+    def write_service_worker(self):
+        if not self.exists(self.service_worker):
+            return
+
+        with self.open(self.service_worker) as f:
+            source = f.read().decode('utf-8')
+
+        manifest = json.dumps(self.precache_urls())
+        content, count = PRECACHE_LINE.subn(
+            lambda match: f'const PRECACHE_MANIFEST = {manifest};',
+            source,
+            count=1
+        )
+        if not count:
+            return
+
+        self.delete(self.service_worker)
+        self._save(self.service_worker, ContentFile(content.encode('utf-8')))
+
+    def save_manifest(self):
+        super().save_manifest()
+        # Runs right after hashing, before the files are compressed
+        self.write_service_worker()
+
+
+class ContentAddressedStorageMixin:
+    """
+    Save files as `<dir>/<stem>.<hash><ext>`, where the hash covers the
+    file's bytes. Saving bytes that are already stored writes nothing
+    and returns the existing name.
+
+    Files may be shared by several records, so they should only be
+    removed by a sweep that checks for references.
+    """
+    hash_length = 16
+
+    def content_hash(self, content):
+        """SHA-256 of the content, read in chunks (never fully in memory)."""
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+        return digest.hexdigest()
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is chosen in _save from the content
+        return name
+
+    def _save(self, name, content):
+        root, ext = os.path.splitext(name)
+        name = f'{root}.{self.content_hash(content)[:self.hash_length]}{ext.lower()}'
+        if self.exists(name):
+            return name
+        return self._save_new(name, content)
+
+    def _save_new(self, name, content):
+        """Store content under a name that didn't exist a moment ago."""
+        return super()._save(name, content)
+
+
+class ContentAddressedFileSystemStorage(ContentAddressedStorageMixin, FileSystemStorage):
+    """
+    FileSystemStorage._save retries on FileExistsError with a new name
+    from get_available_name, which here is the same name, so concurrent
+    uploads of the same bytes would loop forever. Files are instead
+    written to a temporary name and hard-linked into place: the link
+    either creates a complete file or finds the one stored concurrently.
+    """
+
+    def _save_new(self, name, content):
+        full_path = self.path(name)
+        directory = os.path.dirname(full_path)
+        if self.directory_permissions_mode is not None:
+            os.makedirs(directory, mode=self.directory_permissions_mode, exist_ok=True)
+        else:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f'{full_path}.{uuid.uuid4().hex}.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in content.chunks():
+                    f.write(chunk.encode() if isinstance(chunk, str) else chunk)
+            if self.file_permissions_mode is not None:
+                os.chmod(tmp_path, self.file_permissions_mode)
+            try:
+                os.link(tmp_path, full_path)
+            except FileExistsError:
+                pass  # Stored concurrently with the same bytes
+        finally:
+            os.unlink(tmp_path)
+
+        return name
+
+
+def content_addressed_storage():
+    """
+    Storage for content-addressed uploads (callable for FileField.storage).
+    Uses STORAGES['content_addressed'] when configured, else MEDIA_ROOT.
+    """
+    if 'content_addressed' in settings.STORAGES:
+        return storages['content_addressed']
+    return ContentAddressedFileSystemStorage()
@@ -74,4 +74,34 @@ def generate_sitemap():
     with open(sitemap_path, 'w', encoding='utf-8') as f:
         f.write(xml_content)
 
+    # Precompressed variants for nginx gzip_static / WhiteNoise
+    from .compression import compress_file
+    compress_file(sitemap_path)
+
     return {'status': 'success', 'urls_count': len(urls)}
+
+
+@shared_task(bind=True)
+def send_notification_batch(self, messages):
+    """
+    Deliver a batch of WhatsApp/SMS messages.
+    Transient failures are retried with exponential backoff.
+    """
+    from apps.core.notifications import deliver_batch, get_config, release_dedup
+
+    config = get_config()
+    sent, transient, permanent = deliver_batch(messages)
+
+    if permanent:
+        release_dedup(permanent)
+
+    if transient:
+        if self.request.retries < config['MAX_RETRIES']:
+            countdown = config['RETRY_BACKOFF_SECONDS'] * (2 ** self.request.retries)
+            raise self.retry(args=[transient], countdown=countdown)
+        release_dedup(transient)
+
+    return {
+        'sent': sent,
+        'failed': len(permanent) + len(transient),
+    }
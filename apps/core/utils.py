@@ -4,10 +4,14 @@ Utility functions for Lao Jobs project.
 import random
 import string
 import hashlib
+import logging
 from datetime import datetime
 from django.utils import timezone
+from django.utils.module_loading import import_string
 from django.utils.text import slugify as django_slugify
 
+logger = logging.getLogger(__name__)
+
 
 def generate_otp(length: int = 6) -> str:
     """
@@ -26,24 +30,6 @@ def generate_reference_code(prefix: str = 'REF') -> str:
     return f'{prefix}-{date_part}-{random_part}'
 
 
-def generate_invoice_number() -> str:
-    """
-    Generate a unique invoice number.
-    Format: INV-YYYYMM-XXXXXX
-    """
-    date_part = timezone.now().strftime('%Y%m')
-    random_part = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-    return f'INV-{date_part}-{random_part}'
-
-
-def generate_payment_reference() -> str:
-    """
-    Generate a unique payment reference.
-    Format: PAY-YYYYMMDD-XXXXXXXX
-    """
-    return generate_reference_code('PAY')
-
-
 def slugify(value: str) -> str:
     """
     Create a slug from a string, handling Lao characters.
@@ -179,3 +165,71 @@ def truncate_text(text: str, max_length: int = 100) -> str:
         return text
 
     return text[:max_length - 3].rsplit(' ', 1)[0] + '...'
+
+
+def get_client_ip(request):
+    """
+    Get the client IP address from a request.
+
+    X-Forwarded-For is only trusted as far as LAO_JOBS['TRUSTED_PROXY_COUNT']
+    proxies we run in front of Django append to it: the IP is the hop that
+    many places from the right. Hops further left are sent by the client
+    and could be rotated freely, so with no trusted proxy (or a header
+    missing our proxies' hops) REMOTE_ADDR is used.
+    """
+    from django.conf import settings
+
+    proxies = getattr(settings, 'LAO_JOBS', {}).get('TRUSTED_PROXY_COUNT', 0)
+    if proxies:
+        hops = [
+            hop.strip() for hop in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')
+            if hop.strip()
+        ]
+        if len(hops) >= proxies:
+            return hops[-proxies]
+    return request.META.get('REMOTE_ADDR')
+
+
+def has_shared_cache(alias: str = 'default') -> bool:
+    """
+    Whether a cache is shared between processes (e.g. Redis), so state
+    buffered in it by one worker is seen by the others and by Celery.
+    LocMemCache is per process and DummyCache stores nothing.
+    """
+    from django.core.cache import caches
+    from django.core.cache.backends.dummy import DummyCache
+    from django.core.cache.backends.locmem import LocMemCache
+
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
+
+
+def has_celery() -> bool:
+    """Whether Celery is installed, so tasks can be queued at all."""
+    try:
+        import celery  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def enqueue(task_path: str, *args, fallback) -> bool:
+    """
+    Queue a Celery task by dotted path.
+
+    Celery is optional (task modules import it at the top), so when it is
+    not installed or the broker cannot be reached `fallback(*args)` runs
+    inline instead.
+
+    Returns:
+        bool: True if the task was queued, False if it ran inline
+    """
+    if has_celery():
+        from kombu.exceptions import OperationalError
+        try:
+            import_string(task_path).delay(*args)
+            return True
+        except OperationalError as exc:
+            logger.warning('Could not queue %s, running inline: %s', task_path, exc)
+
+    fallback(*args)
+    return False
@@ -4,7 +4,7 @@ Jobs admin configuration.
 from django.contrib import admin
 from .models import (
     Province, Category, JobPost, JobApplication,
-    SavedJob, JobAlert, QuickFilter, JobTemplate
+    SavedJob, JobAlert, QuickFilter, JobTemplate, JobDailyStat, JobImport
 )
 
 
@@ -69,6 +69,11 @@ class JobApplicationAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
     raw_id_fields = ['job_post']
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change and 'status' in form.changed_data:
+            obj.job_post.recount_unread_applications()
+
 
 @admin.register(JobAlert)
 class JobAlertAdmin(admin.ModelAdmin):
@@ -90,3 +95,20 @@ class JobTemplateAdmin(admin.ModelAdmin):
     list_filter = ['template_type', 'is_active']
     list_editable = ['sort_order', 'is_active']
     raw_id_fields = ['company', 'category']
+
+
+@admin.register(JobDailyStat)
+class JobDailyStatAdmin(admin.ModelAdmin):
+    list_display = ['job_post', 'day', 'views', 'applications', 'contact_clicks']
+    list_filter = ['day']
+    raw_id_fields = ['job_post']
+    date_hierarchy = 'day'
+
+
+@admin.register(JobImport)
+class JobImportAdmin(admin.ModelAdmin):
+    list_display = ['company', 'file', 'status', 'total_rows', 'created_count', 'error_count', 'created_at']
+    list_filter = ['status']
+    search_fields = ['company__company_name']
+    readonly_fields = ['created_at', 'updated_at', 'finished_at', 'errors']
+    raw_id_fields = ['company']
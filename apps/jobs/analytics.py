@@ -0,0 +1,147 @@
+"""
+Job analytics.
+
+Views, applications and contact-link clicks are counted in per-day cache
+counters and rolled up into JobDailyStat rows by the flush_job_analytics
+task. Without a shared cache (or Celery) the task would never see the
+counters, so events are added to the day's row directly instead.
+Employer charts are served from the rollups only.
+"""
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from apps.core.utils import has_celery, has_shared_cache
+
+VIEWS = 'views'
+APPLICATIONS = 'applications'
+CONTACT_CLICKS = 'contact_clicks'
+EVENTS = (VIEWS, APPLICATIONS, CONTACT_CLICKS)
+
+# Counters hold the running total for their day and must outlive the
+# last flush of that day.
+COUNTER_TIMEOUT = 3 * 24 * 60 * 60
+
+
+def counter_key(job_id, event, day):
+    return f'analytics:{day:%Y%m%d}:{event}:{job_id}'
+
+
+def record(job_id, event, day=None):
+    """Count one analytics event for a job."""
+    if event not in EVENTS:
+        raise ValueError(f'Unknown analytics event: {event}')
+
+    day = day or timezone.localdate()
+    if not (has_shared_cache() and has_celery()):
+        _add_to_rollup(job_id, event, day)
+        return
+
+    key = counter_key(job_id, event, day)
+    if not cache.add(key, 1, timeout=COUNTER_TIMEOUT):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, 1, timeout=COUNTER_TIMEOUT)
+
+
+def _add_to_rollup(job_id, event, day):
+    from .models import JobDailyStat
+
+    stats = JobDailyStat.objects.filter(job_post_id=job_id, day=day)
+    if stats.update(**{event: F(event) + 1}):
+        return
+    try:
+        with transaction.atomic():
+            JobDailyStat.objects.create(job_post_id=job_id, day=day, **{event: 1})
+    except IntegrityError:
+        # Created by a concurrent request (or the job is gone)
+        stats.update(**{event: F(event) + 1})
+
+
+def allow_contact_click(ip, job_id):
+    """
+    Throttle anonymous contact-click beacons: one counted click per IP
+    and job an hour, and at most CONTACT_CLICK_IP_LIMIT clicks per IP an
+    hour.
+
+    Returns:
+        bool: True if the click should be counted
+    """
+    limit = getattr(settings, 'LAO_JOBS', {}).get('CONTACT_CLICK_IP_LIMIT', 60)
+    hour = timezone.now().strftime('%Y%m%d%H')
+
+    if not cache.add(f'analytics:click:{ip}:{job_id}:{hour}', 1, timeout=60 * 60):
+        return False
+
+    ip_key = f'analytics:click:{ip}:{hour}'
+    if cache.add(ip_key, 1, timeout=60 * 60):
+        return True
+    try:
+        return cache.incr(ip_key) <= limit
+    except ValueError:
+        return cache.add(ip_key, 1, timeout=60 * 60)
+
+
+def rollup(job_ids, day):
+    """
+    Upsert the day's counter totals for the given jobs into JobDailyStat.
+    Counters are running totals, so re-running a rollup is harmless.
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    from .models import JobDailyStat
+
+    keys = {
+        counter_key(job_id, event, day): (job_id, event)
+        for job_id in job_ids
+        for event in EVENTS
+    }
+    totals = {}
+    for key, value in cache.get_many(list(keys)).items():
+        job_id, event = keys[key]
+        totals.setdefault(job_id, {})[event] = value
+
+    if not totals:
+        return 0
+
+    JobDailyStat.objects.bulk_create(
+        [JobDailyStat(job_post_id=job_id, day=day, **values) for job_id, values in totals.items()],
+        update_conflicts=True,
+        unique_fields=['job_post', 'day'],
+        update_fields=list(EVENTS),
+    )
+    return len(totals)
+
+
+def daily_series(job_posts, days=30):
+    """
+    Daily totals over the last `days` days for a queryset of job posts,
+    read from the rollup table and zero-filled.
+    """
+    from .models import JobDailyStat
+
+    end = timezone.localdate()
+    start = end - timedelta(days=days - 1)
+
+    rows = JobDailyStat.objects.filter(
+        job_post__in=job_posts,
+        day__gte=start
+    ).values('day').annotate(
+        **{event: Sum(event) for event in EVENTS}
+    )
+    by_day = {row['day']: row for row in rows}
+
+    series = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        row = by_day.get(day, {})
+        series.append({
+            'day': day.isoformat(),
+            **{event: row.get(event) or 0 for event in EVENTS},
+        })
+    return series
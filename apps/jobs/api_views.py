@@ -2,16 +2,57 @@
 Jobs API views.
 """
 import json
+import uuid
+from django.conf import settings
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.shortcuts import get_object_or_404
 from django.core.paginator import Paginator
+from django.core.exceptions import ValidationError
 from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from datetime import timedelta
 
+from . import analytics, saved
 from .models import JobPost, JobApplication, SavedJob, JobAlert
+from apps.companies.logos import prefetch_logo_urls
+from apps.core.pagination import decode_cursor, encode_cursor, keyset_paginate
 from apps.core.validators import normalize_phone_number
 
+# Matches the purge_deleted_posts window: older tombstones no longer exist
+CHANGE_FEED_RETENTION_DAYS = 60
+CHANGE_FEED_LAG_SECONDS = 5
+
+
+def serialize_job_card(job):
+    """Compact job representation used by listings and saved lists."""
+    return {
+        'id': str(job.id),
+        'title': job.title,
+        'company': {
+            'id': str(job.company.id),
+            'name': job.company.company_name,
+            'logo': job.company.logo_urls['sm']['png'] if job.company.logo else None,
+            'logo_webp': job.company.logo_urls['sm']['webp'] if job.company.logo else None,
+        },
+        'category': {
+            'id': job.category.id if job.category else None,
+            'name': job.category.name if job.category else None,
+        },
+        'province': {
+            'id': job.province.id if job.province else None,
+            'name': job.province.name if job.province else None,
+        },
+        'job_type': job.job_type,
+        'job_type_display': job.get_job_type_display(),
+        'salary_display': job.get_salary_display(),
+        'days_remaining': job.days_remaining,
+        'view_count': job.view_count,
+        'published_at': job.published_at.isoformat() if job.published_at else None,
+    }
+
 
 @require_http_methods(['GET'])
 def job_list_api(request):
@@ -59,31 +100,9 @@ def job_list_api(request):
     jobs_page = paginator.get_page(page)
 
     # Serialize
-    results = []
-    for job in jobs_page:
-        results.append({
-            'id': str(job.id),
-            'title': job.title,
-            'company': {
-                'id': str(job.company.id),
-                'name': job.company.company_name,
-                'logo': job.company.logo.url if job.company.logo else None,
-            },
-            'category': {
-                'id': job.category.id if job.category else None,
-                'name': job.category.name if job.category else None,
-            },
-            'province': {
-                'id': job.province.id if job.province else None,
-                'name': job.province.name if job.province else None,
-            },
-            'job_type': job.job_type,
-            'job_type_display': job.get_job_type_display(),
-            'salary_display': job.get_salary_display(),
-            'days_remaining': job.days_remaining,
-            'view_count': job.view_count,
-            'published_at': job.published_at.isoformat() if job.published_at else None,
-        })
+    jobs_page.object_list = list(jobs_page.object_list)
+    prefetch_logo_urls(job.company for job in jobs_page)
+    results = [serialize_job_card(job) for job in jobs_page]
 
     return JsonResponse({
         'count': paginator.count,
@@ -115,6 +134,7 @@ def job_detail_api(request, job_id):
             'id': str(job.company.id),
             'name': job.company.company_name,
             'logo': job.company.logo.url if job.company.logo else None,
+            'logo_variants': job.company.logo_urls,
             'description': job.company.description,
         },
         'category': {
@@ -142,6 +162,93 @@ def job_detail_api(request, job_id):
     })
 
 
+@require_http_methods(['GET'])
+def job_changes_api(request):
+    """
+    Change feed for offline clients.
+
+    Without a cursor, pages through every live job (initial sync). After
+    that, the `next_cursor` from the previous response returns only jobs
+    published, updated, closed, expired or deleted since then, oldest
+    change first; non-live jobs come back as tombstones. A cursor issued
+    longer ago than the feed retention (purged jobs leave no tombstone)
+    gets {"reset": true}: the client should drop its copy and resync.
+
+    Cursor: [updated_at, id, issued_at, snapshot] of the last job returned.
+    """
+    now = timezone.now()
+    position, snapshot = None, True
+
+    cursor = request.GET.get('cursor')
+    if cursor:
+        try:
+            changed_at, job_id, issued_at, snapshot = decode_cursor(cursor)
+            issued_at = parse_datetime(issued_at)
+            if issued_at is None:
+                raise ValueError('Invalid cursor')
+        except (TypeError, ValueError):
+            return JsonResponse({'error': 'Invalid cursor'}, status=400)
+        if issued_at < now - timedelta(days=CHANGE_FEED_RETENTION_DAYS):
+            return JsonResponse({'reset': True, 'results': [], 'next_cursor': None})
+        position = encode_cursor([changed_at, job_id]) if changed_at else None
+        snapshot = snapshot == 'True'
+
+    try:
+        page_size = min(int(request.GET.get('page_size', 100)), 500)
+    except ValueError:
+        page_size = 100
+
+    # Skip the last few seconds: a transaction still in flight may commit
+    # rows stamped before the newest visible one.
+    queryset = JobPost.all_objects.filter(
+        updated_at__lte=now - timedelta(seconds=CHANGE_FEED_LAG_SECONDS)
+    ).exclude(
+        status=JobPost.Status.DRAFT,
+        published_at__isnull=True
+    ).select_related('company', 'category', 'province')
+    if snapshot:
+        queryset = queryset.filter(
+            Q(expires_at__isnull=True) | Q(expires_at__gt=now),
+            status='published',
+            is_deleted=False
+        )
+
+    try:
+        jobs, more = keyset_paginate(
+            queryset, position, page_size, ordering=('updated_at', 'id')
+        )
+    except (ValueError, ValidationError):
+        return JsonResponse({'error': 'Invalid cursor'}, status=400)
+
+    prefetch_logo_urls(job.company for job in jobs)
+    results = []
+    for job in jobs:
+        status = tombstone_status(job)
+        if status:
+            change = {'id': str(job.id), 'status': status, 'tombstone': True}
+        else:
+            change = serialize_job_card(job)
+        change['updated_at'] = job.updated_at.isoformat()
+        results.append(change)
+
+    if jobs:
+        changed_at, job_id = jobs[-1].updated_at, jobs[-1].id
+    elif position:
+        changed_at, job_id = decode_cursor(position)
+    else:
+        changed_at, job_id = '', ''
+
+    # The initial sync switches to deltas once it has paged through
+    next_cursor = encode_cursor([changed_at, job_id, now, bool(snapshot and more)])
+
+    return JsonResponse({
+        'reset': False,
+        'results': results,
+        'next_cursor': next_cursor,
+        'has_more': more is not None,
+    })
+
+
 @csrf_exempt
 @require_http_methods(['POST'])
 def job_apply_api(request, job_id):
@@ -195,6 +302,7 @@ def job_apply_api(request, job_id):
         email=email,
         cover_message=cover_message,
     )
+    analytics.record(job.pk, analytics.APPLICATIONS)
 
     return JsonResponse({
         'success': True,
@@ -205,41 +313,203 @@ def job_apply_api(request, job_id):
 
 @csrf_exempt
 @require_http_methods(['POST'])
+def contact_click_api(request, job_id):
+    """
+    API endpoint for tracking contact-link clicks (sent as a beacon).
+    Only published jobs are counted, throttled per IP.
+    """
+    from django.core.cache import cache
+    from apps.core.utils import get_client_ip
+
+    # Whether the job is live, cached so bots can't turn clicks into queries
+    live = cache.get_or_set(
+        f'job:{job_id}:published',
+        lambda: JobPost.objects.filter(
+            id=job_id, status='published', is_deleted=False
+        ).exists(),
+        timeout=5 * 60,
+    )
+    if not live:
+        return JsonResponse({'error': 'ບໍ່ພົບວຽກ'}, status=404)
+
+    if not analytics.allow_contact_click(get_client_ip(request), job_id):
+        return JsonResponse({'success': False}, status=429)
+
+    analytics.record(job_id, analytics.CONTACT_CLICKS)
+    return JsonResponse({'success': True})
+
+
+@csrf_exempt
+@require_http_methods(['POST', 'DELETE'])
 def save_job_api(request, job_id):
     """
     API endpoint for saving/unsaving a job.
+    Saved IDs are kept in a signed cookie: no session, no database write.
+    POST toggles (or sets {"saved": true/false}); DELETE unsaves.
     """
-    job = get_object_or_404(
-        JobPost,
-        id=job_id,
-        status='published',
-        is_deleted=False
-    )
+    job_id = str(job_id)
+    ids = saved.get_saved_ids(request)
+
+    if request.method == 'DELETE':
+        want_saved = False
+    else:
+        try:
+            data = json.loads(request.body or '{}')
+        except json.JSONDecodeError:
+            data = {}
+        if not isinstance(data, dict):
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+        want_saved = data.get('saved', job_id not in ids)
+        # Only real JSON booleans: bool("false") would save the job
+        if not isinstance(want_saved, bool):
+            return JsonResponse({'error': '"saved" must be true or false'}, status=400)
+
+    if want_saved:
+        if job_id not in ids:
+            if not JobPost.objects.filter(id=job_id, status='published', is_deleted=False).exists():
+                return JsonResponse({'error': 'ບໍ່ພົບວຽກນີ້'}, status=404)
+            ids.insert(0, job_id)
+        message = 'ບັນທຶກວຽກສຳເລັດ'
+    else:
+        ids = [saved_id for saved_id in ids if saved_id != job_id]
+        message = 'ລົບອອກຈາກລາຍການບັນທຶກ'
+
+    ids = saved.clean_ids(ids)
+    token = saved.dumps(ids)
+    response = JsonResponse({
+        'saved': want_saved,
+        'message': message,
+        'ids': ids,
+        'token': token,
+    })
+    return saved.set_saved_cookie(response, token)
 
-    # Get or create session key
-    if not request.session.session_key:
-        request.session.create()
-    session_key = request.session.session_key
 
-    # Toggle save
-    saved, created = SavedJob.objects.get_or_create(
-        job_post=job,
-        session_key=session_key,
-    )
+def tombstone_status(job):
+    """
+    Why a job is no longer live: 'deleted', 'expired' or 'closed'.
+    Returns None for a live (published, unexpired) job.
+    """
+    if job is None or job.is_deleted:
+        return 'deleted'
+    if job.status == JobPost.Status.EXPIRED or job.is_expired:
+        return 'expired'
+    if job.status != JobPost.Status.PUBLISHED:
+        return 'closed'
+    return None
+
+
+def lookup_job_cards(ids):
+    """
+    Fetch job cards for a list of IDs in one query, keeping their order.
+    Jobs that are no longer live (closed, expired, deleted or missing)
+    come back as tombstones so clients can drop or grey them out.
+
+    Returns:
+        list: Card dicts; tombstones are {'id', 'status', 'tombstone': True}
+    """
+    jobs = JobPost.objects.filter(
+        id__in=ids
+    ).select_related('company', 'category', 'province')
+    by_id = {str(job.id): job for job in jobs}
+    prefetch_logo_urls(job.company for job in by_id.values())
+
+    results = []
+    for job_id in ids:
+        job = by_id.get(job_id)
+        status = tombstone_status(job)
+        if status:
+            results.append({'id': job_id, 'status': status, 'tombstone': True})
+        else:
+            results.append(serialize_job_card(job))
+    return results
+
+
+@require_http_methods(['GET'])
+def job_batch_api(request):
+    """
+    Batch lookup: compact cards for up to JOB_BATCH_MAX job IDs in one query.
+    IDs are passed as ?ids=<uuid>,<uuid>,... (or repeated ids params).
+    """
+    max_ids = getattr(settings, 'LAO_JOBS', {}).get('JOB_BATCH_MAX', 100)
+
+    ids = []
+    for value in request.GET.getlist('ids'):
+        for part in value.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                job_id = str(uuid.UUID(part))
+            except ValueError:
+                return JsonResponse({'error': f'ລະຫັດວຽກບໍ່ຖືກຕ້ອງ: {part}'}, status=400)
+            if job_id not in ids:
+                ids.append(job_id)
+
+    if len(ids) > max_ids:
+        return JsonResponse(
+            {'error': f'ຂໍໄດ້ສູງສຸດ {max_ids} ວຽກຕໍ່ຄັ້ງ'},
+            status=400
+        )
+
+    return JsonResponse({'results': lookup_job_cards(ids) if ids else []})
 
-    if not created:
-        saved.delete()
-        return JsonResponse({
-            'saved': False,
-            'message': 'ລົບອອກຈາກລາຍການບັນທຶກ'
-        })
+
+@require_http_methods(['GET'])
+def saved_jobs_api(request):
+    """
+    Hydrate the visitor's saved jobs in one query.
+    IDs come from the signed cookie, or a `token` query parameter.
+    """
+    token = request.GET.get('token')
+    ids = saved.loads(token) if token else saved.get_saved_ids(request)
+    results = lookup_job_cards(ids) if ids else []
 
     return JsonResponse({
-        'saved': True,
-        'message': 'ບັນທຶກວຽກສຳເລັດ'
+        'count': sum(1 for result in results if not result.get('tombstone')),
+        'ids': ids,
+        'results': results,
     })
 
 
+@csrf_exempt
+@require_http_methods(['POST'])
+def sync_saved_jobs_api(request):
+    """
+    Optional sync: merge IDs kept by the client (e.g. local storage) into
+    the signed cookie. Visitors who already have a session (logged in)
+    also get the list persisted as SavedJob rows, in one bulk insert.
+    """
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+
+    if not isinstance(data, dict):
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+
+    client_ids = data.get('ids') or []
+    if not isinstance(client_ids, list):
+        return JsonResponse({'error': 'ids must be a list'}, status=400)
+
+    ids = saved.clean_ids(client_ids + saved.get_saved_ids(request))
+
+    session_key = request.session.session_key
+    if session_key and ids:
+        existing = set(JobPost.objects.filter(
+            id__in=ids,
+            is_deleted=False
+        ).values_list('id', flat=True))
+        SavedJob.objects.bulk_create(
+            [SavedJob(job_post_id=job_id, session_key=session_key) for job_id in existing],
+            ignore_conflicts=True,
+        )
+
+    token = saved.dumps(ids)
+    response = JsonResponse({'success': True, 'ids': ids, 'token': token})
+    return saved.set_saved_cookie(response, token)
+
+
 @csrf_exempt
 @require_http_methods(['POST'])
 def create_job_alert_api(request):
@@ -107,11 +107,8 @@ class JobPostForm(forms.ModelForm):
         salary_negotiable = cleaned_data.get('salary_negotiable')
 
         # Validate salary range
-        if not salary_negotiable and salary_min and salary_max:
-            if salary_min > salary_max:
-                raise forms.ValidationError(
-                    'ເງິນເດືອນຕ່ຳສຸດຕ້ອງໜ້ອຍກວ່າສູງສຸດ'
-                )
+        if not salary_negotiable:
+            validate_salary_range(salary_min, salary_max)
 
         return cleaned_data
 
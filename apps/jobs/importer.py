@@ -0,0 +1,253 @@
+"""
+Bulk job import from CSV/XLSX files.
+
+Files are parsed row by row (never loaded whole), each row is validated
+with the JobPostForm rules, category/province names are resolved from an
+in-memory lookup, and valid rows are inserted with bulk_create in chunks.
+Imported jobs are created as drafts. The file is read once up front, so
+files over the row limit (or unreadable ones) are rejected before
+anything is inserted.
+"""
+import csv
+import io
+import logging
+from django import forms
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.companies.stats import invalidate_dashboard_stats
+from .forms import JobPostForm
+from .models import JobPost, JobImport, Category, Province
+
+logger = logging.getLogger(__name__)
+
+CSV = 'csv'
+XLSX = 'xlsx'
+FORMATS = (CSV, XLSX)
+
+CHUNK_SIZE = 200
+MAX_REPORTED_ERRORS = 500
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 'x', 'ແມ່ນ', 'ຕາມຕົກລົງ'}
+
+
+class ImportFileError(Exception):
+    """Raised when an import file cannot be read at all."""
+    pass
+
+
+def get_file_format(filename):
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension not in FORMATS:
+        raise ImportFileError('ປະເພດໄຟລ໌ບໍ່ຖືກຕ້ອງ. ອະນຸຍາດ: CSV, XLSX')
+    return extension
+
+
+def _normalize_header(value):
+    return str(value or '').strip().lower().replace(' ', '_')
+
+
+def iter_rows(fileobj, file_format):
+    """
+    Yield one dict per data row, keyed by normalized header names.
+    """
+    if file_format == CSV:
+        text = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+        reader = csv.reader(text)
+        header = [_normalize_header(value) for value in next(reader, [])]
+        for values in reader:
+            if any(value.strip() for value in values):
+                yield dict(zip(header, values))
+        return
+
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFileError('ບໍ່ຮອງຮັບໄຟລ໌ XLSX ໃນເຊີບເວີນີ້. ກະລຸນາໃຊ້ CSV')
+
+    try:
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    except Exception:
+        raise ImportFileError('ບໍ່ສາມາດອ່ານໄຟລ໌ XLSX ໄດ້')
+
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [_normalize_header(value) for value in next(rows, ())]
+        for values in rows:
+            values = ['' if value is None else str(value) for value in values]
+            if any(value.strip() for value in values):
+                yield dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+def build_lookup(queryset):
+    """Map lower-cased names and slugs to objects, for name resolution."""
+    lookup = {}
+    for obj in queryset:
+        for key in (obj.name, obj.name_en, obj.slug):
+            if key:
+                lookup[key.strip().lower()] = obj
+    return lookup
+
+
+class JobImportRowForm(JobPostForm):
+    """
+    JobPostForm for one import row: category and province are given by
+    name and resolved from preloaded lookups instead of per-row queries.
+    """
+    category = forms.CharField()
+    province = forms.CharField()
+
+    def __init__(self, *args, categories=None, provinces=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.categories = categories or {}
+        self.provinces = provinces or {}
+
+    def clean_category(self):
+        return self._resolve(self.cleaned_data['category'], self.categories, 'ບໍ່ພົບໝວດໝູ່')
+
+    def clean_province(self):
+        return self._resolve(self.cleaned_data['province'], self.provinces, 'ບໍ່ພົບແຂວງ')
+
+    def _resolve(self, value, lookup, message):
+        obj = lookup.get(value.strip().lower())
+        if obj is None:
+            raise forms.ValidationError(f'{message}: {value}')
+        return obj
+
+    def _get_validation_exclusions(self):
+        # Already resolved from the active lookups; skip the FK exists() queries
+        return super()._get_validation_exclusions() | {'category', 'province'}
+
+
+def _row_data(row, job_types):
+    """Turn a raw row into form data."""
+    data = {key: (value or '').strip() for key, value in row.items() if key}
+
+    negotiable = data.get('salary_negotiable', '').lower()
+    data['salary_negotiable'] = 'true' if negotiable in TRUE_VALUES else ''
+
+    job_type = data.get('job_type', '')
+    data['job_type'] = job_types.get(job_type.lower(), job_type) or JobPost.JobType.FULL_TIME
+    data.setdefault('positions_count', '1')
+    if not data['positions_count']:
+        data['positions_count'] = '1'
+    return data
+
+
+def _file_error(message):
+    return {'row': None, 'errors': {'__all__': [{'message': message, 'code': 'file'}]}}
+
+
+def _check_row_count(job_import, file_format, max_rows):
+    with job_import.file.open('rb') as fileobj:
+        for count, _ in enumerate(iter_rows(fileobj, file_format), start=1):
+            if count > max_rows:
+                raise ImportFileError(f'ໄຟລ໌ມີເກີນ {max_rows} ແຖວ')
+
+
+def run_import(import_id):
+    """
+    Run a pending import by id. Used by `process_job_import`, or inline
+    when Celery is unavailable.
+
+    Returns:
+        dict: Result with status
+    """
+    try:
+        job_import = JobImport.objects.get(id=import_id, status=JobImport.Status.PENDING)
+    except JobImport.DoesNotExist:
+        return {'status': 'skipped'}
+
+    job_import = import_jobs(job_import)
+    return {
+        'status': job_import.status,
+        'created': job_import.created_count,
+        'errors': job_import.error_count,
+    }
+
+
+def import_jobs(job_import):
+    """
+    Run an import: parse, validate, bulk insert and record the report.
+
+    Returns:
+        JobImport: The updated import
+    """
+    max_rows = getattr(settings, 'LAO_JOBS', {}).get('JOB_IMPORT_MAX_ROWS', 2000)
+
+    job_import.status = JobImport.Status.PROCESSING
+    job_import.save(update_fields=['status', 'updated_at'])
+
+    categories = build_lookup(Category.active_objects.all())
+    provinces = build_lookup(Province.active_objects.all())
+    job_types = {label.lower(): value for value, label in JobPost.JobType.choices}
+    job_types.update({value: value for value in JobPost.JobType.values})
+
+    errors = []
+    error_count = 0
+    created = 0
+    total = 0
+    pending = []
+
+    def flush():
+        nonlocal created
+        with transaction.atomic():
+            JobPost.objects.bulk_create(pending)
+        created += len(pending)
+        pending.clear()
+        JobImport.objects.filter(pk=job_import.pk).update(
+            total_rows=total, created_count=created, error_count=error_count
+        )
+
+    try:
+        file_format = get_file_format(job_import.file.name)
+        _check_row_count(job_import, file_format, max_rows)
+        with job_import.file.open('rb') as fileobj:
+            for number, row in enumerate(iter_rows(fileobj, file_format), start=2):
+                total += 1
+                form = JobImportRowForm(
+                    _row_data(row, job_types),
+                    categories=categories,
+                    provinces=provinces,
+                )
+                if not form.is_valid():
+                    error_count += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append({'row': number, 'errors': form.errors.get_json_data()})
+                    continue
+
+                job = form.save(commit=False)
+                job.company_id = job_import.company_id
+                job.status = JobPost.Status.DRAFT
+                pending.append(job)
+                if len(pending) >= CHUNK_SIZE:
+                    flush()
+
+        if pending:
+            flush()
+        job_import.status = JobImport.Status.COMPLETED
+    except (ImportFileError, UnicodeDecodeError, csv.Error) as e:
+        message = str(e) if isinstance(e, ImportFileError) else 'ບໍ່ສາມາດອ່ານໄຟລ໌ໄດ້. ກະລຸນາໃຊ້ UTF-8'
+        errors.insert(0, _file_error(message))
+        if pending:
+            flush()
+        # Only possible if the file changed after the up-front check
+        job_import.status = JobImport.Status.COMPLETED if created else JobImport.Status.FAILED
+    except Exception:
+        logger.exception('Job import %s failed', job_import.pk)
+        errors.insert(0, _file_error('ເກີດຂໍ້ຜິດພາດ. ກະລຸນາລອງໃໝ່'))
+        job_import.status = JobImport.Status.FAILED
+
+    job_import.total_rows = total
+    job_import.created_count = created
+    job_import.error_count = error_count
+    job_import.errors = errors
+    job_import.finished_at = timezone.now()
+    job_import.save()
+
+    invalidate_dashboard_stats(job_import.company_id)
+
+    return job_import
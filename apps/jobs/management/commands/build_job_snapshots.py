@@ -0,0 +1,16 @@
+"""
+Build the offline job snapshots.
+"""
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the per-province/category offline job snapshots and their index'
+
+    def handle(self, *args, **options):
+        from apps.jobs.snapshots import build_snapshots
+
+        result = build_snapshots()
+        self.stdout.write(self.style.SUCCESS(
+            f'Built {result["snapshots"]} snapshots, removed {result["removed"]} stale files'
+        ))
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobDailyStat',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('day', models.DateField(verbose_name='ວັນທີ')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='ຍອດເບິ່ງ')),
+                ('applications', models.PositiveIntegerField(default=0, verbose_name='ໃບສະໝັກ')),
+                ('contact_clicks', models.PositiveIntegerField(default=0, verbose_name='ກົດຕິດຕໍ່')),
+                ('job_post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='jobs.jobpost', verbose_name='ໂພສວຽກ')),
+            ],
+            options={
+                'verbose_name': 'ສະຖິຕິລາຍວັນ',
+                'verbose_name_plural': 'ສະຖິຕິລາຍວັນ',
+                'ordering': ['-day'],
+                'unique_together': {('job_post', 'day')},
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill(apps, schema_editor):
+    JobApplication = apps.get_model('jobs', 'JobApplication')
+    JobPost = apps.get_model('jobs', 'JobPost')
+
+    JobApplication.objects.update(
+        company=models.Subquery(
+            JobPost.objects.filter(pk=models.OuterRef('job_post_id')).values('company_id')[:1]
+        )
+    )
+    JobPost.objects.update(
+        unread_applications_count=Coalesce(
+            models.Subquery(
+                JobApplication.objects.filter(
+                    job_post=models.OuterRef('pk'),
+                    status='new'
+                ).values('job_post').annotate(c=models.Count('id')).values('c')[:1]
+            ),
+            0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0003_company_subscription_entitlement'),
+        ('jobs', '0002_jobdailystat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='company',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='companies.company', verbose_name='ບໍລິສັດ'),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='unread_applications_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='ໃບສະໝັກໃໝ່'),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='jobapplication',
+            name='company',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='companies.company', verbose_name='ບໍລິສັດ'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job_post', 'status', 'created_at'], name='jobs_jobapp_job_pos_43eed6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['company', 'status', 'created_at'], name='jobs_jobapp_company_9ffaa2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['company', 'created_at'], name='jobs_jobapp_company_133b3e_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:46
+
+import apps.jobs.models
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0003_company_subscription_entitlement'),
+        ('jobs', '0003_application_inbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobImport',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='ວັນທີສ້າງ')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='ວັນທີອັບເດດ')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('file', models.FileField(upload_to=apps.jobs.models.job_import_path, verbose_name='ໄຟລ໌')),
+                ('status', models.CharField(choices=[('pending', 'ລໍຖ້າ'), ('processing', 'ກຳລັງນຳເຂົ້າ'), ('completed', 'ສຳເລັດ'), ('failed', 'ລົ້ມເຫຼວ')], default='pending', max_length=20, verbose_name='ສະຖານະ')),
+                ('total_rows', models.PositiveIntegerField(default=0, verbose_name='ຈຳນວນແຖວ')),
+                ('created_count', models.PositiveIntegerField(default=0, verbose_name='ສ້າງແລ້ວ')),
+                ('error_count', models.PositiveIntegerField(default=0, verbose_name='ຜິດພາດ')),
+                ('errors', models.JSONField(blank=True, default=list, verbose_name='ລາຍງານຂໍ້ຜິດພາດ')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='ສຳເລັດເມື່ອ')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_imports', to='companies.company', verbose_name='ບໍລິສັດ')),
+            ],
+            options={
+                'verbose_name': 'ນຳເຂົ້າວຽກ',
+                'verbose_name_plural': 'ນຳເຂົ້າວຽກ',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
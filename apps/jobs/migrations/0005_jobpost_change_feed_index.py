@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0003_company_subscription_entitlement'),
+        ('jobs', '0004_jobimport'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['updated_at', 'id'], name='jobs_jobpos_updated_fe1560_idx'),
+        ),
+    ]
@@ -8,6 +8,8 @@ from django.utils import timezone
 from django.contrib.postgres.search import SearchVectorField
 from django.contrib.postgres.indexes import GinIndex
 from apps.core.models import TimeStampedModel, SoftDeleteModel, ActiveModel, SortableModel
+from apps.companies.stats import invalidate_dashboard_stats
+from apps.core import pagecache
 
 
 class Province(TimeStampedModel, ActiveModel, SortableModel):
@@ -37,6 +39,10 @@ class Province(TimeStampedModel, ActiveModel, SortableModel):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        pagecache.purge('jobs', f'province:{self.pk}')
+
     def get_job_count(self):
         return self.job_posts.filter(status='published').count()
 
@@ -73,6 +79,10 @@ class Category(TimeStampedModel, ActiveModel, SortableModel):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        pagecache.purge('jobs', f'category:{self.pk}')
+
     def get_job_count(self):
         return self.job_posts.filter(status='published').count()
 
@@ -218,6 +228,10 @@ class JobPost(TimeStampedModel, SoftDeleteModel):
         default=0,
         verbose_name='ຈຳນວນເບິ່ງ'
     )
+    unread_applications_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='ໃບສະໝັກໃໝ່'
+    )
 
     # Full-text search (PostgreSQL only)
     # search_vector = SearchVectorField(null=True)
@@ -232,6 +246,8 @@ class JobPost(TimeStampedModel, SoftDeleteModel):
             models.Index(fields=['company', 'status']),
             models.Index(fields=['category', 'status']),
             models.Index(fields=['province', 'status']),
+            # Change feed (api job_changes_api)
+            models.Index(fields=['updated_at', 'id']),
             # GinIndex(fields=['search_vector']),  # For PostgreSQL
         ]
 
@@ -249,10 +265,52 @@ class JobPost(TimeStampedModel, SoftDeleteModel):
         self.expires_at = self.published_at + timedelta(days=expiry_days)
         self.save()
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_dashboard_stats(self.company_id)
+        pagecache.purge('jobs', f'job:{self.pk}', f'category:{self.category_id}')
+
+    def recount_unread_applications(self):
+        """Recompute the unread applications counter from scratch."""
+        count = self.applications.filter(status=JobApplication.Status.NEW).count()
+        JobPost.all_objects.filter(pk=self.pk).update(unread_applications_count=count)
+        self.unread_applications_count = count
+        invalidate_dashboard_stats(self.company_id)
+
+    @property
+    def view_count_cache_key(self):
+        return f'job:{self.pk}:views'
+
     def increment_view(self):
-        """Increment view count."""
+        """
+        Increment view count.
+        With a shared cache, views are buffered there and written back in
+        batches by the update_job_view_counts task. A per-process cache
+        is never seen by that task, so the row is updated directly.
+        """
+        JobPost.record_view(self.pk)
         self.view_count += 1
-        self.save(update_fields=['view_count'])
+
+    @staticmethod
+    def record_view(job_id):
+        """Count a view of a job without loading it (see increment_view)."""
+        from django.core.cache import cache
+        from django.db.models import F
+        from apps.core.utils import has_shared_cache
+        from . import analytics
+
+        analytics.record(job_id, analytics.VIEWS)
+
+        if not has_shared_cache():
+            JobPost.all_objects.filter(pk=job_id).update(view_count=F('view_count') + 1)
+            return
+
+        key = f'job:{job_id}:views'
+        if not cache.add(key, 1, timeout=None):
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.add(key, 1, timeout=None)
 
     @property
     def is_expired(self):
@@ -299,6 +357,14 @@ class JobApplication(TimeStampedModel):
         related_name='applications',
         verbose_name='ໂພສວຽກ'
     )
+    # Denormalized from job_post so the employer inbox is one index scan
+    company = models.ForeignKey(
+        'companies.Company',
+        on_delete=models.CASCADE,
+        related_name='applications',
+        editable=False,
+        verbose_name='ບໍລິສັດ'
+    )
 
     # Applicant info
     full_name = models.CharField(
@@ -336,10 +402,52 @@ class JobApplication(TimeStampedModel):
         verbose_name_plural = 'ໃບສະໝັກ'
         ordering = ['-created_at']
         unique_together = ['job_post', 'phone_normalized']
+        indexes = [
+            models.Index(fields=['job_post', 'status', 'created_at']),
+            models.Index(fields=['company', 'status', 'created_at']),
+            models.Index(fields=['company', 'created_at']),
+        ]
 
     def __str__(self):
         return f'{self.full_name} - {self.job_post.title}'
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        if not self.company_id:
+            self.company_id = self.job_post.company_id
+        super().save(*args, **kwargs)
+
+        if adding and self.status == self.Status.NEW:
+            JobPost.all_objects.filter(pk=self.job_post_id).update(
+                unread_applications_count=models.F('unread_applications_count') + 1
+            )
+            invalidate_dashboard_stats(self.company_id)
+
+    def set_status(self, status):
+        """
+        Change the application status, keeping the job's unread
+        counter in step when an application leaves the NEW state.
+        """
+        if status == self.status:
+            return
+
+        was_new = self.status == self.Status.NEW
+        self.status = status
+        self.save(update_fields=['status', 'updated_at'])
+
+        if was_new:
+            JobPost.all_objects.filter(
+                pk=self.job_post_id,
+                unread_applications_count__gt=0
+            ).update(
+                unread_applications_count=models.F('unread_applications_count') - 1
+            )
+        elif status == self.Status.NEW:
+            JobPost.all_objects.filter(pk=self.job_post_id).update(
+                unread_applications_count=models.F('unread_applications_count') + 1
+            )
+        invalidate_dashboard_stats(self.company_id)
+
 
 class SavedJob(TimeStampedModel):
     """
@@ -563,3 +671,113 @@ class JobTemplate(TimeStampedModel, ActiveModel, SortableModel):
 
     def __str__(self):
         return self.name
+
+
+class JobDailyStat(models.Model):
+    """
+    Per-job daily analytics rollup (views, applications, contact clicks).
+    Filled from cache counters by the flush_job_analytics task, or
+    directly when there is no shared cache (see analytics.record).
+    """
+    id = models.BigAutoField(primary_key=True)
+    job_post = models.ForeignKey(
+        JobPost,
+        on_delete=models.CASCADE,
+        related_name='daily_stats',
+        verbose_name='ໂພສວຽກ'
+    )
+    day = models.DateField(
+        verbose_name='ວັນທີ'
+    )
+    views = models.PositiveIntegerField(
+        default=0,
+        verbose_name='ຍອດເບິ່ງ'
+    )
+    applications = models.PositiveIntegerField(
+        default=0,
+        verbose_name='ໃບສະໝັກ'
+    )
+    contact_clicks = models.PositiveIntegerField(
+        default=0,
+        verbose_name='ກົດຕິດຕໍ່'
+    )
+
+    class Meta:
+        verbose_name = 'ສະຖິຕິລາຍວັນ'
+        verbose_name_plural = 'ສະຖິຕິລາຍວັນ'
+        ordering = ['-day']
+        unique_together = ['job_post', 'day']
+
+    def __str__(self):
+        return f'{self.job_post_id} - {self.day}'
+
+
+def job_import_path(instance, filename):
+    """Generate upload path for job import files."""
+    return f'imports/{instance.company_id}/{instance.id}/{filename}'
+
+
+class JobImport(TimeStampedModel):
+    """
+    Bulk job import from an uploaded CSV/XLSX file.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'ລໍຖ້າ'
+        PROCESSING = 'processing', 'ກຳລັງນຳເຂົ້າ'
+        COMPLETED = 'completed', 'ສຳເລັດ'
+        FAILED = 'failed', 'ລົ້ມເຫຼວ'
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+    company = models.ForeignKey(
+        'companies.Company',
+        on_delete=models.CASCADE,
+        related_name='job_imports',
+        verbose_name='ບໍລິສັດ'
+    )
+    file = models.FileField(
+        upload_to=job_import_path,
+        verbose_name='ໄຟລ໌'
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name='ສະຖານະ'
+    )
+
+    # Progress
+    total_rows = models.PositiveIntegerField(
+        default=0,
+        verbose_name='ຈຳນວນແຖວ'
+    )
+    created_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='ສ້າງແລ້ວ'
+    )
+    error_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='ຜິດພາດ'
+    )
+    errors = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name='ລາຍງານຂໍ້ຜິດພາດ'
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='ສຳເລັດເມື່ອ'
+    )
+
+    class Meta:
+        verbose_name = 'ນຳເຂົ້າວຽກ'
+        verbose_name_plural = 'ນຳເຂົ້າວຽກ'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f'{self.company_id} - {self.file.name}'
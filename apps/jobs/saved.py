@@ -0,0 +1,65 @@
+"""
+Stateless saved jobs for anonymous visitors.
+
+The saved job IDs travel in a signed cookie, so saving a job needs no
+session and no database write. Tampered or malformed tokens are treated
+as an empty list.
+"""
+import uuid
+
+from django.conf import settings
+from django.core import signing
+
+COOKIE_NAME = 'saved_jobs'
+SALT = 'apps.jobs.saved'
+COOKIE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def max_saved_jobs():
+    return getattr(settings, 'LAO_JOBS', {}).get('SAVED_JOBS_MAX', 100)
+
+
+def clean_ids(values):
+    """Deduplicate and validate job IDs, keeping order (newest first)."""
+    ids = []
+    for value in values or []:
+        try:
+            job_id = str(uuid.UUID(str(value)))
+        except ValueError:
+            continue
+        if job_id not in ids:
+            ids.append(job_id)
+    return ids[:max_saved_jobs()]
+
+
+def dumps(ids):
+    """Sign a list of job IDs into a compact token."""
+    return signing.dumps(clean_ids(ids), salt=SALT, compress=True)
+
+
+def loads(token):
+    """Read job IDs from a token; an invalid token reads as empty."""
+    if not token:
+        return []
+    try:
+        return clean_ids(signing.loads(token, salt=SALT))
+    except (signing.BadSignature, TypeError, ValueError):
+        return []
+
+
+def get_saved_ids(request):
+    """Saved job IDs from the request's cookie."""
+    return loads(request.COOKIES.get(COOKIE_NAME))
+
+
+def set_saved_cookie(response, token):
+    """Store a saved jobs token (from dumps) on the response."""
+    response.set_cookie(
+        COOKIE_NAME,
+        token,
+        max_age=COOKIE_MAX_AGE,
+        httponly=True,
+        samesite='Lax',
+        secure=getattr(settings, 'SESSION_COOKIE_SECURE', False),
+    )
+    return response
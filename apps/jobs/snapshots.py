@@ -0,0 +1,201 @@
+"""
+Offline job snapshots.
+
+Published job cards are grouped per province and per category into
+compact JSON files under MEDIA_ROOT/snapshots/. Each file is named by
+its content hash and written alongside .gz (and .br when the brotli
+package is installed) copies, so the web server can serve them
+precompressed with a long cache lifetime. `index.json` maps every
+province and category slug to its current file and is the only file
+that changes in place.
+
+The files are written at runtime, so they are not static files
+(WhiteNoise only indexes those at startup). They are served under
+/snapshots/ by nginx where it runs, and by `jobs:snapshot` otherwise.
+
+They are rebuilt by the build_job_snapshots beat task, by the
+`build_job_snapshots` management command (run at deploy by build.sh),
+and, on deploys without Celery, when `jobs:snapshot` finds the index
+missing or older than SNAPSHOT_MAX_AGE.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.companies.logos import prefetch_logo_urls
+from apps.core.compression import brotli_compress, gzip_compress
+
+SNAPSHOT_DIR = 'snapshots'
+INDEX_NAME = 'index.json'
+
+# Superseded files are kept this long for clients holding an older index
+STALE_FILE_TTL = 24 * 60 * 60
+
+# Matches the beat schedule
+SNAPSHOT_MAX_AGE = 15 * 60
+
+REBUILD_LOCK_KEY = 'snapshots:rebuild'
+
+
+# Names of the files a client may request (see the jobs:snapshot URL)
+SNAPSHOT_NAME = re.compile(r'^(index\.json|(province|category)/[-\w]+\.[0-9a-f]{12}\.json)$')
+
+
+def snapshot_root():
+    return os.path.join(settings.MEDIA_ROOT, SNAPSHOT_DIR)
+
+
+def snapshot_path(name):
+    """Filesystem path of a snapshot file, or None for an invalid name."""
+    if not SNAPSHOT_NAME.match(name):
+        return None
+    return os.path.join(snapshot_root(), name)
+
+
+def _write_atomic(path, content):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def _write_snapshot(root, kind, slug, cards):
+    """
+    Write one snapshot (plus compressed copies) unless it already exists.
+
+    Returns:
+        tuple: (name, index entry - url, hash, count)
+    """
+    content = json.dumps(
+        {'kind': kind, 'slug': slug, 'jobs': cards},
+        ensure_ascii=False,
+        separators=(',', ':'),
+        sort_keys=True,
+    ).encode('utf-8')
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    name = f'{kind}/{slug}.{digest}.json'
+    path = os.path.join(root, name)
+
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _write_atomic(f'{path}.gz', gzip_compress(content))
+        compressed = brotli_compress(content)
+        if compressed is not None:
+            _write_atomic(f'{path}.br', compressed)
+        # Plain file last: its presence marks a complete snapshot
+        _write_atomic(path, content)
+
+    return name, {
+        'url': reverse('jobs:snapshot', kwargs={'name': name}),
+        'hash': digest,
+        'count': len(cards),
+    }
+
+
+def _remove_stale(root, keep):
+    """Delete snapshot files not in `keep` once they are STALE_FILE_TTL old."""
+    removed = 0
+    cutoff = time.time() - STALE_FILE_TTL
+    for kind in ('province', 'category'):
+        directory = os.path.join(root, kind)
+        if not os.path.isdir(directory):
+            continue
+        for filename in os.listdir(directory):
+            path = os.path.join(directory, filename)
+            base = path
+            for suffix in ('.gz', '.br', '.tmp'):
+                if base.endswith(suffix):
+                    base = base[:-len(suffix)]
+            if base in keep or os.path.getmtime(path) > cutoff:
+                continue
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def build_snapshots():
+    """
+    Rebuild the per-province and per-category snapshots and index.json.
+
+    Returns:
+        dict: Number of snapshot files written to the index, stale files removed
+    """
+    from .api_views import serialize_job_card
+    from .models import Category, JobPost, Province
+
+    now = timezone.now()
+    jobs = JobPost.objects.filter(
+        Q(expires_at__isnull=True) | Q(expires_at__gt=now),
+        status='published',
+    ).select_related('company', 'category', 'province').order_by('-published_at', 'id')
+
+    jobs = list(jobs)
+    prefetch_logo_urls(job.company for job in jobs)
+
+    by_province = defaultdict(list)
+    by_category = defaultdict(list)
+    for job in jobs:
+        card = serialize_job_card(job)
+        if job.province_id:
+            by_province[job.province_id].append(card)
+        if job.category_id:
+            by_category[job.category_id].append(card)
+
+    root = snapshot_root()
+    index = {'generated_at': now.isoformat(), 'province': {}, 'category': {}}
+    keep = set()
+
+    for province in Province.active_objects.all():
+        name, index['province'][province.slug] = _write_snapshot(
+            root, 'province', province.slug, by_province.get(province.id, [])
+        )
+        keep.add(os.path.join(root, name))
+    for category in Category.active_objects.all():
+        name, index['category'][category.slug] = _write_snapshot(
+            root, 'category', category.slug, by_category.get(category.id, [])
+        )
+        keep.add(os.path.join(root, name))
+
+    os.makedirs(root, exist_ok=True)
+    _write_atomic(
+        os.path.join(root, INDEX_NAME),
+        json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    )
+
+    return {
+        'snapshots': len(keep),
+        'removed': _remove_stale(root, keep),
+    }
+
+
+def rebuild_if_stale():
+    """
+    Rebuild the snapshots when index.json is missing or older than
+    SNAPSHOT_MAX_AGE, for deploys where no beat task does it.
+
+    Returns:
+        bool: True if the snapshots were rebuilt
+    """
+    try:
+        age = time.time() - os.path.getmtime(os.path.join(snapshot_root(), INDEX_NAME))
+    except FileNotFoundError:
+        age = None
+    if age is not None and age < SNAPSHOT_MAX_AGE:
+        return False
+
+    if not cache.add(REBUILD_LOCK_KEY, 1, timeout=5 * 60):
+        return False
+    try:
+        build_snapshots()
+    finally:
+        cache.delete(REBUILD_LOCK_KEY)
+    return True
@@ -42,21 +42,27 @@ def expire_job_posts():
 
 
 @shared_task
-def purge_deleted_posts():
+def purge_deleted_posts(batch_size=500, time_budget=600):
     """
     Permanently delete soft-deleted posts older than 60 days.
+    Applications, saves and reports are removed chunk by chunk with their posts.
     """
     from datetime import timedelta
+    from apps.core.batching import delete_in_batches
     from .models import JobPost
 
     cutoff = timezone.now() - timedelta(days=60)
 
-    deleted, _ = JobPost.all_objects.filter(
-        is_deleted=True,
-        deleted_at__lt=cutoff
-    ).delete()
+    result = delete_in_batches(
+        JobPost.all_objects.filter(
+            is_deleted=True,
+            deleted_at__lt=cutoff
+        ),
+        batch_size=batch_size,
+        time_budget=time_budget,
+    )
 
-    return {'purged': deleted}
+    return {'purged': result['deleted'], 'complete': result['complete']}
 
 
 @shared_task
@@ -68,7 +74,7 @@ def process_job_alerts(job_id):
     from django.db.models import Q
 
     try:
-        job = JobPost.objects.get(id=job_id, status='published')
+        job = JobPost.objects.select_related('company').get(id=job_id, status='published')
     except JobPost.DoesNotExist:
         return {'error': 'Job not found'}
 
@@ -100,23 +106,130 @@ def process_job_alerts(job_id):
         else:
             alerts_to_notify.append(alert)
 
-    # Send notifications (implement based on channel)
-    sent_count = 0
-    for alert in alerts_to_notify:
-        # TODO: Implement actual notification sending
-        # send_job_alert_notification.delay(alert.id, job.id)
-        alert.last_sent_at = timezone.now()
-        alert.save(update_fields=['last_sent_at'])
-        sent_count += 1
+    # Queue notifications in batches; duplicates are dropped by the dispatcher
+    from django.conf import settings
+    from apps.core import notifications
+
+    site_url = settings.LAO_JOBS.get('SITE_URL', 'https://laojobs.la')
+    body = f'ວຽກໃໝ່: {job.title} - {job.company.company_name}\n{site_url}/jobs/{job.id}/'
+
+    messages = [
+        notifications.build_message(
+            alert.channel,
+            alert.phone_normalized,
+            body,
+            dedup_key=f'job-alert:{job.id}',
+        )
+        for alert in alerts_to_notify
+    ]
+    sent_count = notifications.send_bulk(messages)
+
+    JobAlert.objects.filter(
+        id__in=[alert.id for alert in alerts_to_notify]
+    ).update(last_sent_at=timezone.now())
 
     return {'alerts_sent': sent_count}
 
 
 @shared_task
-def update_job_view_counts():
+def update_job_view_counts(batch_size=500):
+    """
+    Flush view counts buffered in the cache to the database.
+    """
+    from datetime import timedelta
+    from django.core.cache import cache
+    from django.db.models import F
+    from apps.companies.stats import invalidate_dashboard_stats
+    from .models import JobPost
+
+    # Views only land on published posts, so anything that expired more
+    # than a day ago can no longer have a pending counter.
+    candidates = JobPost.objects.filter(
+        published_at__isnull=False,
+        expires_at__gte=timezone.now() - timedelta(days=1)
+    ).values_list('id', 'company_id')
+
+    def flush(chunk):
+        keys = {f'job:{job_id}:views': (job_id, company_id) for job_id, company_id in chunk}
+        pending = cache.get_many(list(keys))
+        flushed = 0
+        for key, count in pending.items():
+            if not count:
+                continue
+            job_id, company_id = keys[key]
+            # Subtract what we read so views recorded meanwhile are kept
+            try:
+                cache.decr(key, count)
+            except ValueError:
+                pass
+            JobPost.objects.filter(pk=job_id).update(view_count=F('view_count') + count)
+            company_ids.add(company_id)
+            flushed += count
+        return flushed
+
+    company_ids = set()
+    views = 0
+    chunk = []
+    for row in candidates.iterator(chunk_size=batch_size):
+        chunk.append(row)
+        if len(chunk) >= batch_size:
+            views += flush(chunk)
+            chunk = []
+    if chunk:
+        views += flush(chunk)
+
+    if company_ids:
+        invalidate_dashboard_stats(*company_ids)
+
+    return {'views': views, 'companies': len(company_ids)}
+
+
+@shared_task
+def flush_job_analytics(batch_size=500):
     """
-    Batch update view counts from cache (if using Redis for real-time counts).
+    Roll cached analytics counters up into JobDailyStat rows.
+    Yesterday is included so late events before midnight are not lost.
     """
-    # This is a placeholder for implementing cached view counts
-    # In production, you might store view counts in Redis and batch update to DB
-    return {'status': 'completed'}
+    from datetime import timedelta
+    from . import analytics
+    from .models import JobPost
+
+    today = timezone.localdate()
+    days = [today - timedelta(days=1), today]
+
+    candidates = JobPost.objects.filter(
+        published_at__isnull=False,
+        expires_at__gte=timezone.now() - timedelta(days=2)
+    ).values_list('id', flat=True)
+
+    rows = 0
+    chunk = []
+    for job_id in candidates.iterator(chunk_size=batch_size):
+        chunk.append(job_id)
+        if len(chunk) >= batch_size:
+            rows += sum(analytics.rollup(chunk, day) for day in days)
+            chunk = []
+    if chunk:
+        rows += sum(analytics.rollup(chunk, day) for day in days)
+
+    return {'rows': rows}
+
+
+@shared_task
+def process_job_import(import_id):
+    """
+    Run a bulk job import in the background.
+    """
+    from .importer import run_import
+
+    return run_import(import_id)
+
+
+@shared_task
+def build_job_snapshots():
+    """
+    Rebuild the compressed per-province/category offline job snapshots.
+    """
+    from .snapshots import build_snapshots
+
+    return build_snapshots()
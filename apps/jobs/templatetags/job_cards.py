@@ -0,0 +1,77 @@
+"""
+Job card rendering with a per-card fragment cache.
+
+Usage:
+    {% load job_cards %}
+    {% render_job_cards jobs %}
+
+All cards of a page are looked up with one cache get_many; only misses
+are rendered, and stored back with one set_many. The key changes with
+anything the card shows, so entries never need explicit invalidation.
+The view count changes too often to be part of the key; cards are
+cached with a placeholder that is filled in on every render.
+
+Cards embed logo URLs, which may be signed, so a card is never cached
+past the point where its logo URL would have left the logo URL cache.
+"""
+import hashlib
+
+from django import template
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from apps.companies.logos import logo_urls_valid_for, prefetch_logo_urls
+
+register = template.Library()
+
+CARD_TEMPLATE = 'jobs/_job_card.html'
+
+# Stands in for the view count in cached cards
+VIEW_COUNT_SLOT = '\x00view_count\x00'
+
+
+def job_card_cache_key(job):
+    """
+    Key by job version (updated_at) and company version (updated_at and
+    logo), plus the days remaining, which change without a save.
+    """
+    company = job.company
+    version = ':'.join([
+        job.updated_at.isoformat(),
+        company.updated_at.isoformat(),
+        company.logo_version,
+        str(job.days_remaining),
+    ])
+    return f'jobcard:{job.pk}:{hashlib.md5(version.encode()).hexdigest()}'
+
+
+@register.simple_tag
+def render_job_cards(jobs):
+    jobs = list(jobs)
+    keys = [job_card_cache_key(job) for job in jobs]
+    cached = cache.get_many(keys)
+
+    misses = [job for job, key in zip(jobs, keys) if key not in cached]
+    if misses:
+        companies = [job.company for job in misses]
+        prefetch_logo_urls(companies)
+        rendered = {
+            job_card_cache_key(job): render_to_string(
+                CARD_TEMPLATE, {'job': job, 'view_count': VIEW_COUNT_SLOT}
+            )
+            for job in misses
+        }
+        timeout = min(
+            getattr(settings, 'LAO_JOBS', {}).get('JOB_CARD_CACHE_TTL', 60 * 60),
+            logo_urls_valid_for(companies),
+        )
+        if timeout > 0:
+            cache.set_many(rendered, timeout=timeout)
+        cached.update(rendered)
+
+    return mark_safe('\n'.join(
+        cached[key].replace(VIEW_COUNT_SLOT, str(job.view_count))
+        for job, key in zip(jobs, keys)
+    ))
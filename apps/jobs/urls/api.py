@@ -7,11 +7,18 @@ from apps.jobs import api_views
 urlpatterns = [
     # Job listing API
     path('', api_views.job_list_api, name='job_list'),
+    path('changes/', api_views.job_changes_api, name='job_changes'),
+    path('batch/', api_views.job_batch_api, name='job_batch'),
+    path('saved/', api_views.saved_jobs_api, name='saved_jobs'),
+    path('saved/sync/', api_views.sync_saved_jobs_api, name='sync_saved_jobs'),
     path('<uuid:job_id>/', api_views.job_detail_api, name='job_detail'),
 
     # Quick apply
     path('<uuid:job_id>/apply/', api_views.job_apply_api, name='job_apply'),
 
+    # Contact click tracking
+    path('<uuid:job_id>/contact-click/', api_views.contact_click_api, name='contact_click'),
+
     # Save job
     path('<uuid:job_id>/save/', api_views.save_job_api, name='save_job'),
 
@@ -1,7 +1,7 @@
 """
 Public job URL configuration.
 """
-from django.urls import path
+from django.urls import path, re_path
 from apps.jobs import views
 
 app_name = 'jobs'
@@ -26,4 +26,11 @@ urlpatterns = [
 
     # Company jobs
     path('company/<uuid:company_id>/jobs/', views.company_jobs_view, name='company_jobs'),
+
+    # Offline job snapshots (served by nginx where it runs)
+    re_path(
+        r'^snapshots/(?P<name>index\.json|(?:province|category)/[-\w]+\.[0-9a-f]{12}\.json)$',
+        views.snapshot_view,
+        name='snapshot',
+    ),
 ]
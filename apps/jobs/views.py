@@ -1,19 +1,26 @@
 """
 Public job views.
 """
+import os
+
+from django.http import FileResponse, Http404
 from django.shortcuts import render, get_object_or_404
 from django.core.paginator import Paginator
 from django.db.models import Q, Count
 from django.views.decorators.http import require_http_methods
 
+from apps.core.pagecache import cache_anonymous_page, caching_page, tag_page
 from .models import JobPost, Category, Province, QuickFilter
 from .forms import JobSearchForm
 
 
+@cache_anonymous_page
 def home_view(request):
     """
     Homepage view.
     """
+    tag_page(request, 'jobs')
+
     # Get recent published jobs
     recent_jobs = JobPost.objects.filter(
         status='published',
@@ -51,10 +58,13 @@ def home_view(request):
     return render(request, 'jobs/home.html', context)
 
 
+@cache_anonymous_page
 def job_list_view(request):
     """
     Job listing with search and filters.
     """
+    tag_page(request, 'jobs')
+
     form = JobSearchForm(request.GET)
 
     jobs = JobPost.objects.filter(
@@ -117,15 +127,31 @@ def job_list_view(request):
     return render(request, 'jobs/job_list.html', context)
 
 
+def _count_cached_view(request, job_id):
+    # The view is skipped when the page is served from the page cache
+    JobPost.record_view(job_id)
+
+
+@cache_anonymous_page(on_hit=_count_cached_view)
 def job_detail_view(request, job_id):
     """
     Job detail view.
     """
+    tag_page(request, f'job:{job_id}')
+
+    published = JobPost.objects.filter(id=job_id, status='published', is_deleted=False)
+
+    if caching_page(request):
+        # Tag the related keys before their rows are read. Changing them
+        # on the job purges job:<id>, which is already tagged.
+        related = published.values('company_id', 'category_id', 'province_id').first()
+        if related:
+            tag_page(request, f'company:{related["company_id"]}',
+                     f'category:{related["category_id"]}',
+                     f'province:{related["province_id"]}')
+
     job = get_object_or_404(
-        JobPost.objects.select_related('company', 'category', 'province'),
-        id=job_id,
-        status='published',
-        is_deleted=False
+        published.select_related('company', 'category', 'province')
     )
 
     # Increment view count
@@ -136,7 +162,7 @@ def job_detail_view(request, job_id):
         status='published',
         is_deleted=False,
         category=job.category
-    ).exclude(id=job.id).order_by('-published_at')[:4]
+    ).exclude(id=job.id).select_related('company').order_by('-published_at')[:4]
 
     context = {
         'job': job,
@@ -146,10 +172,13 @@ def job_detail_view(request, job_id):
     return render(request, 'jobs/job_detail.html', context)
 
 
+@cache_anonymous_page
 def category_jobs_view(request, slug):
     """
     Jobs filtered by category.
     """
+    tag_page(request, 'jobs')
+
     category = get_object_or_404(Category, slug=slug, is_active=True)
 
     jobs = JobPost.objects.filter(
@@ -172,10 +201,13 @@ def category_jobs_view(request, slug):
     return render(request, 'jobs/category_jobs.html', context)
 
 
+@cache_anonymous_page
 def province_jobs_view(request, slug):
     """
     Jobs filtered by province.
     """
+    tag_page(request, 'jobs')
+
     province = get_object_or_404(Province, slug=slug, is_active=True)
 
     jobs = JobPost.objects.filter(
@@ -198,12 +230,15 @@ def province_jobs_view(request, slug):
     return render(request, 'jobs/province_jobs.html', context)
 
 
+@cache_anonymous_page
 def company_jobs_view(request, company_id):
     """
     Jobs from a specific company.
     """
     from apps.companies.models import Company
 
+    tag_page(request, 'jobs', f'company:{company_id}')
+
     company = get_object_or_404(Company, id=company_id, status='active')
 
     jobs = JobPost.objects.filter(
@@ -226,10 +261,13 @@ def company_jobs_view(request, company_id):
     return render(request, 'jobs/company_jobs.html', context)
 
 
+@cache_anonymous_page
 def all_categories_view(request):
     """
     All categories page.
     """
+    tag_page(request, 'jobs')
+
     categories = Category.active_objects.annotate(
         job_count=Count('job_posts', filter=Q(job_posts__status='published'))
     ).order_by('sort_order')
@@ -237,12 +275,47 @@ def all_categories_view(request):
     return render(request, 'jobs/all_categories.html', {'categories': categories})
 
 
+@cache_anonymous_page
 def all_provinces_view(request):
     """
     All provinces page.
     """
+    tag_page(request, 'jobs')
+
     provinces = Province.active_objects.annotate(
         job_count=Count('job_posts', filter=Q(job_posts__status='published'))
     ).order_by('sort_order')
 
     return render(request, 'jobs/all_provinces.html', {'provinces': provinces})
+
+
+def snapshot_view(request, name):
+    """
+    Offline job snapshot file (see apps.jobs.snapshots).
+    The gzip copy is sent to clients that accept it.
+    """
+    from apps.core.utils import has_celery
+    from .snapshots import INDEX_NAME, rebuild_if_stale, snapshot_path
+
+    if name == INDEX_NAME and not has_celery():
+        rebuild_if_stale()
+
+    path = snapshot_path(name)
+    if path is None or not os.path.exists(path):
+        raise Http404
+
+    gzipped = 'gzip' in request.headers.get('Accept-Encoding', '') and os.path.exists(f'{path}.gz')
+    response = FileResponse(
+        open(f'{path}.gz' if gzipped else path, 'rb'),
+        content_type='application/json',
+    )
+    if gzipped:
+        response['Content-Encoding'] = 'gzip'
+    response['Vary'] = 'Accept-Encoding'
+
+    if name == INDEX_NAME:
+        response['Cache-Control'] = 'no-cache'
+    else:
+        # Named by content hash
+        response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
@@ -8,19 +8,10 @@ from django.views.decorators.csrf import csrf_exempt
 import json
 
 from .models import Report, ReportReason
+from apps.core.utils import get_client_ip
 from apps.jobs.models import JobPost
 
 
-def get_client_ip(request):
-    """Get client IP address from request."""
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
-    else:
-        ip = request.META.get('REMOTE_ADDR')
-    return ip
-
-
 @csrf_exempt
 @require_http_methods(['POST'])
 def report_job_view(request, job_id):
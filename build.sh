@@ -14,3 +14,6 @@ python manage.py migrate
 
 # Seed initial data (optional - creates categories, provinces, etc.)
 python manage.py seed_data || true
+
+# Build offline job snapshots (rebuilt by Celery beat where it runs)
+python manage.py build_job_snapshots
@@ -31,6 +31,24 @@ app.conf.beat_schedule = {
         'schedule': crontab(minute=30),  # Every hour at :30
     },
 
+    # Flush buffered job view counts (every 5 minutes)
+    'update-job-view-counts': {
+        'task': 'apps.jobs.tasks.update_job_view_counts',
+        'schedule': crontab(minute='*/5'),
+    },
+
+    # Roll up job analytics counters (every 10 minutes)
+    'flush-job-analytics': {
+        'task': 'apps.jobs.tasks.flush_job_analytics',
+        'schedule': crontab(minute='*/10'),
+    },
+
+    # Rebuild offline job snapshots (every 15 minutes)
+    'build-job-snapshots': {
+        'task': 'apps.jobs.tasks.build_job_snapshots',
+        'schedule': crontab(minute='*/15'),
+    },
+
     # Purge soft-deleted posts (daily at 3:00 AM)
     'purge-deleted-posts': {
         'task': 'apps.jobs.tasks.purge_deleted_posts',
@@ -49,12 +67,24 @@ app.conf.beat_schedule = {
         'schedule': crontab(hour=9, minute=0),
     },
 
-    # Cleanup expired OTP records (daily at 4:00 AM)
+    # Cleanup unverified OTP records (daily at 4:00 AM)
     'cleanup-otp-records': {
         'task': 'apps.accounts.tasks.cleanup_expired_otp',
         'schedule': crontab(hour=4, minute=0),
     },
 
+    # Write buffered login attempts (every minute)
+    'flush-login-attempts': {
+        'task': 'apps.accounts.tasks.flush_login_attempts',
+        'schedule': crontab(),
+    },
+
+    # Cleanup old login attempts (daily at 4:15 AM)
+    'cleanup-login-attempts': {
+        'task': 'apps.accounts.tasks.cleanup_login_attempts',
+        'schedule': crontab(hour=4, minute=15),
+    },
+
     # Generate sitemap (daily at 5:00 AM)
     'generate-sitemap': {
         'task': 'apps.core.tasks.generate_sitemap',
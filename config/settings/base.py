@@ -79,6 +79,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.core.pagecache.PageCacheMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -210,6 +211,22 @@ LAO_JOBS = {
     'OTP_EXPIRY_MINUTES': 5,
     'OTP_MAX_ATTEMPTS': 3,
     'QR_EXPIRY_HOURS': 24,
+    'PAYMENT_STATUS_WAIT': 20,
+    'REFERENCE_BLOCK_SIZE': 20,
+    'DASHBOARD_STATS_TTL': 300,
+    'BULK_JOB_LIMIT': 500,
+    'JOB_IMPORT_MAX_ROWS': 2000,
+    'JOB_IMPORT_SYNC_MAX_BYTES': 100 * 1024,
+    'SAVED_JOBS_MAX': 100,
+    'JOB_BATCH_MAX': 100,
+    'CONTACT_CLICK_IP_LIMIT': 60,
+    'LOGO_URL_CACHE_TTL': 50 * 60,
+    'JOB_CARD_CACHE_TTL': 60 * 60,
+    'PAGE_CACHE_TTL': 5 * 60,
+    # Page cache TTL when purges can't reach other workers (LocMemCache)
+    'PAGE_CACHE_LOCAL_TTL': 30,
+    # Proxies in front of Django that append to X-Forwarded-For (nginx: 1)
+    'TRUSTED_PROXY_COUNT': int(os.environ.get('TRUSTED_PROXY_COUNT', 0)),
 }
 
 # Payment Gateway Settings
@@ -218,11 +235,13 @@ PAYMENT_GATEWAY = {
         'API_URL': os.environ.get('BCEL_API_URL', ''),
         'MERCHANT_ID': os.environ.get('BCEL_MERCHANT_ID', ''),
         'API_KEY': os.environ.get('BCEL_API_KEY', ''),
+        'WEBHOOK_SECRET': os.environ.get('BCEL_WEBHOOK_SECRET', ''),
     },
     'ONEPAY': {
         'API_URL': os.environ.get('ONEPAY_API_URL', ''),
         'MERCHANT_ID': os.environ.get('ONEPAY_MERCHANT_ID', ''),
         'API_KEY': os.environ.get('ONEPAY_API_KEY', ''),
+        'WEBHOOK_SECRET': os.environ.get('ONEPAY_WEBHOOK_SECRET', ''),
     },
 }
 
@@ -233,7 +252,42 @@ WHATSAPP = {
     'PHONE_NUMBER_ID': os.environ.get('WHATSAPP_PHONE_NUMBER_ID', ''),
 }
 
+# SMS Gateway
+SMS = {
+    'API_URL': os.environ.get('SMS_API_URL', ''),
+    'API_KEY': os.environ.get('SMS_API_KEY', ''),
+    'SENDER_ID': os.environ.get('SMS_SENDER_ID', 'LaoJobs'),
+}
+
+# WhatsApp/SMS notification dispatch (apps.core.notifications)
+NOTIFICATIONS = {
+    'BACKENDS': {
+        'whatsapp': 'apps.core.notifications.backends.WhatsAppBackend',
+        'sms': 'apps.core.notifications.backends.SMSBackend',
+    },
+    'RATE_LIMIT_PER_SECOND': int(os.environ.get('NOTIFICATIONS_RATE_LIMIT', 20)),
+    'BATCH_SIZE': 50,
+    'MAX_RETRIES': 5,
+    'RETRY_BACKOFF_SECONDS': 30,
+    'DEDUP_TTL_SECONDS': 6 * 60 * 60,
+    'HTTP_POOL_SIZE': 10,
+    'HTTP_TIMEOUT_SECONDS': 10,
+}
+
+# Login rate limiting (apps.accounts.ratelimit)
+LOGIN_RATE_LIMIT = {
+    'WINDOW_SECONDS': 15 * 60,
+    'IP_LIMIT': int(os.environ.get('LOGIN_RATE_LIMIT_IP', 20)),
+    'EMAIL_LIMIT': int(os.environ.get('LOGIN_RATE_LIMIT_EMAIL', 5)),
+    'LOCKOUT_BASE_SECONDS': 60,
+    'LOCKOUT_MAX_SECONDS': 60 * 60,
+}
+
 # File Upload Settings
+# Stream uploads to a temporary file instead of buffering them in memory
+FILE_UPLOAD_HANDLERS = [
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
 FILE_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024  # 5MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024  # 5MB
 ALLOWED_IMAGE_EXTENSIONS = ['jpg', 'jpeg', 'png', 'webp']
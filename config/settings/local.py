@@ -31,6 +31,15 @@ SESSION_ENGINE = 'django.contrib.sessions.backends.db'
 # Email backend for development
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
+# Notifications go to an in-memory outbox instead of WhatsApp/SMS providers
+NOTIFICATIONS = {
+    **NOTIFICATIONS,
+    'BACKENDS': {
+        'whatsapp': 'apps.core.notifications.backends.LocMemBackend',
+        'sms': 'apps.core.notifications.backends.LocMemBackend',
+    },
+}
+
 # CORS settings for local development
 CORS_ALLOW_ALL_ORIGINS = True
 
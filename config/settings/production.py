@@ -53,12 +53,23 @@ CACHES = {
     }
 }
 
+# Behind the platform's edge proxy (or nginx, see nginx.conf)
+LAO_JOBS['TRUSTED_PROXY_COUNT'] = int(os.environ.get('TRUSTED_PROXY_COUNT', 1))
+
 # Use database sessions instead of cache sessions
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'
 
 # Whitenoise for static files
 MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    # Hashed, compressed files plus the service worker precache manifest
+    'staticfiles': {
+        'BACKEND': 'apps.core.storage.PrecacheManifestStaticFilesStorage',
+    },
+}
 
 # Static files
 STATIC_ROOT = BASE_DIR / 'staticfiles'
@@ -147,4 +147,8 @@ LAO_JOBS = {
     'OTP_EXPIRY_MINUTES': 5,
     'OTP_MAX_ATTEMPTS': 3,
     'QR_EXPIRY_HOURS': 24,
+    # Few web workers: answer payment status checks without holding them
+    'PAYMENT_STATUS_WAIT': 0,
+    # Behind PythonAnywhere's front-end proxy
+    'TRUSTED_PROXY_COUNT': 1,
 }
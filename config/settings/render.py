@@ -43,7 +43,15 @@ else:
 
 # Static files with WhiteNoise
 MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    # Hashed, compressed files plus the service worker precache manifest
+    'staticfiles': {
+        'BACKEND': 'apps.core.storage.PrecacheManifestStaticFilesStorage',
+    },
+}
 
 # Cache - Use local memory for free tier
 CACHES = {
@@ -53,6 +61,9 @@ CACHES = {
     }
 }
 
+# Behind Render's load balancer
+LAO_JOBS['TRUSTED_PROXY_COUNT'] = int(os.environ.get('TRUSTED_PROXY_COUNT', 1))
+
 # Session - Use database instead of cache
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'
 
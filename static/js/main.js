@@ -11,7 +11,11 @@ document.addEventListener('DOMContentLoaded', function() {
     initJobCardSave();
     initFormValidation();
     initInfiniteScroll();
+    initContactTracking();
+    initAnalyticsCharts();
+    initPaymentStatus();
     initServiceWorker();
+    initOfflineSnapshots();
 });
 
 /**
@@ -138,8 +142,22 @@ function closeModal(modal) {
 /**
  * Job Card Save/Bookmark
  */
+function getSavedJobIds() {
+    try {
+        return JSON.parse(localStorage.getItem('savedJobs')) || [];
+    } catch (error) {
+        return [];
+    }
+}
+
 function initJobCardSave() {
+    const savedIds = getSavedJobIds();
+
     document.querySelectorAll('.job-card-save').forEach(btn => {
+        if (savedIds.includes(btn.dataset.jobId)) {
+            btn.classList.add('saved');
+        }
+
         btn.addEventListener('click', function(e) {
             e.preventDefault();
             e.stopPropagation();
@@ -163,22 +181,99 @@ function initJobCardSave() {
 
 async function toggleSaveJob(jobId, save) {
     try {
-        const response = await fetch(`/api/jobs/${jobId}/save/`, {
-            method: save ? 'POST' : 'DELETE',
+        const response = await fetch(`/api/v1/jobs/${jobId}/save/`, {
+            method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
                 'X-CSRFToken': getCsrfToken(),
             },
+            body: JSON.stringify({ saved: save }),
         });
 
         if (!response.ok) {
             throw new Error('Failed to save job');
         }
+
+        // The signed cookie is the source of truth; keep a local copy
+        const data = await response.json();
+        localStorage.setItem('savedJobs', JSON.stringify(data.ids));
     } catch (error) {
         console.error('Error saving job:', error);
     }
 }
 
+/**
+ * Contact Click Tracking
+ */
+function initContactTracking() {
+    document.querySelectorAll('[data-contact-click]').forEach(link => {
+        link.addEventListener('click', function() {
+            const url = `/api/v1/jobs/${this.dataset.contactClick}/contact-click/`;
+            if (navigator.sendBeacon) {
+                navigator.sendBeacon(url);
+            } else {
+                fetch(url, { method: 'POST', keepalive: true });
+            }
+        });
+    });
+}
+
+/**
+ * Payment Status (long-poll; the server answers when the invoice changes)
+ */
+function initPaymentStatus() {
+    document.querySelectorAll('[data-payment-status-url]').forEach(el => {
+        watchPaymentStatus(el.dataset.paymentStatusUrl, status => {
+            if (status === 'paid' && el.dataset.paidUrl) {
+                window.location.href = el.dataset.paidUrl;
+            } else {
+                window.location.reload();
+            }
+        });
+    });
+}
+
+async function watchPaymentStatus(url, onChange, status = 'pending') {
+    while (status === 'pending') {
+        const started = Date.now();
+        try {
+            const response = await fetch(`${url}?status=${status}`);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            status = (await response.json()).status;
+        } catch (error) {
+            console.error('Error checking payment:', error);
+        }
+        // Space out requests when the server does not hold them open
+        const wait = 5000 - (Date.now() - started);
+        if (status === 'pending' && wait > 0) {
+            await new Promise(resolve => setTimeout(resolve, wait));
+        }
+    }
+    onChange(status);
+}
+
+/**
+ * Employer Analytics Charts (daily views from rollups)
+ */
+function initAnalyticsCharts() {
+    document.querySelectorAll('[data-analytics-url]').forEach(async chart => {
+        try {
+            const response = await fetch(chart.dataset.analyticsUrl);
+            const data = await response.json();
+            const peak = Math.max(1, ...data.days.map(d => d.views));
+
+            chart.innerHTML = data.days.map(d => `
+                <div class="analytics-bar"
+                     style="height: ${Math.round(d.views / peak * 100)}%"
+                     title="${formatDate(d.day)}: 👁️ ${d.views} • 📝 ${d.applications} • 📞 ${d.contact_clicks}">
+                </div>
+            `).join('');
+        } catch (error) {
+            console.error('Error loading analytics:', error);
+        }
+    });
+}
+
 /**
  * Form Validation
  */
@@ -313,7 +408,7 @@ function renderJobCard(job) {
         <article class="job-card" onclick="location.href='/jobs/${job.id}/'">
             <div class="job-card-header">
                 <div class="job-card-logo">
-                    ${job.company.logo ? `<img src="${job.company.logo}" alt="${job.company.name}">` : job.company.name.charAt(0)}
+                    ${job.company.logo ? `<picture>${job.company.logo_webp ? `<source srcset="${job.company.logo_webp}" type="image/webp">` : ''}<img src="${job.company.logo}" alt="${job.company.name}" loading="lazy"></picture>` : job.company.name.charAt(0)}
                 </div>
                 <div class="job-card-info">
                     <h3 class="job-card-title">${job.title}</h3>
@@ -341,6 +436,39 @@ function renderJobCard(job) {
 /**
  * Service Worker Registration
  */
+/**
+ * Offline Job Lists (buttons with data-offline-snapshot="<kind>:<slug>")
+ */
+function initOfflineSnapshots() {
+    const buttons = document.querySelectorAll('[data-offline-snapshot]');
+    if (!buttons.length || !('serviceWorker' in navigator)) {
+        buttons.forEach(button => button.hidden = true);
+        return;
+    }
+
+    navigator.serviceWorker.addEventListener('message', event => {
+        const data = event.data || {};
+        if (data.type !== 'snapshot-cached') return;
+        const button = document.querySelector(
+            `[data-offline-snapshot="${data.kind}:${data.slug}"]`
+        );
+        if (button) button.disabled = false;
+        showToast(
+            data.ok ? 'ບັນທຶກໄວ້ອ່ານອອບລາຍແລ້ວ' : 'ບັນທຶກບໍ່ສຳເລັດ. ກະລຸນາລອງໃໝ່',
+            data.ok ? 'success' : 'error'
+        );
+    });
+
+    buttons.forEach(button => {
+        button.addEventListener('click', async () => {
+            const [kind, slug] = button.dataset.offlineSnapshot.split(':');
+            button.disabled = true;
+            const registration = await navigator.serviceWorker.ready;
+            registration.active.postMessage({ type: 'cache-snapshot', kind, slug });
+        });
+    });
+}
+
 function initServiceWorker() {
     if ('serviceWorker' in navigator) {
         navigator.serviceWorker.register('/sw.js')
@@ -398,4 +526,5 @@ window.LaoJobs = {
     formatCurrency,
     formatDate,
     debounce,
+    watchPaymentStatus,
 };
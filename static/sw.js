@@ -3,41 +3,60 @@
  * Provides offline support and caching
  */
 
-const CACHE_NAME = 'laojobs-v1';
-const STATIC_CACHE = 'laojobs-static-v1';
+const STATIC_CACHE = 'laojobs-static';
 const DYNAMIC_CACHE = 'laojobs-dynamic-v1';
+const SNAPSHOT_CACHE = 'laojobs-snapshots-v2';
+const SNAPSHOT_INDEX = '/snapshots/index.json';
 
-// Files to cache immediately
-const STATIC_FILES = [
+// Hashed static files, injected by collectstatic
+// (apps.core.storage.PrecacheManifestStaticFilesStorage). Empty in development.
+const PRECACHE_MANIFEST = [];
+
+// Pages and third-party files to cache immediately
+const OFFLINE_FILES = [
     '/',
-    '/static/css/main.css',
-    '/static/js/main.js',
-    '/static/manifest.json',
     'https://fonts.googleapis.com/css2?family=Noto+Sans+Lao:wght@300;400;500;600;700;800&display=swap',
 ];
 
-// Install event - cache static assets
+function precacheUrls() {
+    return [...PRECACHE_MANIFEST, ...OFFLINE_FILES].map(url => new URL(url, self.location).href);
+}
+
+// Install event - download only the files not cached by a previous version
 self.addEventListener('install', event => {
     event.waitUntil(
         caches.open(STATIC_CACHE)
-            .then(cache => {
-                console.log('[SW] Caching static files');
-                return cache.addAll(STATIC_FILES);
+            .then(async cache => {
+                const cached = new Set((await cache.keys()).map(request => request.url));
+                const missing = PRECACHE_MANIFEST
+                    .map(url => new URL(url, self.location).href)
+                    .filter(url => !cached.has(url));
+                console.log(`[SW] Caching ${missing.length} changed static files`);
+                return cache.addAll([...missing, ...OFFLINE_FILES]);
             })
             .then(() => self.skipWaiting())
     );
 });
 
-// Activate event - clean up old caches
+// Activate event - clean up old caches and superseded static files
 self.addEventListener('activate', event => {
     event.waitUntil(
         caches.keys()
             .then(keys => {
                 return Promise.all(
-                    keys.filter(key => key !== STATIC_CACHE && key !== DYNAMIC_CACHE)
+                    keys.filter(key => ![STATIC_CACHE, DYNAMIC_CACHE, SNAPSHOT_CACHE].includes(key))
                         .map(key => caches.delete(key))
                 );
             })
+            .then(() => caches.open(STATIC_CACHE))
+            .then(async cache => {
+                const wanted = new Set(precacheUrls());
+                const requests = await cache.keys();
+                return Promise.all(
+                    requests.filter(request => !wanted.has(request.url))
+                        .map(request => cache.delete(request))
+                );
+            })
             .then(() => self.clients.claim())
     );
 });
@@ -57,6 +76,16 @@ self.addEventListener('fetch', event => {
         return;
     }
 
+    // Offline job snapshots - index network first, hashed files cache first
+    if (url.pathname.startsWith('/snapshots/')) {
+        event.respondWith(
+            url.pathname === SNAPSHOT_INDEX
+                ? fetchAndCache(request, SNAPSHOT_CACHE).catch(() => caches.match(request))
+                : caches.match(request).then(cached => cached || fetchAndCache(request, SNAPSHOT_CACHE))
+        );
+        return;
+    }
+
     // For HTML pages - network first, fallback to cache
     if (request.headers.get('accept').includes('text/html')) {
         event.respondWith(
@@ -68,15 +97,16 @@ self.addEventListener('fetch', event => {
                         .then(cache => cache.put(request, clonedResponse));
                     return response;
                 })
-                .catch(() => {
-                    return caches.match(request)
-                        .then(cachedResponse => {
-                            if (cachedResponse) {
-                                return cachedResponse;
-                            }
-                            // Return offline page if available
-                            return caches.match('/offline/');
-                        });
+                .catch(async () => {
+                    const cachedResponse = await caches.match(request);
+                    if (cachedResponse) {
+                        return cachedResponse;
+                    }
+                    // Job lists saved for offline reading
+                    const snapshot = snapshotFor(url);
+                    const page = snapshot && await snapshotPage(snapshot.kind, snapshot.slug);
+                    // Return offline page if available
+                    return page || caches.match('/offline/');
                 })
         );
         return;
@@ -108,6 +138,123 @@ self.addEventListener('fetch', event => {
     );
 });
 
+async function fetchAndCache(request, cacheName) {
+    const response = await fetch(request);
+    if (response.ok) {
+        const cache = await caches.open(cacheName);
+        await cache.put(request, response.clone());
+    }
+    return response;
+}
+
+/**
+ * Download a province's or category's jobs for offline browsing.
+ * Pages post {type: 'cache-snapshot', kind: 'province' | 'category', slug}
+ * and get {type: 'snapshot-cached', kind, slug, ok} back.
+ * Superseded versions of the same snapshot are dropped from the cache.
+ */
+async function cacheSnapshot(kind, slug) {
+    const response = await fetchAndCache(new Request(SNAPSHOT_INDEX), SNAPSHOT_CACHE);
+    if (!response.ok) {
+        throw new Error(`Snapshot index: HTTP ${response.status}`);
+    }
+    const index = await response.json();
+    const entry = (index[kind] || {})[slug];
+    if (!entry) {
+        throw new Error(`No snapshot for ${kind} ${slug}`);
+    }
+
+    const cache = await caches.open(SNAPSHOT_CACHE);
+    if (!(await cache.match(entry.url))) {
+        await cache.add(entry.url);
+    }
+
+    const prefix = `/snapshots/${kind}/${slug}.`;
+    for (const request of await cache.keys()) {
+        const path = new URL(request.url).pathname;
+        if (path.startsWith(prefix) && path !== entry.url) {
+            await cache.delete(request);
+        }
+    }
+}
+
+self.addEventListener('message', event => {
+    const data = event.data || {};
+    if (data.type === 'cache-snapshot') {
+        event.waitUntil(
+            cacheSnapshot(data.kind, data.slug)
+                .then(() => true, error => {
+                    console.error('[SW] Snapshot not cached:', error);
+                    return false;
+                })
+                .then(ok => event.source && event.source.postMessage({
+                    type: 'snapshot-cached', kind: data.kind, slug: data.slug, ok,
+                }))
+        );
+    }
+});
+
+/**
+ * Job list pages for a province or category, read from a cached
+ * snapshot: /jobs/province/<slug>/, /jobs/category/<slug>/ and
+ * /jobs/?province=<slug> (or ?category=<slug>).
+ */
+function snapshotFor(url) {
+    const match = url.pathname.match(/^\/jobs\/(province|category)\/([-\w]+)\/$/);
+    if (match) {
+        return { kind: match[1], slug: match[2] };
+    }
+    if (url.pathname === '/jobs/') {
+        for (const kind of ['province', 'category']) {
+            if (url.searchParams.get(kind)) {
+                return { kind, slug: url.searchParams.get(kind) };
+            }
+        }
+    }
+    return null;
+}
+
+function escapeHtml(value) {
+    return String(value ?? '').replace(/[&<>"']/g, char => ({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;',
+    })[char]);
+}
+
+async function snapshotPage(kind, slug) {
+    const cache = await caches.open(SNAPSHOT_CACHE);
+    const prefix = `/snapshots/${kind}/${slug}.`;
+    const request = (await cache.keys()).find(
+        request => new URL(request.url).pathname.startsWith(prefix)
+    );
+    if (!request) {
+        return null;
+    }
+
+    const { jobs } = await (await cache.match(request)).json();
+    const cards = jobs.map(job => `
+        <a href="/jobs/${escapeHtml(job.id)}/" class="job-card">
+            <div class="job-card-info">
+                <h3 class="job-card-title">${escapeHtml(job.title)}</h3>
+                <p class="job-card-company">${escapeHtml(job.company.name)}</p>
+            </div>
+            <div class="job-card-tags">
+                <span class="tag tag-salary">💰 ${escapeHtml(job.salary_display)}</span>
+                <span class="tag tag-type">${escapeHtml(job.job_type_display)}</span>
+            </div>
+        </a>`).join('');
+    const css = PRECACHE_MANIFEST.filter(url => url.endsWith('.css'))
+        .map(url => `<link rel="stylesheet" href="${url}">`).join('');
+
+    return new Response(`<!DOCTYPE html>
+<html lang="lo"><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>ວຽກ (ອອບລາຍ) - ຫາວຽກລາວ</title>${css}</head>
+<body><div class="container py-8">
+<p>📴 ອອບລາຍ: ສະແດງວຽກທີ່ບັນທຶກໄວ້ ${jobs.length} ຕຳແໜ່ງ</p>
+<div class="job-list">${cards || '<p>ບໍ່ມີວຽກ</p>'}</div>
+</div></body></html>`, { headers: { 'Content-Type': 'text/html; charset=utf-8' } });
+}
+
 // Background sync for saved jobs
 self.addEventListener('sync', event => {
     if (event.tag === 'sync-saved-jobs') {